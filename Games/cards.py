@@ -0,0 +1,81 @@
+# cards.py
+"""
+Card dealing primitives shared by the card games.
+
+deal() draws k cards without replacement from a deck in O(k) using a partial
+Fisher-Yates draw, so a hand never copies or shuffles the whole deck.
+Shoe models a multi-deck shoe with a cut card that persists across hands
+within a table session, as in casino blackjack.
+"""
+from typing import List, Optional, Sequence
+
+from Games import rng
+
+DEFAULT_PENETRATION = 0.75 # Share of the shoe dealt before the cut card comes out
+
+
+def deal(deck: Sequence[str], k: int) -> List[str]:
+    """Deals k cards in order from a fresh deck; the deck itself is not modified."""
+    return rng.sample(deck, k)
+
+
+class Shoe:
+    """A shoe of one or more decks that is reshuffled once the cut card is reached.
+
+    Dealt cards are removed with swap-and-pop, so each card costs O(1). The cut
+    card is only checked between hands: a hand in progress is always finished
+    from the current shoe.
+    """
+
+    def __init__(self, deck: Sequence[str], num_decks: int = 6,
+                 penetration: float = DEFAULT_PENETRATION):
+        if num_decks < 1:
+            raise ValueError("A shoe needs at least one deck.")
+        if not 0 < penetration <= 1:
+            raise ValueError("Penetration must be in (0, 1].")
+        self._full = list(deck) * num_decks
+        self.cut_card = int(len(self._full) * penetration)
+        self._remaining: List[str] = []
+        self.shuffles = 0
+        self.reshuffle()
+
+    def reshuffle(self) -> None:
+        """Returns every card to the shoe."""
+        self._remaining = self._full[:]
+        self.shuffles += 1
+
+    @property
+    def dealt(self) -> int:
+        return len(self._full) - len(self._remaining)
+
+    @property
+    def remaining(self) -> int:
+        return len(self._remaining)
+
+    @property
+    def cut_card_reached(self) -> bool:
+        return self.dealt >= self.cut_card
+
+    def draw(self, k: int) -> List[str]:
+        """Draws k cards from the shoe in deal order."""
+        if k > len(self._remaining):
+            raise ValueError("Not enough cards left in the shoe.")
+        drawn = []
+        for _ in range(k):
+            j = rng.randbelow(len(self._remaining))
+            self._remaining[j], self._remaining[-1] = self._remaining[-1], self._remaining[j]
+            drawn.append(self._remaining.pop())
+        return drawn
+
+    def deal_hand(self, k: int) -> List[str]:
+        """Starts a new hand: reshuffles if the cut card came out, then draws k cards."""
+        if self.cut_card_reached or k > len(self._remaining):
+            self.reshuffle()
+        return self.draw(k)
+
+
+def draw_cards(deck: Sequence[str], k: int, shoe: Optional[Shoe] = None) -> List[str]:
+    """Deals a k-card hand from the shoe when one is in play, otherwise from a fresh deck."""
+    if shoe is not None:
+        return shoe.deal_hand(k)
+    return deal(deck, k)
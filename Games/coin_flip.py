@@ -1,6 +1,7 @@
 # coin_flip_game.py
-import secrets
 import decimal
+from Games import money
+from Games.outcomes import compile_table
 from typing import Dict, Union
 
 # Game Constants based on RTP = 96.00%
@@ -8,12 +9,21 @@ GAME_NAME = "Coin Flip"
 WIN_PAYOUT_RATE = decimal.Decimal('1.92') # Total return on win per unit bet
 CHOICES = ['Heads', 'Tails']
 
-def play_coin_flip(bet_amount: decimal.Decimal, choice: str) -> Dict[str, Union[str, decimal.Decimal]]:
+# Outcome table per choice, indexed by the coin side drawn (position in CHOICES)
+TABLES = {
+    choice: compile_table(CHOICES, lambda outcome, choice=choice: (
+        WIN_PAYOUT_RATE if outcome == choice else decimal.Decimal('0'),
+        {'outcome': outcome},
+    ))
+    for choice in CHOICES
+}
+
+def play_coin_flip(bet_amount: money.Amount, choice: str) -> Dict[str, Union[str, decimal.Decimal]]:
     """
     Simulates a Coin Flip game round.
 
     Args:
-        bet_amount: The amount wagered (as Decimal).
+        bet_amount: The amount wagered (as Decimal or Money).
         choice: The player's choice ('Heads' or 'Tails').
 
     Returns:
@@ -21,28 +31,21 @@ def play_coin_flip(bet_amount: decimal.Decimal, choice: str) -> Dict[str, Union[
     """
     if choice not in CHOICES:
         raise ValueError(f"Choice must be one of {CHOICES}")
-    if not isinstance(bet_amount, decimal.Decimal) or bet_amount <= 0:
-        raise ValueError("Bet amount must be a positive Decimal.")
+    bet = money.to_money(bet_amount)
 
-    outcome = secrets.choice(CHOICES)
+    outcome = TABLES[choice].draw()
 
-    if outcome == choice:
-        # Player wins
-        winnings = bet_amount * WIN_PAYOUT_RATE
-        net_win_loss = winnings - bet_amount
-    else:
-        # Player loses
-        winnings = decimal.Decimal('0')
-        net_win_loss = -bet_amount
+    winnings = bet.times_rate_cents(outcome.rate_cents)
+    net_win_loss = winnings - bet
 
     return {
         'game': GAME_NAME,
         'choice': choice,
-        'outcome': outcome,
+        **outcome.result,
         'bet': bet_amount,
         'payout_rate_on_win': WIN_PAYOUT_RATE,
-        'winnings': winnings.quantize(decimal.Decimal('0.00')), # Currency precision
-        'net_win_loss': net_win_loss.quantize(decimal.Decimal('0.00'))
+        'winnings': money.like(bet_amount, winnings), # Currency precision
+        'net_win_loss': money.like(bet_amount, net_win_loss)
     }
 
 # Example usage:
@@ -1,7 +1,9 @@
 # high_low_card_game.py
-import secrets
+from Games.cards import Shoe, draw_cards
 import decimal
-from typing import Dict, Union
+from Games import money
+from Games.outcomes import compile_table
+from typing import Dict, Union, Optional
 
 # Game Constants based on RTP ~ 96%
 GAME_NAME = "High/Low Card (Simplified)"
@@ -14,62 +16,67 @@ RANKS = [str(r) for r in range(2, 11)] + ['J', 'Q', 'K', 'A'] # All card ranks
 RANK_VALUES = {str(r): r for r in range(2, 11)}
 RANK_VALUES.update({'J': 11, 'Q': 12, 'K': 13, 'A': 13}) # Changed Ace value from 14 to 13
 
+DECK = [rank for rank in RANKS for _ in range(4)] # 4 suits
+
 LOW_THRESHOLD = 7 # Low range: 2-7
 HIGH_THRESHOLD = 8 # High range: 8-A
 
-def get_random_card() -> Dict[str, Union[str, int]]:
-    """Selects a random card rank."""
+def _settle(choice: str, rank: str):
+    value = RANK_VALUES[rank]
+    if choice == 'Low' and value <= LOW_THRESHOLD:
+        payout_rate = LOW_PAYOUT_RATE
+    elif choice == 'High' and value >= HIGH_THRESHOLD:
+        payout_rate = HIGH_PAYOUT_RATE
+    else:
+        payout_rate = decimal.Decimal('0')
+    return payout_rate, {'outcome_card_rank': rank, 'outcome_card_value': value}
+
+# Outcome table per choice, indexed by position in a fresh DECK
+TABLES = {
+    choice: compile_table(DECK, lambda rank, choice=choice: _settle(choice, rank))
+    for choice in CHOICES
+}
+_RANK_INDEX = {rank: DECK.index(rank) for rank in RANKS} # Any position holding the rank
+
+def get_random_card(shoe: Optional[Shoe] = None) -> Dict[str, Union[str, int]]:
+    """Deals one card from the shoe, or from a fresh deck if no shoe is in play."""
     # Only rank matters in this version
-    rank = secrets.choice(RANKS)
+    rank = draw_cards(DECK, 1, shoe)[0]
     value = RANK_VALUES[rank]
     return {'rank': rank, 'value': value}
 
-def play_high_low_card(bet_amount: decimal.Decimal, choice: str) -> Dict[str, Union[str, int, decimal.Decimal]]:
+def play_high_low_card(bet_amount: money.Amount, choice: str,
+                       shoe: Optional[Shoe] = None) -> Dict[str, Union[str, int, decimal.Decimal]]:
     """
     Simulates a High/Low card game round.
 
     Args:
-        bet_amount: The amount wagered (as Decimal).
+        bet_amount: The amount wagered (as Decimal or Money).
         choice: The player's choice ('Low' or 'High').
+        shoe: Optional table shoe to deal from instead of a fresh deck.
 
     Returns:
         A dictionary containing the result.
     """
     if choice not in CHOICES:
         raise ValueError(f"Choice must be one of {CHOICES}")
-    if not isinstance(bet_amount, decimal.Decimal) or bet_amount <= 0:
-        raise ValueError("Bet amount must be a positive Decimal.")
-
-    card = get_random_card()
-    outcome_rank = card['rank']
-    outcome_value = card['value']
-
-    is_win = False
-    payout_rate = decimal.Decimal('0')
+    bet = money.to_money(bet_amount)
 
-    if choice == 'Low' and outcome_value <= LOW_THRESHOLD:
-        is_win = True
-        payout_rate = LOW_PAYOUT_RATE
-    elif choice == 'High' and outcome_value >= HIGH_THRESHOLD:
-        is_win = True
-        payout_rate = HIGH_PAYOUT_RATE
+    # The card may come from a shoe, so look the outcome up by rank
+    card = get_random_card(shoe=shoe)
+    outcome = TABLES[choice][_RANK_INDEX[card['rank']]]
 
-    if is_win:
-        winnings = bet_amount * payout_rate
-        net_win_loss = winnings - bet_amount
-    else:
-        winnings = decimal.Decimal('0')
-        net_win_loss = -bet_amount
+    winnings = bet.times_rate_cents(outcome.rate_cents)
+    net_win_loss = winnings - bet
 
     return {
         'game': GAME_NAME,
         'choice': choice,
-        'outcome_card_rank': outcome_rank,
-        'outcome_card_value': outcome_value,
+        **outcome.result,
         'bet': bet_amount,
-        'payout_rate_on_win': payout_rate if is_win else decimal.Decimal('0'),
-        'winnings': winnings.quantize(decimal.Decimal('0.00')),
-        'net_win_loss': net_win_loss.quantize(decimal.Decimal('0.00'))
+        'payout_rate_on_win': outcome.payout_rate,
+        'winnings': money.like(bet_amount, winnings),
+        'net_win_loss': money.like(bet_amount, net_win_loss)
     }
 
 # Example usage:
@@ -0,0 +1,168 @@
+# money.py
+"""
+Fixed-point money kernel for the game hot paths.
+
+Money holds an integer number of cents. Adding, subtracting and comparing are
+plain int operations, and multiplying by a payout rate is done in integers with
+an explicit rounding rule, so a round costs no Decimal context work. Decimal is
+only used at the edges: Money.from_decimal() when a request is parsed and
+to_decimal() when a response or DB row is built.
+
+Rounding rules:
+* from_decimal() is strict: amounts must be whole cents, anything finer is rejected.
+* Multiplying by a rate rounds half to even to the nearest cent, which is what
+  Decimal.quantize(Decimal('0.00')) did in the default context.
+"""
+import decimal
+from functools import lru_cache, total_ordering
+from typing import Tuple, Union
+
+CENTS_PER_UNIT = 100
+RATE_SCALE = 100 # Tabulated payout rates are stored in hundredths (cents per unit bet)
+
+Number = Union[int, decimal.Decimal]
+
+
+@lru_cache(maxsize=256)
+def _rate_ratio(rate: decimal.Decimal) -> Tuple[int, int]:
+    """Returns a payout rate as an exact (numerator, denominator) pair."""
+    return rate.as_integer_ratio()
+
+
+def _round_half_even(numerator: int, denominator: int) -> int:
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+def rate_to_cents(rate: decimal.Decimal) -> int:
+    """Converts a payout rate to integer hundredths; rates finer than 0.01 are rejected."""
+    scaled = rate * RATE_SCALE
+    if not rate.is_finite() or scaled != scaled.to_integral_value():
+        raise ValueError(f"Payout rate {rate} must be a whole number of hundredths.")
+    return int(scaled)
+
+
+@total_ordering
+class Money:
+    """An immutable amount of money stored as integer cents."""
+
+    __slots__ = ('cents',)
+
+    def __init__(self, cents: int = 0):
+        if not isinstance(cents, int):
+            raise TypeError("Money is built from integer cents; use Money.from_decimal() for Decimals.")
+        object.__setattr__(self, 'cents', cents)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Money is immutable.")
+
+    @classmethod
+    def from_decimal(cls, amount: decimal.Decimal) -> 'Money':
+        """Parses a Decimal amount; it must be finite and a whole number of cents."""
+        if not isinstance(amount, decimal.Decimal) or not amount.is_finite():
+            raise ValueError("Amount must be a finite Decimal.")
+        cents = amount * CENTS_PER_UNIT
+        if cents != cents.to_integral_value():
+            raise ValueError("Amount must be a whole number of cents.")
+        return cls(int(cents))
+
+    @classmethod
+    def coerce(cls, amount: Union['Money', decimal.Decimal]) -> 'Money':
+        """Returns amount as Money, converting from Decimal if needed."""
+        if isinstance(amount, Money):
+            return amount
+        return cls.from_decimal(amount)
+
+    def to_decimal(self) -> decimal.Decimal:
+        return decimal.Decimal(self.cents).scaleb(-2)
+
+    def __mul__(self, rate: Number) -> 'Money':
+        """Multiplies by a payout rate, rounding half to even to the cent."""
+        if isinstance(rate, int):
+            return Money(self.cents * rate)
+        if isinstance(rate, decimal.Decimal):
+            numerator, denominator = _rate_ratio(rate)
+            return Money(_round_half_even(self.cents * numerator, denominator))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def times_rate_cents(self, rate_cents: int) -> 'Money':
+        """Multiplies by a payout rate given in hundredths (see rate_to_cents)."""
+        return Money(_round_half_even(self.cents * rate_cents, RATE_SCALE))
+
+    def __add__(self, other: 'Money') -> 'Money':
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.cents + other.cents)
+
+    def __sub__(self, other: 'Money') -> 'Money':
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.cents - other.cents)
+
+    def __neg__(self) -> 'Money':
+        return Money(-self.cents)
+
+    def __abs__(self) -> 'Money':
+        return Money(abs(self.cents))
+
+    def __bool__(self) -> bool:
+        return self.cents != 0
+
+    def _compare_key(self, other):
+        # Compares by value, so Money(150) == Decimal('1.50') and Money(0) < 1
+        if isinstance(other, Money):
+            return self.cents, other.cents
+        if isinstance(other, (int, decimal.Decimal)):
+            return self.cents, other * CENTS_PER_UNIT
+        return None
+
+    def __eq__(self, other) -> bool:
+        keys = self._compare_key(other)
+        if keys is None:
+            return NotImplemented
+        return keys[0] == keys[1]
+
+    def __lt__(self, other) -> bool:
+        keys = self._compare_key(other)
+        if keys is None:
+            return NotImplemented
+        return keys[0] < keys[1]
+
+    def __hash__(self) -> int:
+        return hash(self.to_decimal())
+
+    def __str__(self) -> str:
+        return str(self.to_decimal())
+
+    def __repr__(self) -> str:
+        return f"Money('{self.to_decimal()}')"
+
+
+ZERO = Money(0)
+
+Amount = Union[Money, decimal.Decimal]
+
+
+def to_money(bet_amount: Amount) -> Money:
+    """Validates a game bet (positive Money or whole-cent Decimal) and returns it as Money."""
+    if isinstance(bet_amount, Money):
+        bet = bet_amount
+    elif isinstance(bet_amount, decimal.Decimal) and bet_amount.is_finite():
+        bet = Money.from_decimal(bet_amount)
+    else:
+        raise ValueError("Bet amount must be a positive Decimal.")
+    if bet.cents <= 0:
+        raise ValueError("Bet amount must be a positive Decimal.")
+    return bet
+
+
+def like(template: Amount, amount: Money) -> Amount:
+    """Returns amount in the same type as template, so Decimal callers get Decimals back."""
+    if isinstance(template, Money):
+        return amount
+    return amount.to_decimal()
@@ -1,6 +1,7 @@
 # number_guess_game.py
-import secrets
 import decimal
+from Games import money
+from Games.outcomes import compile_table
 from typing import Dict, Union
 
 # Game Constants based on RTP = 95.00%
@@ -9,12 +10,21 @@ WIN_PAYOUT_RATE = decimal.Decimal('9.5') # Total return on win per unit bet
 MIN_NUMBER = 1
 MAX_NUMBER = 10
 
-def play_number_guess(bet_amount: decimal.Decimal, chosen_number: int) -> Dict[str, Union[str, int, decimal.Decimal]]:
+# Outcome table per guess, indexed by the secret number minus MIN_NUMBER
+TABLES = {
+    chosen: compile_table(range(MIN_NUMBER, MAX_NUMBER + 1), lambda secret, chosen=chosen: (
+        WIN_PAYOUT_RATE if secret == chosen else decimal.Decimal('0'),
+        {'secret_number': secret},
+    ))
+    for chosen in range(MIN_NUMBER, MAX_NUMBER + 1)
+}
+
+def play_number_guess(bet_amount: money.Amount, chosen_number: int) -> Dict[str, Union[str, int, decimal.Decimal]]:
     """
     Simulates a Number Guess game round (1-10).
 
     Args:
-        bet_amount: The amount wagered (as Decimal).
+        bet_amount: The amount wagered (as Decimal or Money).
         chosen_number: The number the player bet on (1-10).
 
     Returns:
@@ -22,30 +32,22 @@ def play_number_guess(bet_amount: decimal.Decimal, chosen_number: int) -> Dict[s
     """
     if not isinstance(chosen_number, int) or not MIN_NUMBER <= chosen_number <= MAX_NUMBER:
         raise ValueError(f"Chosen number must be an integer between {MIN_NUMBER} and {MAX_NUMBER}.")
-    if not isinstance(bet_amount, decimal.Decimal) or bet_amount <= 0:
-        raise ValueError("Bet amount must be a positive Decimal.")
+    bet = money.to_money(bet_amount)
 
-    # Generate random secret number
-    range_size = MAX_NUMBER - MIN_NUMBER + 1
-    secret_number = MIN_NUMBER + secrets.randbelow(range_size)
+    # Draw the secret number
+    outcome = TABLES[chosen_number].draw()
 
-    if secret_number == chosen_number:
-        # Player wins
-        winnings = bet_amount * WIN_PAYOUT_RATE
-        net_win_loss = winnings - bet_amount
-    else:
-        # Player loses
-        winnings = decimal.Decimal('0')
-        net_win_loss = -bet_amount
+    winnings = bet.times_rate_cents(outcome.rate_cents)
+    net_win_loss = winnings - bet
 
     return {
         'game': GAME_NAME,
         'choice': chosen_number,
-        'secret_number': secret_number,
+        **outcome.result,
         'bet': bet_amount,
         'payout_rate_on_win': WIN_PAYOUT_RATE,
-        'winnings': winnings.quantize(decimal.Decimal('0.00')),
-        'net_win_loss': net_win_loss.quantize(decimal.Decimal('0.00'))
+        'winnings': money.like(bet_amount, winnings),
+        'net_win_loss': money.like(bet_amount, net_win_loss)
     }
 
 # Example usage:
@@ -0,0 +1,91 @@
+# outcomes.py
+"""
+Precomputed outcome tables for the Games/* modules.
+
+Each game compiles its rules once at import time into a flat table indexed by
+the raw RNG integer. Entry i holds the payout rate in hundredths (see
+money.rate_to_cents) and an interned record of the result fields the game
+reports for that draw. A round is then one bounded random draw plus one index,
+and the batch paths (simulate, rtp) read the same tables instead of
+re-deriving each game's rules.
+"""
+import decimal
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, NamedTuple, Tuple
+
+from Games import money
+from Games import rng
+
+Classifier = Callable[[Any], Tuple[decimal.Decimal, Dict[str, Hashable]]]
+
+
+class Outcome(NamedTuple):
+    """One precomputed result: payout rate and the fields reported for it."""
+    rate_cents: int
+    payout_rate: decimal.Decimal
+    result: Mapping[str, Hashable]
+
+
+class OutcomeTable:
+    """A flat, read-only table of outcomes drawn uniformly by index."""
+
+    __slots__ = ('outcomes', 'size')
+
+    def __init__(self, outcomes: Iterable[Outcome]):
+        self.outcomes = tuple(outcomes)
+        self.size = len(self.outcomes)
+        if not self.size:
+            raise ValueError("An outcome table needs at least one entry.")
+
+    def draw(self) -> Outcome:
+        """Plays one round: a single bounded draw from the RNG pool."""
+        return self.outcomes[rng.randbelow(self.size)]
+
+    def __getitem__(self, index: int) -> Outcome:
+        return self.outcomes[index]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        return iter(self.outcomes)
+
+    def __repr__(self) -> str:
+        # Payouts only: this is what paytable fingerprints need to see change
+        return f"OutcomeTable({[outcome.rate_cents for outcome in self.outcomes]})"
+
+
+def _compile(keys: Iterable[Any], classify: Classifier) -> List[Outcome]:
+    interned: Dict[Tuple, Outcome] = {}
+    compiled = []
+    for key in keys:
+        payout_rate, result = classify(key)
+        record_key = (payout_rate, tuple(result.items()))
+        outcome = interned.get(record_key)
+        if outcome is None:
+            outcome = interned[record_key] = Outcome(
+                money.rate_to_cents(payout_rate), payout_rate, MappingProxyType(dict(result))
+            )
+        compiled.append(outcome)
+    return compiled
+
+
+def compile_table(keys: Iterable[Any], classify: Classifier) -> OutcomeTable:
+    """Builds a table whose i-th entry is classify(i-th key); equal records are shared."""
+    return OutcomeTable(_compile(keys, classify))
+
+
+def compile_mapping(keys: Iterable[Hashable], classify: Classifier) -> Dict[Hashable, Outcome]:
+    """Like compile_table, for outcomes keyed by something other than a single draw."""
+    keys = list(keys)
+    return dict(zip(keys, _compile(keys, classify)))
+
+
+def table_for(module: ModuleType, choice: Any = None) -> OutcomeTable:
+    """Returns a game module's outcome table, picking the player's choice from TABLES if it has one."""
+    tables = getattr(module, 'TABLES', None)
+    if tables is None:
+        return module.TABLE
+    if choice not in tables:
+        raise ValueError(f"Choice must be one of {list(tables)}")
+    return tables[choice]
@@ -1,6 +1,8 @@
 # simple_slot_game.py
-import secrets
 import decimal
+from Games import money
+from Games.outcomes import OutcomeTable, compile_table
+from itertools import product
 from typing import Dict, Union, Tuple
 
 # Game Constants based on RTP = 96.30%
@@ -15,37 +17,40 @@ PAYTABLE = {
     ('B', 'B', 'B'): decimal.Decimal('13'),
 }
 
-def spin_reels(num_reels: int, symbols: list) -> Tuple[str, ...]:
-    """Generates random symbols for each reel."""
-    # Equal probability for each symbol
-    return tuple(secrets.choice(symbols) for _ in range(num_reels))
+def build_table() -> OutcomeTable:
+    """Compiles PAYTABLE into an outcome table indexed by the reel stops read as a base-len(SYMBOLS) number."""
+    return compile_table(product(SYMBOLS, repeat=NUM_REELS), lambda combination: (
+        PAYTABLE.get(combination, decimal.Decimal('0')), # Payout or 0 if not a winning combo
+        {'combination': combination},
+    ))
 
-def play_simple_slot(bet_amount: decimal.Decimal) -> Dict[str, Union[str, Tuple[str,...], decimal.Decimal]]:
+TABLE = build_table()
+
+def play_simple_slot(bet_amount: money.Amount) -> Dict[str, Union[str, Tuple[str,...], decimal.Decimal]]:
     """
     Simulates one spin of the simple 3-reel slot machine.
 
     Args:
-        bet_amount: The amount wagered per spin (as Decimal).
+        bet_amount: The amount wagered per spin (as Decimal or Money).
 
     Returns:
         A dictionary containing the result.
     """
-    if not isinstance(bet_amount, decimal.Decimal) or bet_amount <= 0:
-        raise ValueError("Bet amount must be a positive Decimal.")
+    bet = money.to_money(bet_amount)
 
-    combination = spin_reels(NUM_REELS, SYMBOLS)
-    payout_rate = PAYTABLE.get(combination, decimal.Decimal('0')) # Get payout or 0 if not a winning combo
+    # One draw picks all reel stops at once
+    outcome = TABLE.draw()
 
-    winnings = bet_amount * payout_rate
-    net_win_loss = winnings - bet_amount
+    winnings = bet.times_rate_cents(outcome.rate_cents)
+    net_win_loss = winnings - bet
 
     return {
         'game': GAME_NAME,
-        'combination': combination,
+        **outcome.result,
         'bet': bet_amount,
-        'payout_rate_on_win': payout_rate,
-        'winnings': winnings.quantize(decimal.Decimal('0.00')),
-        'net_win_loss': net_win_loss.quantize(decimal.Decimal('0.00'))
+        'payout_rate_on_win': outcome.payout_rate,
+        'winnings': money.like(bet_amount, winnings),
+        'net_win_loss': money.like(bet_amount, net_win_loss)
     }
 
 # Example usage:
@@ -1,6 +1,7 @@
 # rock_paper_scissors_game.py
-import secrets
 import decimal
+from Games import money
+from Games.outcomes import compile_table
 from typing import Dict, Union
 
 # Game Constants based on RTP = 97.00%
@@ -17,12 +18,29 @@ WIN_CONDITIONS = {
     'Scissors': 'Paper'
 }
 
-def play_rock_paper_scissors(bet_amount: decimal.Decimal, player_choice: str) -> Dict[str, Union[str, decimal.Decimal]]:
+def _settle(player_choice: str, house_choice: str):
+    if player_choice == house_choice:
+        # Push (Tie)
+        return PUSH_PAYOUT_RATE, {'house_choice': house_choice, 'result_status': "Push"}
+    elif WIN_CONDITIONS[player_choice] == house_choice:
+        # Player Wins
+        return WIN_PAYOUT_RATE, {'house_choice': house_choice, 'result_status': "Win"}
+    # Player Loses
+    return LOSS_PAYOUT_RATE, {'house_choice': house_choice, 'result_status': "Loss"}
+
+# Outcome table per player choice, indexed by the house choice (position in CHOICES)
+TABLES = {
+    player_choice: compile_table(CHOICES, lambda house_choice, player_choice=player_choice:
+                                 _settle(player_choice, house_choice))
+    for player_choice in CHOICES
+}
+
+def play_rock_paper_scissors(bet_amount: money.Amount, player_choice: str) -> Dict[str, Union[str, decimal.Decimal]]:
     """
     Simulates a Rock Paper Scissors game round against the house.
 
     Args:
-        bet_amount: The amount wagered (as Decimal).
+        bet_amount: The amount wagered (as Decimal or Money).
         player_choice: The player's choice ('Rock', 'Paper', or 'Scissors').
 
     Returns:
@@ -30,43 +48,23 @@ def play_rock_paper_scissors(bet_amount: decimal.Decimal, player_choice: str) ->
     """
     if player_choice not in CHOICES:
         raise ValueError(f"Player choice must be one of {CHOICES}")
-    if not isinstance(bet_amount, decimal.Decimal) or bet_amount <= 0:
-        raise ValueError("Bet amount must be a positive Decimal.")
-
-    house_choice = secrets.choice(CHOICES)
+    bet = money.to_money(bet_amount)
 
-    if player_choice == house_choice:
-        # Push (Tie)
-        result_status = "Push"
-        payout_rate = PUSH_PAYOUT_RATE
-    elif WIN_CONDITIONS[player_choice] == house_choice:
-        # Player Wins
-        result_status = "Win"
-        payout_rate = WIN_PAYOUT_RATE
-    else:
-        # Player Loses
-        result_status = "Loss"
-        payout_rate = LOSS_PAYOUT_RATE
+    outcome = TABLES[player_choice].draw()
 
-    winnings = bet_amount * payout_rate
-    # Net win/loss calculation needs care with Push payout of 1
-    if result_status == "Push":
-        net_win_loss = decimal.Decimal('0')
-    elif result_status == "Win":
-        net_win_loss = winnings - bet_amount
-    else: # Loss
-        net_win_loss = -bet_amount
+    winnings = bet.times_rate_cents(outcome.rate_cents)
+    # Push returns the stake (net 0), a loss pays nothing (net -bet)
+    net_win_loss = winnings - bet
 
 
     return {
         'game': GAME_NAME,
         'player_choice': player_choice,
-        'house_choice': house_choice,
-        'result_status': result_status,
+        **outcome.result,
         'bet': bet_amount,
-        'payout_rate': payout_rate, # The actual payout rate applied
-        'winnings': winnings.quantize(decimal.Decimal('0.00')),
-        'net_win_loss': net_win_loss.quantize(decimal.Decimal('0.00'))
+        'payout_rate': outcome.payout_rate, # The actual payout rate applied
+        'winnings': money.like(bet_amount, winnings),
+        'net_win_loss': money.like(bet_amount, net_win_loss)
     }
 
 # Example usage:
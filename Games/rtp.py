@@ -0,0 +1,152 @@
+# rtp.py
+"""
+Exact RTP / variance calculator for the Games/* modules.
+
+Each game's finite outcome space is read from its precomputed outcome table
+(see Games/outcomes.py) as (probability, payout rate) pairs using Fractions, so
+the figures quoted in the game modules can be verified exactly instead of
+estimated by Monte Carlo. Results are cached per game and choice, keyed by a
+hash of the game module's constants (outcome tables included), so they are
+recomputed only when a paytable actually changes.
+"""
+import hashlib
+import math
+from fractions import Fraction
+from itertools import product
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from . import coin_flip
+from . import dice_roll
+from . import high_low_card
+from . import number_guess
+from . import reel_slot
+from . import rock_paper_scissors
+from . import scratch_card_simulator
+from . import simple_roulette
+from . import simplified_blackjack
+from . import wheel_of_fortune
+from .outcomes import table_for
+
+Choice = Optional[Union[str, int]]
+OutcomeSpace = List[Tuple[Fraction, Fraction]] # (probability, payout rate per unit bet)
+
+
+def _table_game(module: ModuleType) -> Callable[[Choice], OutcomeSpace]:
+    """Reads a game's precomputed outcome table: each entry is equally likely."""
+    def outcome_space(choice: Choice) -> OutcomeSpace:
+        table = table_for(module, choice)
+        probability = Fraction(1, len(table))
+        return [(probability, Fraction(outcome.payout_rate)) for outcome in table]
+    return outcome_space
+
+
+def _simplified_blackjack(choice: Choice) -> OutcomeSpace:
+    """Walks the full deal tree of four cards from a fresh 52-card deck.
+
+    Cards with the same blackjack value are interchangeable, so the tree is walked
+    over value groups and each ordered deal is weighted by the number of card
+    sequences it stands for. Every leaf is scored with the game's own HAND_VALUES
+    and SETTLEMENT lookup tables.
+    """
+    groups: Dict[int, List[str]] = {}
+    for rank in simplified_blackjack.DECK:
+        groups.setdefault(simplified_blackjack.CARD_VALUES[rank], []).append(rank)
+    representatives = {value: ranks[0] for value, ranks in groups.items()}
+    counts = {value: len(ranks) for value, ranks in groups.items()}
+    deck_size = len(simplified_blackjack.DECK)
+    total_sequences = deck_size * (deck_size - 1) * (deck_size - 2) * (deck_size - 3)
+
+    outcomes: Dict[Fraction, int] = {}
+    for deal in product(counts, repeat=4):
+        remaining = dict(counts)
+        sequences = 1
+        for value in deal:
+            sequences *= remaining[value]
+            remaining[value] -= 1
+        if not sequences:
+            continue
+        # Dealt in order: player, player, dealer, dealer
+        player, dealer = ([representatives[value] for value in deal[i:i + 2]] for i in (0, 2))
+        outcome = simplified_blackjack.SETTLEMENT[
+            simplified_blackjack.HAND_VALUES[player[0], player[1]],
+            simplified_blackjack.HAND_VALUES[dealer[0], dealer[1]],
+        ]
+        rate = Fraction(outcome.payout_rate)
+        outcomes[rate] = outcomes.get(rate, 0) + sequences
+
+    return [(Fraction(sequences, total_sequences), rate) for rate, sequences in sorted(outcomes.items())]
+
+
+GAMES: Dict[str, Tuple[ModuleType, Callable[[Choice], OutcomeSpace], List[Choice]]] = {
+    'coin_flip': (coin_flip, _table_game(coin_flip), list(coin_flip.TABLES)),
+    'dice_roll': (dice_roll, _table_game(dice_roll), list(dice_roll.TABLES)),
+    'high_low_card': (high_low_card, _table_game(high_low_card), list(high_low_card.TABLES)),
+    'number_guess': (number_guess, _table_game(number_guess), list(number_guess.TABLES)),
+    'reel_slot': (reel_slot, _table_game(reel_slot), [None]),
+    'rock_paper_scissors': (rock_paper_scissors, _table_game(rock_paper_scissors), list(rock_paper_scissors.TABLES)),
+    'scratch_card_simulator': (scratch_card_simulator, _table_game(scratch_card_simulator), [None]),
+    'simple_roulette': (simple_roulette, _table_game(simple_roulette), list(simple_roulette.TABLES)),
+    'simplified_blackjack': (simplified_blackjack, _simplified_blackjack, [None]),
+    'wheel_of_fortune': (wheel_of_fortune, _table_game(wheel_of_fortune), [None]),
+}
+
+_cache: Dict[Tuple[str, Choice, str], Dict[str, Union[Fraction, float]]] = {}
+
+
+def paytable_fingerprint(module: ModuleType) -> str:
+    """Hashes a game module's upper-case constants (paytables, rates, decks)."""
+    constants = sorted((name, repr(value)) for name, value in vars(module).items() if name.isupper())
+    return hashlib.sha256(repr(constants).encode('utf-8')).hexdigest()
+
+
+def analyze(game: str, choice: Choice = None) -> Dict[str, Union[Fraction, float]]:
+    """
+    Computes exact return statistics for one game and choice.
+
+    Args:
+        game: Game module name, one of GAMES.
+        choice: The player's choice for games that take one.
+
+    Returns:
+        A dictionary with rtp, variance, hit_frequency and max_exposure (largest
+        payout per unit bet) as Fractions, and volatility (standard deviation per
+        unit bet) as a float.
+    """
+    if game not in GAMES:
+        raise ValueError(f"Game must be one of {sorted(GAMES)}")
+    module, outcome_space, _ = GAMES[game]
+
+    key = (game, choice, paytable_fingerprint(module))
+    if key in _cache:
+        return _cache[key]
+
+    outcomes = outcome_space(choice)
+    if sum(probability for probability, _ in outcomes) != 1:
+        raise ValueError(f"Outcome probabilities for {game} must sum to 1.")
+
+    rtp = sum(probability * rate for probability, rate in outcomes)
+    variance = sum(probability * (rate - rtp) ** 2 for probability, rate in outcomes)
+    result = {
+        'rtp': rtp,
+        'variance': variance,
+        'volatility': math.sqrt(variance),
+        'hit_frequency': sum(probability for probability, rate in outcomes if rate > 0),
+        'max_exposure': max(rate for _, rate in outcomes),
+    }
+    _cache[key] = result
+    return result
+
+
+def report() -> Dict[str, Dict[Choice, Dict[str, Union[Fraction, float]]]]:
+    """Analyzes every game for each of its choices."""
+    return {game: {choice: analyze(game, choice) for choice in choices}
+            for game, (_, _, choices) in GAMES.items()}
+
+# Example usage:
+if __name__ == "__main__":
+    for game, by_choice in report().items():
+        for choice, stats in by_choice.items():
+            label = game if choice is None else f"{game} ({choice})"
+            print(f"{label:<36} RTP: {float(stats['rtp']):.4%}  Volatility: {stats['volatility']:.4f}  "
+                  f"Max exposure: {stats['max_exposure']}x")
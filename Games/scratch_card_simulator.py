@@ -1,7 +1,7 @@
 # scratch_card_game.py
-import secrets
-import random
 import decimal
+from Games import money
+from Games.outcomes import compile_table
 from typing import Dict, Union, List
 
 # Game Constants based on RTP = 96.00%
@@ -20,7 +20,7 @@ PRIZE_DISTRIBUTION = {
     decimal.Decimal('20'): 0.005,   # Win 19x
 }
 
-# Prepare lists for random.choices()
+# Prepare lists for weighted selection
 PAYOUT_RATES = list(PRIZE_DISTRIBUTION.keys())
 PROBABILITIES = list(PRIZE_DISTRIBUTION.values())
 
@@ -28,7 +28,22 @@ PROBABILITIES = list(PRIZE_DISTRIBUTION.values())
 if not abs(sum(PROBABILITIES) - 1.0) < 1e-9:
      raise ValueError("Probabilities in PRIZE_DISTRIBUTION must sum to 1.")
 
-def play_scratch_card(bet_amount: decimal.Decimal = CARD_COST) -> Dict[str, Union[str, decimal.Decimal]]:
+# Integer weights for the rng: probabilities scaled by their common decimal denominator
+_PROBABILITY_PLACES = max(-decimal.Decimal(str(p)).as_tuple().exponent for p in PROBABILITIES)
+PRIZE_WEIGHTS = [int(decimal.Decimal(str(p)).scaleb(_PROBABILITY_PLACES)) for p in PROBABILITIES]
+
+# Outcome table with one entry per unit of weight (1000 cards), so a uniform
+# draw over it follows PRIZE_DISTRIBUTION
+TABLE = compile_table(
+    (rate for rate, weight in zip(PAYOUT_RATES, PRIZE_WEIGHTS) for _ in range(weight)),
+    lambda rate: (rate, {'revealed_payout_rate': rate}),
+)
+
+def reveal_payout_rate() -> decimal.Decimal:
+    """Reveals a prize payout rate according to PRIZE_DISTRIBUTION."""
+    return TABLE.draw().payout_rate
+
+def play_scratch_card(bet_amount: money.Amount = CARD_COST) -> Dict[str, Union[str, decimal.Decimal]]:
     """
     Simulates revealing a scratch card outcome based on weighted probabilities.
 
@@ -42,23 +57,20 @@ def play_scratch_card(bet_amount: decimal.Decimal = CARD_COST) -> Dict[str, Unio
         # In this simple model, bet_amount is fixed by card cost
         # A more complex version might allow different card values
         raise ValueError(f"Bet amount must be equal to CARD_COST ({CARD_COST})")
-    if not isinstance(bet_amount, decimal.Decimal) or bet_amount <= 0:
-        raise ValueError("Bet amount must be a positive Decimal.")
+    bet = money.to_money(bet_amount)
 
 
-    # random.choices returns a list, get the first element
-    # Weights are automatically used by the function
-    chosen_payout_rate = random.choices(PAYOUT_RATES, weights=PROBABILITIES, k=1)[0]
+    outcome = TABLE.draw()
 
-    winnings = bet_amount * chosen_payout_rate # Winnings based on card cost * prize multiplier
-    net_win_loss = winnings - bet_amount
+    winnings = bet.times_rate_cents(outcome.rate_cents) # Winnings based on card cost * prize multiplier
+    net_win_loss = winnings - bet
 
     return {
         'game': GAME_NAME,
         'bet': bet_amount, # Cost of the card
-        'revealed_payout_rate': chosen_payout_rate,
-        'winnings': winnings.quantize(decimal.Decimal('0.00')),
-        'net_win_loss': net_win_loss.quantize(decimal.Decimal('0.00'))
+        **outcome.result,
+        'winnings': money.like(bet_amount, winnings),
+        'net_win_loss': money.like(bet_amount, net_win_loss)
     }
 
 # Example usage:
@@ -1,6 +1,8 @@
 # simple_roulette_game.py
-import secrets
+from Games import rng
 import decimal
+from Games import money
+from Games.outcomes import compile_table
 from typing import Dict, Union, List
 
 # Game Constants based on RTP = 97.30% for Red/Black
@@ -15,26 +17,39 @@ RED_NUMBERS = set(range(1, 19)) # Example Red numbers
 BLACK_NUMBERS = set(range(19, 37)) # Example Black numbers
 GREEN_NUMBER = 0
 
+def pocket_color(number: int) -> str:
+    """Returns the color of a pocket on the wheel."""
+    if number == GREEN_NUMBER:
+        return 'Green'
+    elif number in RED_NUMBERS:
+        return 'Red'
+    elif number in BLACK_NUMBERS:
+        return 'Black'
+    # Should not happen with standard 0-36 wheel
+    return 'Unknown'
+
+POCKET_COLORS = [pocket_color(number) for number in range(SLOTS)]
+
+# Outcome table per bet color, indexed by pocket number
+TABLES = {
+    choice: compile_table(range(SLOTS), lambda number, choice=choice: (
+        WIN_PAYOUT_RATE if POCKET_COLORS[number] == choice else decimal.Decimal('0'),
+        {'outcome_number': number, 'outcome_color': POCKET_COLORS[number]},
+    ))
+    for choice in CHOICES
+}
+
 def get_slot_outcome() -> Dict[str, Union[int, str]]:
     """ Determines the winning number and color."""
-    winning_number = secrets.randbelow(SLOTS) # Generates 0-36
-    if winning_number == GREEN_NUMBER:
-        color = 'Green'
-    elif winning_number in RED_NUMBERS:
-        color = 'Red'
-    elif winning_number in BLACK_NUMBERS:
-        color = 'Black'
-    else:
-        # Should not happen with standard 0-36 wheel
-        color = 'Unknown'
-    return {'number': winning_number, 'color': color}
+    winning_number = rng.randbelow(SLOTS) # Generates 0-36
+    return {'number': winning_number, 'color': POCKET_COLORS[winning_number]}
 
-def play_simple_roulette_redblack(bet_amount: decimal.Decimal, choice: str) -> Dict[str, Union[str, int, decimal.Decimal]]:
+def play_simple_roulette_redblack(bet_amount: money.Amount, choice: str) -> Dict[str, Union[str, int, decimal.Decimal]]:
     """
     Simulates a Roulette round betting on Red or Black.
 
     Args:
-        bet_amount: The amount wagered (as Decimal).
+        bet_amount: The amount wagered (as Decimal or Money).
         choice: The player's choice ('Red' or 'Black').
 
     Returns:
@@ -42,31 +57,22 @@ def play_simple_roulette_redblack(bet_amount: decimal.Decimal, choice: str) -> D
     """
     if choice not in CHOICES:
         raise ValueError(f"Choice must be one of {CHOICES}")
-    if not isinstance(bet_amount, decimal.Decimal) or bet_amount <= 0:
-        raise ValueError("Bet amount must be a positive Decimal.")
+    bet = money.to_money(bet_amount)
 
-    outcome_details = get_slot_outcome()
-    outcome_color = outcome_details['color']
-    winning_number = outcome_details['number']
+    # Spin the wheel; Green loses for both colors
+    outcome = TABLES[choice].draw()
 
-    if outcome_color == choice:
-        # Win
-        winnings = bet_amount * WIN_PAYOUT_RATE
-        net_win_loss = winnings - bet_amount
-    else:
-        # Loss (includes Green)
-        winnings = decimal.Decimal('0')
-        net_win_loss = -bet_amount
+    winnings = bet.times_rate_cents(outcome.rate_cents)
+    net_win_loss = winnings - bet
 
     return {
         'game': GAME_NAME,
         'choice': choice,
-        'outcome_number': winning_number,
-        'outcome_color': outcome_color,
+        **outcome.result,
         'bet': bet_amount,
         'payout_rate_on_win': WIN_PAYOUT_RATE,
-        'winnings': winnings.quantize(decimal.Decimal('0.00')),
-        'net_win_loss': net_win_loss.quantize(decimal.Decimal('0.00'))
+        'winnings': money.like(bet_amount, winnings),
+        'net_win_loss': money.like(bet_amount, net_win_loss)
     }
 
 # Example usage:
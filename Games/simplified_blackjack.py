@@ -1,9 +1,11 @@
 # simplified_blackjack_game.py
-import secrets
+from Games.cards import Shoe, draw_cards
 import decimal
-from typing import Dict, Union, List, Tuple
+from Games import money
+from Games.outcomes import compile_mapping
+from typing import Dict, Union, List, Tuple, Optional
 
-# Game Constants based on approximate RTP ~ 97.3%
+# Game Constants: exact RTP = 100.00% (symmetric deal, see Games/rtp.py)
 GAME_NAME = "Simplified Blackjack"
 WIN_PAYOUT_RATE = decimal.Decimal('2.00')  # Pays 1:1 (Net Win) for regular win AND Blackjack
 PUSH_PAYOUT_RATE = decimal.Decimal('1.00') # Stake returned on tie
@@ -23,43 +25,11 @@ def calculate_hand_value(hand: List[str]) -> int:
         num_aces -= 1
     return value
 
-def play_simplified_blackjack(
-    bet_amount: decimal.Decimal,
-    custom_deck: List[str] = None
-) -> Dict[str, Union[str, List[str], int, decimal.Decimal]]:
-
-    """
-    Simulates a VERY simplified Blackjack hand focusing on payout rules.
-    NOTE: This does NOT implement player/dealer strategy (Hit/Stand decisions).
-          It deals initial hands and determines immediate win/loss/push based on those.
-          Real Blackjack simulation is much more complex.
-
-    Args:
-        bet_amount: The amount wagered (as Decimal).
-
-    Returns:
-        A dictionary containing the result.
-    """
-    if not isinstance(bet_amount, decimal.Decimal) or bet_amount <= 0:
-        raise ValueError("Bet amount must be a positive Decimal.")
-
-    # --- Deal Initial Hands ---
-    # Simplified dealing - does not affect probabilities much for single hand vs fresh deck
-    if custom_deck is not None:
-        current_deck = custom_deck[:]  # Использовать кастомную колоду
-    else:
-        current_deck = DECK[:]
-        secrets.SystemRandom().shuffle(current_deck)
-
-    player_hand = [current_deck.pop(), current_deck.pop()]
-    dealer_hand = [current_deck.pop(), current_deck.pop()]
-
-    player_value = calculate_hand_value(player_hand)
-    dealer_value = calculate_hand_value(dealer_hand)
-
+def settle_initial_hands(player_value: int, dealer_value: int):
+    """Decides a round from the two-card hand values (both hands have exactly two cards)."""
     # --- Determine Immediate Outcomes (No Hit/Stand Logic Here) ---
-    player_has_blackjack = (player_value == 21 and len(player_hand) == 2)
-    dealer_has_blackjack = (dealer_value == 21 and len(dealer_hand) == 2)
+    player_has_blackjack = player_value == 21
+    dealer_has_blackjack = dealer_value == 21
 
     result_status = "Undetermined (Needs Hit/Stand)" # Default if no immediate outcome
     payout_rate = LOSS_PAYOUT_RATE # Default
@@ -92,15 +62,57 @@ def play_simplified_blackjack(
          result_status = "Push (Simplified comparison)"
          payout_rate = PUSH_PAYOUT_RATE
 
+    return payout_rate, {'result_status': result_status}
+
+# Lookup tables: hands come from a deck or shoe, so instead of one table indexed by
+# a single draw the round is keyed by card ranks and then by the two hand values
+HAND_VALUES = {(first, second): calculate_hand_value([first, second])
+               for first in CARD_VALUES for second in CARD_VALUES}
+SETTLEMENT = compile_mapping(
+    [(player, dealer) for player in sorted(set(HAND_VALUES.values()))
+     for dealer in sorted(set(HAND_VALUES.values()))],
+    lambda values: settle_initial_hands(*values),
+)
+
+def play_simplified_blackjack(
+    bet_amount: money.Amount,
+    custom_deck: List[str] = None,
+    shoe: Optional[Shoe] = None
+) -> Dict[str, Union[str, List[str], int, decimal.Decimal]]:
+
+    """
+    Simulates a VERY simplified Blackjack hand focusing on payout rules.
+    NOTE: This does NOT implement player/dealer strategy (Hit/Stand decisions).
+          It deals initial hands and determines immediate win/loss/push based on those.
+          Real Blackjack simulation is much more complex.
+
+    Args:
+        bet_amount: The amount wagered (as Decimal or Money).
+        custom_deck: Optional fixed deck; cards are dealt from its end.
+        shoe: Optional table shoe to deal from instead of a fresh deck.
+
+    Returns:
+        A dictionary containing the result.
+    """
+    bet = money.to_money(bet_amount)
+
+    # --- Deal Initial Hands ---
+    if custom_deck is not None:
+        current_deck = custom_deck[:]  # Использовать кастомную колоду
+        player_hand = [current_deck.pop(), current_deck.pop()]
+        dealer_hand = [current_deck.pop(), current_deck.pop()]
+    else:
+        # Only four cards are needed, so draw them directly instead of shuffling the deck
+        cards = draw_cards(DECK, 4, shoe)
+        player_hand, dealer_hand = cards[:2], cards[2:]
+
+    player_value = HAND_VALUES[player_hand[0], player_hand[1]]
+    dealer_value = HAND_VALUES[dealer_hand[0], dealer_hand[1]]
+    outcome = SETTLEMENT[player_value, dealer_value]
 
-    winnings = bet_amount * payout_rate
-    # Net win/loss calculation needs care with Push payout of 1
-    if payout_rate == PUSH_PAYOUT_RATE:
-        net_win_loss = decimal.Decimal('0')
-    elif payout_rate == WIN_PAYOUT_RATE:
-        net_win_loss = winnings - bet_amount
-    else: # Loss
-        net_win_loss = -bet_amount
+    winnings = bet.times_rate_cents(outcome.rate_cents)
+    # Push returns the stake (net 0), a loss pays nothing (net -bet)
+    net_win_loss = winnings - bet
 
 
     return {
@@ -109,11 +121,11 @@ def play_simplified_blackjack(
         'dealer_hand': dealer_hand,
         'player_value': player_value,
         'dealer_value': dealer_value,
-        'result_status': result_status,
+        **outcome.result,
         'bet': bet_amount,
-        'payout_rate': payout_rate, # The actual payout rate applied
-        'winnings': winnings.quantize(decimal.Decimal('0.00')),
-        'net_win_loss': net_win_loss.quantize(decimal.Decimal('0.00'))
+        'payout_rate': outcome.payout_rate, # The actual payout rate applied
+        'winnings': money.like(bet_amount, winnings),
+        'net_win_loss': money.like(bet_amount, net_win_loss)
     }
 
 # Example usage:
@@ -0,0 +1,189 @@
+# simulate.py
+"""
+Batch simulation engine for the Games/* modules.
+
+Each game is reduced to the entries of its precomputed outcome table (see
+Games/outcomes.py): reel combinations, roulette pockets, wheel segments, ...
+Rounds are drawn in bulk with NumPy as arrays of table indices, and all
+aggregates are computed from per-entry counts and integer-cent payouts, so
+millions of rounds take seconds instead of hours.
+
+Payouts per entry are computed once with the same money kernel the play_*
+functions use (bet * payout rate, rounded to cents), so simulated results match
+what a real round would pay.
+"""
+import decimal
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from . import coin_flip
+from . import dice_roll
+from . import high_low_card
+from . import money
+from . import number_guess
+from . import reel_slot
+from . import rock_paper_scissors
+from . import scratch_card_simulator
+from . import simple_roulette
+from . import simplified_blackjack
+from . import wheel_of_fortune
+from .outcomes import table_for
+
+CENTS = decimal.Decimal('0.01')
+CHUNK_SIZE = 1_000_000 # Rounds drawn per NumPy batch, bounds peak memory
+
+Choice = Optional[Union[str, int]]
+
+
+def _uniform(num_classes: int) -> Callable[[np.random.Generator, int], np.ndarray]:
+    """Draws outcome classes with equal probability."""
+    return lambda rng, size: rng.integers(0, num_classes, size=size)
+
+
+# --- Per-game outcome spaces ---
+# Each builder validates the choice and returns (payout rate in hundredths per class, draw function).
+
+def _table_game(module: ModuleType):
+    """Uses a game's precomputed outcome table: one class per entry, drawn uniformly."""
+    def build(choice: Choice):
+        table = table_for(module, choice)
+        return [outcome.rate_cents for outcome in table], _uniform(len(table))
+    return build
+
+
+def _deal_without_replacement(rng: np.random.Generator, size: int, deck_size: int, k: int) -> np.ndarray:
+    """Draws k distinct deck positions per row, in deal order."""
+    picks = np.empty((size, k), dtype=np.int64)
+    for j in range(k):
+        index = rng.integers(0, deck_size - j, size=size)
+        # Skip over positions already dealt: walking them in ascending order maps
+        # the j-th draw onto the index-th remaining card.
+        for taken in np.sort(picks[:, :j], axis=1).T:
+            index += index >= taken
+        picks[:, j] = index
+    return picks
+
+
+def _simplified_blackjack(choice: Choice):
+    # Blackjack's lookup tables are keyed by ranks and hand values rather than by one
+    # draw, so they are turned into NumPy arrays and indexed with the dealt cards.
+    rank_index = {rank: i for i, rank in enumerate(simplified_blackjack.CARD_VALUES)}
+    deck = np.array([rank_index[rank] for rank in simplified_blackjack.DECK], dtype=np.int64)
+    hand_values = np.zeros((len(rank_index), len(rank_index)), dtype=np.int64)
+    for (first, second), value in simplified_blackjack.HAND_VALUES.items():
+        hand_values[rank_index[first], rank_index[second]] = value
+
+    rates = sorted({outcome.rate_cents for outcome in simplified_blackjack.SETTLEMENT.values()})
+    max_value = int(hand_values.max()) + 1
+    classes = np.zeros((max_value, max_value), dtype=np.int64)
+    for (player, dealer), outcome in simplified_blackjack.SETTLEMENT.items():
+        classes[player, dealer] = rates.index(outcome.rate_cents)
+
+    def draw(rng: np.random.Generator, size: int) -> np.ndarray:
+        # play_simplified_blackjack deals four distinct cards from a fresh deck in order:
+        # player, player, dealer, dealer.
+        cards = deck[_deal_without_replacement(rng, size, len(deck), 4)]
+        player = hand_values[cards[:, 0], cards[:, 1]]
+        dealer = hand_values[cards[:, 2], cards[:, 3]]
+        return classes[player, dealer]
+
+    return rates, draw
+
+
+GAMES: Dict[str, Callable[[Choice], Tuple[List[int], Callable]]] = {
+    'coin_flip': _table_game(coin_flip),
+    'dice_roll': _table_game(dice_roll),
+    'high_low_card': _table_game(high_low_card),
+    'number_guess': _table_game(number_guess),
+    'reel_slot': _table_game(reel_slot),
+    'rock_paper_scissors': _table_game(rock_paper_scissors),
+    'scratch_card_simulator': _table_game(scratch_card_simulator),
+    'simple_roulette': _table_game(simple_roulette),
+    'simplified_blackjack': _simplified_blackjack,
+    'wheel_of_fortune': _table_game(wheel_of_fortune),
+}
+
+
+def simulate(
+    game: str,
+    n: int,
+    bet: decimal.Decimal = decimal.Decimal('1.00'),
+    choice: Choice = None,
+    seed: Optional[int] = None
+) -> Dict[str, Union[str, int, float, decimal.Decimal, Dict[decimal.Decimal, int]]]:
+    """
+    Simulates n rounds of a game at a fixed bet and choice.
+
+    Args:
+        game: Game module name, one of GAMES.
+        n: Number of rounds to simulate.
+        bet: The amount wagered per round (as Decimal or Money).
+        choice: The player's choice for games that take one.
+        seed: Optional seed for a reproducible run.
+
+    Returns:
+        A dictionary with totals, RTP, variance and hit frequency per unit bet,
+        and a histogram of per-round winnings.
+    """
+    if game not in GAMES:
+        raise ValueError(f"Game must be one of {sorted(GAMES)}")
+    if not isinstance(n, int) or n <= 0:
+        raise ValueError("Number of rounds must be a positive integer.")
+    if game == 'scratch_card_simulator' and bet != scratch_card_simulator.CARD_COST:
+        raise ValueError(f"Bet amount must be equal to CARD_COST ({scratch_card_simulator.CARD_COST})")
+
+    rates, draw = GAMES[game](choice)
+    bet_money = money.to_money(bet)
+    payout_cents = [bet_money.times_rate_cents(rate_cents).cents for rate_cents in rates]
+    bet_cents = bet_money.cents
+
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(len(rates), dtype=np.int64)
+    remaining = n
+    while remaining:
+        size = min(remaining, CHUNK_SIZE)
+        counts += np.bincount(draw(rng, size), minlength=len(rates))
+        remaining -= size
+
+    # Aggregate in Python ints so large runs can't overflow
+    histogram_cents: Dict[int, int] = {}
+    for cents, count in zip(payout_cents, counts.tolist()):
+        if count:
+            histogram_cents[cents] = histogram_cents.get(cents, 0) + count
+    total_paid = sum(cents * count for cents, count in histogram_cents.items())
+    sum_squares = sum(cents * cents * count for cents, count in histogram_cents.items())
+    hits = sum(count for cents, count in histogram_cents.items() if cents > 0)
+    total_wagered = bet_cents * n
+
+    mean = total_paid / n
+    variance_cents = sum_squares / n - mean * mean
+
+    return {
+        'game': game,
+        'rounds': n,
+        'bet': bet,
+        'total_wagered': decimal.Decimal(total_wagered) * CENTS,
+        'total_paid': decimal.Decimal(total_paid) * CENTS,
+        'rtp': total_paid / total_wagered,
+        'variance': variance_cents / (bet_cents * bet_cents),
+        'hit_frequency': hits / n,
+        'payout_histogram': {decimal.Decimal(cents) * CENTS: count
+                             for cents, count in sorted(histogram_cents.items())},
+    }
+
+# Example usage:
+if __name__ == "__main__":
+    default_choices = {
+        'coin_flip': 'Heads',
+        'dice_roll': 3,
+        'high_low_card': 'High',
+        'number_guess': 7,
+        'rock_paper_scissors': 'Rock',
+        'simple_roulette': 'Red',
+    }
+    for name in GAMES:
+        result = simulate(name, 1_000_000, choice=default_choices.get(name))
+        print(f"{name:<24} RTP: {result['rtp']:.4%}  Variance: {result['variance']:.4f}  "
+              f"Hit frequency: {result['hit_frequency']:.4%}")
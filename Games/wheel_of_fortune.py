@@ -1,6 +1,7 @@
 # wheel_of_fortune_game.py
-import secrets
 import decimal
+from Games import money
+from Games.outcomes import compile_table
 from typing import Dict, Union
 
 # Game Constants based on RTP = 95.00%
@@ -25,32 +26,36 @@ SEGMENT_PAYOUTS = [
 if len(SEGMENT_PAYOUTS) != NUM_SEGMENTS:
     raise ValueError("Length of SEGMENT_PAYOUTS must match NUM_SEGMENTS")
 
-def play_wheel_of_fortune(bet_amount: decimal.Decimal) -> Dict[str, Union[str, int, decimal.Decimal]]:
+# Outcome table indexed by segment number
+TABLE = compile_table(range(NUM_SEGMENTS), lambda segment: (
+    SEGMENT_PAYOUTS[segment],
+    {'winning_segment': str(segment)},
+))
+
+def play_wheel_of_fortune(bet_amount: money.Amount) -> Dict[str, Union[str, int, decimal.Decimal]]:
     """
     Simulates a Simple Wheel of Fortune spin.
 
     Args:
-        bet_amount: The amount wagered (as Decimal).
+        bet_amount: The amount wagered (as Decimal or Money).
 
     Returns:
         A dictionary containing the result.
     """
-    if not isinstance(bet_amount, decimal.Decimal) or bet_amount <= 0:
-        raise ValueError("Bet amount must be a positive Decimal.")
+    bet = money.to_money(bet_amount)
 
-    winning_segment = secrets.randbelow(NUM_SEGMENTS) # Generates 0-9
-    payout_rate = SEGMENT_PAYOUTS[winning_segment]
+    outcome = TABLE.draw() # Segments 0-9
 
-    winnings = bet_amount * payout_rate
-    net_win_loss = winnings - bet_amount
+    winnings = bet.times_rate_cents(outcome.rate_cents)
+    net_win_loss = winnings - bet
 
     return {
         'game': GAME_NAME,
-        'winning_segment': str(winning_segment),
+        **outcome.result,
         'bet': bet_amount,
-        'payout_rate_on_win': payout_rate,
-        'winnings': winnings.quantize(decimal.Decimal('0.00')),
-        'net_win_loss': net_win_loss.quantize(decimal.Decimal('0.00'))
+        'payout_rate_on_win': outcome.payout_rate,
+        'winnings': money.like(bet_amount, winnings),
+        'net_win_loss': money.like(bet_amount, net_win_loss)
     }
 
 # Example usage:
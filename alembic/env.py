@@ -21,6 +21,10 @@ from app.models.base import Base
 from app.models.user import User
 from app.models.transaction import Transaction
 from app.models.game_session import GameSession
+from app.models.user_game_stats import UserGameStats, ArchivedGameStats
+from app.models.ledger_checkpoint import LedgerCheckpoint
+from app.models.idempotency_key import IdempotencyKey
+from app.models.revoked_token import RevokedToken
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
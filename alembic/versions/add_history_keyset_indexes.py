@@ -0,0 +1,54 @@
+"""Add (user_id, created_at, id) indexes for keyset history pagination
+
+Revision ID: add_history_keyset_indexes
+Revises: recreate_all_tables
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_history_keyset_indexes'
+down_revision: Union[str, None] = 'recreate_all_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+HISTORY_INDEXES = {
+    'ix_game_sessions_user_created_id': 'game_sessions',
+    'ix_transactions_user_created_id': 'transactions',
+}
+
+
+def _existing_indexes(table_name: str) -> set:
+    inspector = sa.inspect(op.get_bind())
+    return {index['name'] for index in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    """Create the history indexes if they don't exist, without locking writes on PostgreSQL."""
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+
+    for index_name, table_name in HISTORY_INDEXES.items():
+        if index_name in _existing_indexes(table_name):
+            print(f"Index {index_name} already exists, skipping...")
+            continue
+
+        columns = ['user_id', sa.text('created_at DESC'), sa.text('id DESC')]
+        if is_postgres:
+            # CREATE INDEX CONCURRENTLY can't run inside a transaction
+            with op.get_context().autocommit_block():
+                op.create_index(index_name, table_name, columns, postgresql_concurrently=True)
+        else:
+            op.create_index(index_name, table_name, columns)
+
+
+def downgrade() -> None:
+    """Drop the history indexes."""
+    for index_name, table_name in HISTORY_INDEXES.items():
+        if index_name in _existing_indexes(table_name):
+            op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,72 @@
+"""Add idempotency_keys and a per-user index on transactions.reference_id
+
+Revision ID: add_idempotency_keys
+Revises: add_ledger_checkpoints
+Create Date: 2026-10-17 19:00:00.000000
+
+The index makes (user_id, reference_id) unique, so a settlement tagged with
+an Idempotency-Key can't be written twice. A partitioned transactions table
+can only enforce uniqueness on columns that include created_at, so there the
+index is a plain one and the idempotency_keys claim is the only guard.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import text
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_idempotency_keys'
+down_revision: Union[str, None] = 'add_ledger_checkpoints'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _transactions_partitioned(connection) -> bool:
+    if connection.dialect.name != 'postgresql':
+        return False
+    return connection.execute(text(
+        "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = 'transactions'"
+    )).scalar() is not None
+
+
+def upgrade() -> None:
+    """Create idempotency_keys and ix_transactions_user_reference if they don't exist."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if inspector.has_table('idempotency_keys'):
+        print("Table idempotency_keys already exists, skipping...")
+    else:
+        op.create_table('idempotency_keys',
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('key', sa.String(length=100), nullable=False),
+            sa.Column('request_hash', sa.String(length=64), nullable=False),
+            sa.Column('status_code', sa.Integer(), nullable=True),
+            sa.Column('response_body', sa.LargeBinary(), nullable=True),
+            sa.Column('media_type', sa.String(length=100), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+            sa.PrimaryKeyConstraint('user_id', 'key')
+        )
+
+    existing = {index['name'] for index in inspector.get_indexes('transactions')}
+    if 'ix_transactions_user_reference' in existing:
+        print("Index ix_transactions_user_reference already exists, skipping...")
+        return
+
+    unique = not _transactions_partitioned(connection)
+    if not unique:
+        print("transactions is partitioned, creating ix_transactions_user_reference as a plain index...")
+    op.create_index('ix_transactions_user_reference', 'transactions', ['user_id', 'reference_id'], unique=unique)
+
+
+def downgrade() -> None:
+    """Drop ix_transactions_user_reference and idempotency_keys."""
+    inspector = sa.inspect(op.get_bind())
+    if 'ix_transactions_user_reference' in {index['name'] for index in inspector.get_indexes('transactions')}:
+        op.drop_index('ix_transactions_user_reference', table_name='transactions')
+    if inspector.has_table('idempotency_keys'):
+        op.drop_table('idempotency_keys')
@@ -0,0 +1,39 @@
+"""Add ledger_checkpoints for the write-behind ledger journal
+
+Revision ID: add_ledger_checkpoints
+Revises: partition_history_tables
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_ledger_checkpoints'
+down_revision: Union[str, None] = 'partition_history_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ledger_checkpoints if it doesn't exist."""
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table('ledger_checkpoints'):
+        print("Table ledger_checkpoints already exists, skipping...")
+        return
+
+    op.create_table('ledger_checkpoints',
+        sa.Column('journal', sa.String(length=255), nullable=False),
+        sa.Column('last_seq', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('journal')
+    )
+
+
+def downgrade() -> None:
+    """Drop ledger_checkpoints; replay any journals before downgrading."""
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table('ledger_checkpoints'):
+        op.drop_table('ledger_checkpoints')
@@ -0,0 +1,40 @@
+"""Add revoked_tokens so logouts reach every worker
+
+Revision ID: add_revoked_tokens
+Revises: add_idempotency_keys
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_revoked_tokens'
+down_revision: Union[str, None] = 'add_idempotency_keys'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create revoked_tokens if it doesn't exist."""
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table('revoked_tokens'):
+        print("Table revoked_tokens already exists, skipping...")
+        return
+
+    op.create_table('revoked_tokens',
+        sa.Column('digest', sa.String(length=64), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('digest')
+    )
+    op.create_index('ix_revoked_tokens_expires_at', 'revoked_tokens', ['expires_at'])
+
+
+def downgrade() -> None:
+    """Drop revoked_tokens."""
+    if sa.inspect(op.get_bind()).has_table('revoked_tokens'):
+        op.drop_index('ix_revoked_tokens_expires_at', table_name='revoked_tokens')
+        op.drop_table('revoked_tokens')
@@ -0,0 +1,62 @@
+"""Add user_game_stats rollup and backfill it from game_sessions
+
+Revision ID: add_user_game_stats
+Revises: add_history_keyset_indexes
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import text
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_user_game_stats'
+down_revision: Union[str, None] = 'add_history_keyset_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Per game type rows, then one '*' row per user summing every game type
+BACKFILL = """
+INSERT INTO user_game_stats (user_id, game_type, total_games, total_bet, total_won, net_result)
+SELECT user_id, game_type, COUNT(id), COALESCE(SUM(bet_amount), 0),
+       COALESCE(SUM(win_amount), 0), COALESCE(SUM(net_result), 0)
+FROM game_sessions GROUP BY user_id, game_type
+UNION ALL
+SELECT user_id, '*', COUNT(id), COALESCE(SUM(bet_amount), 0),
+       COALESCE(SUM(win_amount), 0), COALESCE(SUM(net_result), 0)
+FROM game_sessions GROUP BY user_id
+"""
+
+
+def upgrade() -> None:
+    """Create user_game_stats if it doesn't exist and fill it from existing game sessions."""
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table('user_game_stats'):
+        print("Table user_game_stats already exists, skipping...")
+        return
+
+    op.create_table('user_game_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('game_type', sa.String(length=50), nullable=False),
+        sa.Column('total_games', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_bet', sa.Numeric(precision=14, scale=2), nullable=False, server_default='0'),
+        sa.Column('total_won', sa.Numeric(precision=14, scale=2), nullable=False, server_default='0'),
+        sa.Column('net_result', sa.Numeric(precision=14, scale=2), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('user_id', 'game_type')
+    )
+    # Rounds settled by instances still on the previous release aren't counted:
+    # run scripts/game_stats.py rebuild once the rollout is done
+    op.execute(text(BACKFILL))
+
+
+def downgrade() -> None:
+    """Drop the rollup; it can always be rebuilt from game_sessions."""
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table('user_game_stats'):
+        op.drop_table('user_game_stats')
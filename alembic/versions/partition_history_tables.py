@@ -0,0 +1,153 @@
+"""Partition game_sessions and transactions by month
+
+Revision ID: partition_history_tables
+Revises: add_user_game_stats
+Create Date: 2026-10-17 16:00:00.000000
+
+PostgreSQL only; other databases keep plain tables. Each table is rebuilt as
+a RANGE (created_at) partitioned table with one partition per month from its
+oldest row up to PARTITION_MONTHS_AHEAD months from now, plus a default
+partition. Rows are copied inside the migration's transaction, which holds an
+exclusive lock on both tables for the duration, so run it in a maintenance
+window.
+
+Partitioned tables can only have unique constraints that include the
+partition key, so the primary keys become (id, created_at) and the foreign
+key from transactions.game_session_id to game_sessions is dropped.
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import text
+
+from app.partitions import PARTITION_MONTHS_AHEAD, add_months, create_partition_sql, month_start
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'partition_history_tables'
+down_revision: Union[str, None] = 'add_user_game_stats'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Dropped in this order, so transactions (which references game_sessions) goes first
+TABLES = ('transactions', 'game_sessions')
+
+INDEXES = {
+    'transactions': [
+        ('ix_transactions_id', 'id'),
+        ('ix_transactions_user_id', 'user_id'),
+        ('ix_transactions_user_created_id', 'user_id, created_at DESC, id DESC'),
+    ],
+    'game_sessions': [
+        ('ix_game_sessions_id', 'id'),
+        ('ix_game_sessions_user_id', 'user_id'),
+        ('ix_game_sessions_user_created_id', 'user_id, created_at DESC, id DESC'),
+    ],
+}
+
+
+def _create_indexes(connection, table: str, primary_key: str) -> None:
+    # Only once the old table (and its <table>_pkey) is gone, as index names are schema-wide
+    connection.execute(text(f'ALTER TABLE {table} ADD PRIMARY KEY ({primary_key})'))
+    for index_name, columns in INDEXES[table]:
+        connection.execute(text(f'CREATE INDEX {index_name} ON {table} ({columns})'))
+
+
+def _partition_table(connection, table: str) -> None:
+    print(f"Partitioning {table}...")
+    old = f'{table}_unpartitioned'
+    connection.execute(text(f'ALTER TABLE {table} RENAME TO {old}'))
+    connection.execute(text(f'UPDATE {old} SET created_at = now() WHERE created_at IS NULL'))
+    connection.execute(text(
+        f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        f'PARTITION BY RANGE (created_at)'
+    ))
+    connection.execute(text(f'ALTER TABLE {table} ALTER COLUMN created_at SET NOT NULL'))
+    connection.execute(text(f'ALTER TABLE {table} ADD FOREIGN KEY (user_id) REFERENCES users (id)'))
+
+    oldest = connection.execute(text(f'SELECT MIN(created_at) FROM {old}')).scalar()
+    current = month_start(datetime.now(timezone.utc).date())
+    month = month_start(oldest.astimezone(timezone.utc).date()) if oldest else current
+    while month <= add_months(current, PARTITION_MONTHS_AHEAD):
+        connection.execute(create_partition_sql(table, month))
+        month = add_months(month, 1)
+    connection.execute(text(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT'))
+
+    connection.execute(text(f'INSERT INTO {table} SELECT * FROM {old}'))
+    # The id sequence belongs to the old table; keep it alive for the new one
+    connection.execute(text(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id'))
+
+
+def _unpartition_table(connection, table: str) -> None:
+    print(f"Merging {table} partitions...")
+    old = f'{table}_partitioned'
+    connection.execute(text(f'ALTER TABLE {table} RENAME TO {old}'))
+    connection.execute(text(f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'))
+    connection.execute(text(f'ALTER TABLE {table} ALTER COLUMN created_at DROP NOT NULL'))
+    connection.execute(text(f'ALTER TABLE {table} ADD FOREIGN KEY (user_id) REFERENCES users (id)'))
+    connection.execute(text(f'INSERT INTO {table} SELECT * FROM {old}'))
+    connection.execute(text(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id'))
+
+
+def upgrade() -> None:
+    """Rebuild both history tables as monthly partitioned tables and add archived_game_stats."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if not inspector.has_table('archived_game_stats'):
+        op.create_table('archived_game_stats',
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('game_type', sa.String(length=50), nullable=False),
+            sa.Column('total_games', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('total_bet', sa.Numeric(precision=14, scale=2), nullable=False, server_default='0'),
+            sa.Column('total_won', sa.Numeric(precision=14, scale=2), nullable=False, server_default='0'),
+            sa.Column('net_result', sa.Numeric(precision=14, scale=2), nullable=False, server_default='0'),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+            sa.PrimaryKeyConstraint('user_id', 'game_type')
+        )
+
+    if connection.dialect.name != 'postgresql':
+        print("Table partitioning needs PostgreSQL, skipping...")
+        return
+
+    partitioned = connection.execute(text(
+        "SELECT c.relname FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid"
+    )).scalars().all()
+    pending = [table for table in TABLES if table not in partitioned]
+    if not pending:
+        print("History tables already partitioned, skipping...")
+        return
+
+    for table in pending:
+        _partition_table(connection, table)
+    for table in pending:
+        connection.execute(text(f'DROP TABLE {table}_unpartitioned'))
+        _create_indexes(connection, table, 'id, created_at')
+
+
+def downgrade() -> None:
+    """Merge the partitions back into plain tables. Archived months stay in their files."""
+    connection = op.get_bind()
+
+    if connection.dialect.name == 'postgresql':
+        partitioned = connection.execute(text(
+            "SELECT c.relname FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid"
+        )).scalars().all()
+        pending = [table for table in TABLES if table in partitioned]
+        for table in pending:
+            _unpartition_table(connection, table)
+        for table in pending:
+            connection.execute(text(f'DROP TABLE {table}_partitioned'))
+            _create_indexes(connection, table, 'id')
+        if 'transactions' in pending:
+            # NOT VALID: transactions may still point at sessions that were archived
+            connection.execute(text(
+                'ALTER TABLE transactions ADD FOREIGN KEY (game_session_id) REFERENCES game_sessions (id) NOT VALID'
+            ))
+
+    inspector = sa.inspect(connection)
+    if inspector.has_table('archived_game_stats'):
+        op.drop_table('archived_game_stats')
@@ -1,10 +1,18 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from .db import get_db
+from .db import get_db, get_async_db
 from .models.user import User
+from .models.revoked_token import RevokedToken
+from .principals import Principal, principal_cache
+from .schema_inspector import schema_capabilities
+from .services.fallback_user_service import FallbackUserService
+from .tokens import token_cache, token_digest
 import os
 
 # JWT Configuration
@@ -26,105 +34,181 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def verify_token(token: str):
-    """Verify JWT token and return payload"""
+def _invalid_credentials() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid authentication credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def _decode_token(token: str) -> dict:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: int = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        return user_id
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
+        raise _invalid_credentials()
+
+def _cached_subject(digest: bytes) -> Optional[str]:
+    if token_cache.is_revoked(digest):
+        raise _invalid_credentials()
+    return token_cache.get(digest)
+
+def _revocation_query(digest: bytes):
+    return select(RevokedToken.digest).where(RevokedToken.digest == digest.hex())
+
+def _trusted_subject(digest: bytes, payload: dict, revoked: bool) -> str:
+    """The subject of a freshly decoded token, cached unless the shared revocation list has it"""
+    if revoked:
+        token_cache.revoke(digest, payload.get("exp") or float("inf"))
+        raise _invalid_credentials()
+    user_id = payload.get("sub")
+    if user_id is None:
+        raise _invalid_credentials()
+    if payload.get("exp") is not None:
+        token_cache.put(digest, user_id, payload["exp"])
+    return user_id
+
+def verify_token(token: str, db: Optional[Session] = None):
+    """Verify JWT token and return its subject (the user id).
+
+    Tokens already verified are trusted from the cache; once they drop out
+    (at least every TOKEN_REVOCATION_RECHECK_SECONDS) they are checked
+    against revoked_tokens again, given a db session and a database that
+    has the table; without it revocations only hold in the worker that
+    made them.
+    """
+    digest = token_digest(token)
+    user_id = _cached_subject(digest)
+    if user_id is not None:
+        return user_id
+
+    payload = _decode_token(token)
+    revoked = (db is not None and schema_capabilities.has_revoked_tokens
+               and db.execute(_revocation_query(digest)).first() is not None)
+    return _trusted_subject(digest, payload, revoked)
+
+async def verify_token_async(token: str, db: AsyncSession):
+    """verify_token for the async request path"""
+    digest = token_digest(token)
+    user_id = _cached_subject(digest)
+    if user_id is not None:
+        return user_id
+
+    payload = _decode_token(token)
+    revoked = (schema_capabilities.has_revoked_tokens
+               and (await db.execute(_revocation_query(digest))).first() is not None)
+    return _trusted_subject(digest, payload, revoked)
+
+def revoke_token(token: str, db: Session) -> None:
+    """Reject a still-valid token from now on, in every worker (logout)"""
+    payload = _decode_token(token)
+    digest = token_digest(token)
+    exp = payload.get("exp")
+    expires_at = datetime.fromtimestamp(exp, timezone.utc) if exp is not None else datetime.max.replace(tzinfo=timezone.utc)
+    now = datetime.now(timezone.utc)
+
+    if schema_capabilities.has_revoked_tokens:
+        # Revocations of expired tokens are no longer needed
+        db.execute(delete(RevokedToken).where(RevokedToken.expires_at < now))
+        if db.get(RevokedToken, digest.hex()) is None:
+            db.add(RevokedToken(digest=digest.hex(), expires_at=expires_at))
+        db.commit()
+    token_cache.revoke(digest, exp or float("inf"))
+
+def _parse_user_id(user_id: str) -> int:
+    """The user id of a verified token's subject"""
+    try:
+        # Tokens carry the id as a string; asyncpg won't coerce it to an integer column
+        return int(user_id)
+    except (TypeError, ValueError):
+        raise _invalid_credentials()
+
+def _authentication_failed(e: Exception) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=f"Failed to authenticate user: {str(e)}",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def _require_active(principal: Optional[Principal]) -> Principal:
+    if principal is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
+            detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-def get_current_user(
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+
+    return principal
+
+# Only the columns a principal needs, so lookups work on databases missing newer columns too
+PRINCIPAL_QUERY = select(User.id, User.username, User.is_active)
+
+def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> User:
-    """Get current authenticated user"""
-    try:
-        user_id = verify_token(credentials.credentials)
-        
-        # Пробуем получить пользователя стандартным способом
+) -> Principal:
+    """Get the authenticated caller, from the principal cache when possible"""
+    user_id = _parse_user_id(verify_token(credentials.credentials, db))
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        generation = principal_cache.generation
         try:
-            user = db.query(User).filter(User.id == user_id).first()
-            
-            if user is None:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="User not found",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            
-            if not user.is_active:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Inactive user"
-                )
-            
-            return user
-            
+            row = db.execute(PRINCIPAL_QUERY.where(User.id == user_id)).first()
         except Exception as e:
-            # Если ошибка связана с отсутствующей колонкой
-            if "column users.is_verified does not exist" in str(e):
-                # Используем прямой SQL запрос без проблемных колонок
-                from sqlalchemy.sql import text
-                result = db.execute(
-                    text("SELECT id, username, email, hashed_password, balance, is_active, created_at, updated_at FROM users WHERE id = :id"),
-                    {"id": user_id}
-                )
-                user_data = result.fetchone()
-                
-                if user_data is None:
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="User not found",
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-                
-                # Проверяем активность пользователя
-                if not user_data.is_active:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Inactive user"
-                    )
-                
-                # Создаем объект пользователя из результата запроса
-                user = User()
-                user.id = user_data.id
-                user.username = user_data.username
-                user.email = user_data.email
-                user.hashed_password = user_data.hashed_password
-                user.balance = user_data.balance
-                user.is_active = user_data.is_active
-                user.created_at = user_data.created_at
-                user.updated_at = user_data.updated_at
-                
-                # Добавляем отсутствующие атрибуты
-                user.is_verified = False
-                user.last_login = None
-                
-                return user
-            else:
-                # Если ошибка не связана с отсутствующей колонкой
-                raise
-    except HTTPException:
-        raise
+            raise _authentication_failed(e)
+        if row is not None:
+            principal = principal_cache.put(row.id, row.username, row.is_active, generation)
+
+    return _require_active(principal)
+
+async def get_current_principal_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """Get the authenticated caller on the async request path"""
+    user_id = _parse_user_id(await verify_token_async(credentials.credentials, db))
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        generation = principal_cache.generation
+        try:
+            row = (await db.execute(PRINCIPAL_QUERY.where(User.id == user_id))).first()
+        except Exception as e:
+            raise _authentication_failed(e)
+        if row is not None:
+            principal = principal_cache.put(row.id, row.username, row.is_active, generation)
+
+    return _require_active(principal)
+
+def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+) -> User:
+    """Get the full row of the current authenticated user"""
+    try:
+        if schema_capabilities.legacy_users:
+            # Используем прямой SQL запрос без проблемных колонок
+            user = FallbackUserService(db).get_user_by_id(principal.id)
+        else:
+            user = db.query(User).filter(User.id == principal.id).first()
     except Exception as e:
+        raise _authentication_failed(e)
+
+    if user is None:
+        # Deleted after the principal was cached
+        principal_cache.invalidate(principal.id)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Failed to authenticate user: {str(e)}",
+            detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-def get_current_user_id(current_user: User = Depends(get_current_user)) -> int:
+    return user
+
+def get_current_user_id(principal: Principal = Depends(get_current_principal)) -> int:
     """Get current user ID (convenience function)"""
-    return current_user.id
+    return principal.id
@@ -1,19 +1,245 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine, URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from threading import Lock
+from typing import Any, Dict
 from .models.base import Base
+from .metrics import db_commit_seconds, db_pool_wait_seconds, metrics
+import logging
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./slotbazaar.db")
 
-engine = create_engine(DATABASE_URL, future=True)
+logger = logging.getLogger(__name__)
+
+# Connection pool
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))  # seconds to wait for a free connection
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds; -1 never recycles
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# PostgreSQL
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))  # 0 disables
+DB_PREPARED_STATEMENT_CACHE_SIZE = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "256"))  # asyncpg, per connection
+
+# SQLite
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+# Async drivers for the request path; the sync engine keeps its own driver
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Maps a sync database URL onto its async driver (aiosqlite / asyncpg)"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if parsed.drivername in ASYNC_DRIVERS.values():
+        return url
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+
+class PoolMetrics:
+    """Checkout counters for one engine's pool; wait time includes connecting when the pool grows"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._lock = Lock()
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def snapshot(self, pool) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+class _MeteredPool:
+    """Times every checkout so pool exhaustion shows up before requests start failing"""
+    metrics_label = "sync"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            waited = time.perf_counter() - start
+            self.metrics.record(waited, timed_out=True)
+            db_pool_wait_seconds.observe(waited, pool=self.metrics_label, outcome="timeout")
+            logger.warning(f"Connection pool exhausted: {self.status()}")
+            raise
+        waited = time.perf_counter() - start
+        self.metrics.record(waited)
+        db_pool_wait_seconds.observe(waited, pool=self.metrics_label, outcome="ok")
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep counting across it
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class MeteredQueuePool(_MeteredPool, QueuePool):
+    pass
+
+
+class MeteredAsyncAdaptedQueuePool(_MeteredPool, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+# Commit time as the app sees it, for sync and async sessions alike
+@event.listens_for(Session, "before_commit")
+def _commit_started(session):
+    session.info["commit_started"] = time.perf_counter()
+
+
+@event.listens_for(Session, "after_commit")
+def _commit_finished(session):
+    started = session.info.pop("commit_started", None)
+    if started is not None:
+        db_commit_seconds.observe(time.perf_counter() - started)
+
+
+def _is_file_sqlite(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def engine_options(url: str, is_async: bool = False) -> Dict[str, Any]:
+    """create_engine keyword arguments for url, from the settings above"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    options: Dict[str, Any] = {}
+    connect_args: Dict[str, Any] = {}
+
+    if backend == "postgresql" or _is_file_sqlite(parsed):
+        options.update(
+            poolclass=MeteredAsyncAdaptedQueuePool if is_async else MeteredQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=DB_POOL_PRE_PING,
+        )
+
+    if backend == "sqlite":
+        # Pooled connections move between threadpool workers
+        if not is_async:
+            connect_args["check_same_thread"] = False
+        connect_args["timeout"] = SQLITE_BUSY_TIMEOUT_MS / 1000
+    elif backend == "postgresql" and is_async:
+        # asyncpg prepares statements server-side and caches them per connection
+        connect_args["prepared_statement_cache_size"] = DB_PREPARED_STATEMENT_CACHE_SIZE
+        if DB_STATEMENT_TIMEOUT_MS > 0:
+            connect_args["server_settings"] = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+    elif backend == "postgresql" and parsed.get_driver_name() in ("psycopg2", "psycopg"):
+        if DB_STATEMENT_TIMEOUT_MS > 0:
+            connect_args["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def _apply_sqlite_pragmas(engine: Engine) -> None:
+    file_backed = _is_file_sqlite(engine.url)
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if file_backed:
+            cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+            cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.close()
+
+
+def create_db_engine(url: str = DATABASE_URL, **overrides) -> Engine:
+    """Sync engine tuned for url's backend (pool sizing, timeouts, SQLite pragmas)"""
+    engine = create_engine(url, **{**engine_options(url), **overrides})
+    if engine.url.get_backend_name() == "sqlite":
+        _apply_sqlite_pragmas(engine)
+    return engine
+
+
+def create_async_db_engine(url: str = ASYNC_DATABASE_URL, **overrides) -> AsyncEngine:
+    """Async counterpart of create_db_engine"""
+    engine = create_async_engine(url, **{**engine_options(url, is_async=True), **overrides})
+    if engine.url.get_backend_name() == "sqlite":
+        _apply_sqlite_pragmas(engine.sync_engine)
+    return engine
+
+
+engine = create_db_engine(DATABASE_URL)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
+async_engine = create_async_db_engine(ASYNC_DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+def pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """Checkout/wait metrics for the app's connection pools"""
+    pools = {"sync": engine.pool, "async": async_engine.sync_engine.pool}
+    return {name: pool.metrics.snapshot(pool) for name, pool in pools.items() if hasattr(pool, "metrics")}
+
+
+def _pool_gauge(field: str):
+    return lambda: [({"pool": name}, snapshot[field]) for name, snapshot in pool_metrics().items()]
+
+
+metrics.collected_gauge("slotbazaar_db_pool_size", "Connections the pool keeps", _pool_gauge("size"))
+metrics.collected_gauge("slotbazaar_db_pool_checked_out", "Connections in use", _pool_gauge("checked_out"))
+metrics.collected_gauge("slotbazaar_db_pool_overflow", "Connections opened beyond the pool size",
+                        _pool_gauge("overflow"))
+
 def get_db():
     """Dependency to get database session"""
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    """Dependency to get an async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,113 @@
+from fastapi import Request, Response
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+import brotli
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+FRONTEND_BUILD_DIR = Path(os.getenv("FRONTEND_BUILD_DIR", "slotbazaar-frontend/build"))
+
+# The build names assets by content hash (main.3f2a91c4.js), so a name never changes meaning
+HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# Images and fonts are compressed already
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+MIN_COMPRESS_SIZE = 1024
+
+# Preferred first
+ENCODERS = (
+    ("br", lambda body: brotli.compress(body, quality=11)),
+    ("gzip", lambda body: gzip.compress(body, compresslevel=9, mtime=0)),
+)
+
+
+class Asset(NamedTuple):
+    """A file held in memory with its precompressed encodings"""
+    body: bytes
+    media_type: str
+    etag: str  # Of the identity encoding, without quotes
+    cache_control: str
+    encoded: Dict[str, bytes]  # Content-Encoding -> body, only where it came out smaller
+
+
+def load_asset(path: Path, cache_control: str) -> Asset:
+    body = path.read_bytes()
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    encoded = {}
+    if media_type.startswith(COMPRESSIBLE_TYPES) and len(body) >= MIN_COMPRESS_SIZE:
+        for encoding, compress in ENCODERS:
+            packed = compress(body)
+            if len(packed) < len(body):
+                encoded[encoding] = packed
+    return Asset(body, media_type, hashlib.sha256(body).hexdigest()[:32], cache_control, encoded)
+
+
+def accepted_encodings(accept_encoding: str) -> set:
+    """Codings the client takes, ignoring ones refused with q=0"""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q=") and q[2:].strip() in ("0", "0.0", "0.00", "0.000"):
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as If-None-Match uses"""
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def asset_response(asset: Asset, request: Request) -> Response:
+    """The asset in the best encoding the client accepts, or a 304 if its copy is current.
+
+    Each encoding is its own representation, so it gets its own strong ETag.
+    """
+    accepted = accepted_encodings(request.headers.get("accept-encoding", ""))
+    encoding = next((name for name in asset.encoded if name in accepted), None)
+    etag = f'"{asset.etag}-{encoding}"' if encoding else f'"{asset.etag}"'
+    headers = {"ETag": etag, "Cache-Control": asset.cache_control, "Vary": "Accept-Encoding"}
+
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        return Response(asset.encoded[encoding], media_type=asset.media_type, headers=headers)
+    return Response(asset.body, media_type=asset.media_type, headers=headers)
+
+
+class StaticAssets:
+    """Every file of a directory loaded and precompressed up front, so serving never touches the disk"""
+
+    def __init__(self, directory: Path):
+        self.assets: Dict[str, Asset] = {}
+        if not directory.is_dir():
+            logger.warning(f"Static directory {directory} not found, serving no assets")
+            return
+        for path in sorted(directory.rglob("*")):
+            if path.is_file():
+                cache_control = IMMUTABLE if HASHED_NAME.search(path.name) else REVALIDATE
+                self.assets[path.relative_to(directory).as_posix()] = load_asset(path, cache_control)
+
+    def get(self, name: str) -> Optional[Asset]:
+        return self.assets.get(name)
+
+
+def load_index(build_dir: Path) -> Optional[Asset]:
+    """index.html, revalidated on every visit so a new build is picked up"""
+    path = build_dir / "index.html"
+    if not path.is_file():
+        logger.warning(f"{path} not found, the frontend will not be served")
+        return None
+    return load_asset(path, REVALIDATE)
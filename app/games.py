@@ -0,0 +1,125 @@
+from decimal import Decimal
+from pydantic import BaseModel
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Type, Union
+
+from .schemas import games as schemas
+from .services.game_service import GameRound
+from Games.money import Money
+from Games.coin_flip import play_coin_flip
+from Games.dice_roll import play_dice_roll_number
+from Games.high_low_card import play_high_low_card
+from Games.number_guess import play_number_guess
+from Games.reel_slot import play_simple_slot
+from Games.rock_paper_scissors import play_rock_paper_scissors
+from Games.scratch_card_simulator import play_scratch_card, CARD_COST
+from Games.simple_roulette import play_simple_roulette_redblack
+from Games.simplified_blackjack import play_simplified_blackjack
+from Games.wheel_of_fortune import play_wheel_of_fortune
+
+Choice = Optional[Union[int, str]]
+
+
+class GameDefinition(NamedTuple):
+    """Everything the generic play pipeline needs to know about one game.
+
+    engine plays a round for a bet and the player's choice and returns the
+    Games/* result dict; outcome_keys are the result fields stored as the
+    round's game_data. The response is built from the result fields named
+    like response_model's fields, unless project maps them first.
+    """
+    slug: str  # URL segment: /api/games/<slug>/...
+    game_type: str  # GameSession.game_type and stats key
+    title: str  # OpenAPI tag
+    engine: Callable[[Money, Choice], Dict[str, Any]]
+    outcome_keys: Tuple[str, ...]
+    request_model: Type[BaseModel]
+    response_model: Type[BaseModel]
+    choice_field: Optional[str] = None  # Request field holding the player's choice
+    bet_field: str = "bet_amount"
+    default_bet: Optional[Decimal] = None  # Played when the request leaves the bet out
+    path: str = "/play"
+    project: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+
+
+def _coin_flip_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "outcome": result["outcome"].lower(),
+        "result": "win" if result["winnings"] > 0 else "lose",
+        "bet_amount": result["bet"],
+        "winnings": result["winnings"],
+    }
+
+
+_GAMES = (
+    GameDefinition("coin", "coin_flip", "Coin Flip", play_coin_flip, ("outcome",),
+                   schemas.CoinFlipRequest, schemas.CoinFlipResponse, choice_field="choice", bet_field="bet",
+                   path="/", project=_coin_flip_response),
+    GameDefinition("dice", "dice_roll", "Dice Roll", play_dice_roll_number, ("outcome",),
+                   schemas.DiceRollRequest, schemas.DiceRollResponse, choice_field="number"),
+    GameDefinition("highlow", "high_low_card", "High Low Card", play_high_low_card,
+                   ("outcome_card_rank", "outcome_card_value"),
+                   schemas.HighLowCardRequest, schemas.HighLowCardResponse, choice_field="choice"),
+    GameDefinition("guess", "number_guess", "Number Guess", play_number_guess, ("secret_number",),
+                   schemas.NumberGuessRequest, schemas.NumberGuessResponse, choice_field="guess"),
+    GameDefinition("rps", "rock_paper_scissors", "Rock Paper Scissors", play_rock_paper_scissors,
+                   ("house_choice", "result_status"),
+                   schemas.RockPaperScissorsRequest, schemas.RockPaperScissorsResponse, choice_field="choice"),
+    GameDefinition("scratch", "scratch_card", "Scratch Card", lambda bet, choice: play_scratch_card(bet),
+                   ("revealed_payout_rate",),
+                   schemas.ScratchCardRequest, schemas.ScratchCardResponse, default_bet=CARD_COST),
+    GameDefinition("roulette", "roulette", "Roulette", play_simple_roulette_redblack,
+                   ("outcome_number", "outcome_color"),
+                   schemas.SimpleRouletteRequest, schemas.RouletteResponse, choice_field="choice"),
+    GameDefinition("blackjack", "blackjack", "Blackjack", lambda bet, choice: play_simplified_blackjack(bet),
+                   ("player_hand", "dealer_hand", "player_value", "dealer_value", "result_status"),
+                   schemas.SimplifiedBlackjackRequest, schemas.BlackjackResponse),
+    GameDefinition("wheel", "wheel_of_fortune", "Wheel of Fortune", lambda bet, choice: play_wheel_of_fortune(bet),
+                   ("winning_segment",),
+                   schemas.WheelOfFortuneRequest, schemas.WheelOfFortuneResponse),
+    GameDefinition("slot", "reel_slot", "Slot Machine", lambda bet, choice: play_simple_slot(bet), ("combination",),
+                   schemas.ReelSlotRequest, schemas.ReelSlotResponse),
+)
+
+# Keyed by URL segment
+GAMES: Dict[str, GameDefinition] = {game.slug: game for game in _GAMES}
+
+
+def _plain(value: Any) -> Any:
+    # Amounts are reported as Decimal
+    return value.to_decimal() if isinstance(value, Money) else value
+
+
+def request_bet(game: GameDefinition, request: Optional[BaseModel]) -> Money:
+    """The bet a play request places, falling back to the game's fixed stake"""
+    bet = getattr(request, game.bet_field, None) if request is not None else None
+    return Money.coerce(bet if bet is not None else game.default_bet)
+
+
+def request_choice(game: GameDefinition, request: Optional[BaseModel]) -> Choice:
+    return getattr(request, game.choice_field) if game.choice_field and request is not None else None
+
+
+def play_round(game: GameDefinition, bet: Money, choice: Choice) -> Tuple[Dict[str, Any], GameRound]:
+    """Plays one round with the game's engine.
+
+    Named choices are matched case-insensitively ('heads' plays 'Heads').
+    Returns the engine's result and the round ready to be settled. Its
+    game_data holds the player's choice (when the game takes one), the
+    outcome fields and whether the round won.
+    """
+    result = game.engine(bet, choice.capitalize() if isinstance(choice, str) else choice)
+    game_data = {"choice": choice} if choice is not None else {}
+    for key in game.outcome_keys:
+        game_data[key] = str(result[key]) if isinstance(result[key], Decimal) else result[key]
+    game_data["won"] = result["winnings"] > 0
+    return result, GameRound(bet=bet, winnings=result["winnings"], game_data=game_data)
+
+
+def round_response(game: GameDefinition, result: Dict[str, Any], balance: Decimal) -> Dict[str, Any]:
+    """Projects an engine result onto the fields of the game's response model, ready for dumps"""
+    fields = {**(game.project(result) if game.project else result), "new_balance": balance}
+    response = {}
+    for name, field in game.response_model.model_fields.items():
+        value = _plain(fields[name])
+        response[name] = float(value) if field.annotation is float else value
+    return response
@@ -0,0 +1,205 @@
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from sqlalchemy import delete, insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from typing import Callable, Optional
+import hashlib
+import os
+
+from .auth import verify_token
+from .db import get_db
+from .models.idempotency_key import IdempotencyKey
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+# Keys are stored as the settlement's Transaction.reference_id
+IDEMPOTENCY_KEY_MAX_LENGTH = 100
+# How long a completed response is replayed before the key may be used again
+IDEMPOTENCY_TTL_HOURS = int(os.getenv("IDEMPOTENCY_TTL_HOURS", "24"))
+# A claim older than this with no response is assumed abandoned (crashed worker) and taken over
+IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "30"))
+
+_current_key: ContextVar[Optional[str]] = ContextVar("idempotency_key", default=None)
+
+
+def current_idempotency_key() -> Optional[str]:
+    """Idempotency-Key of the request being handled, if it sent one"""
+    return _current_key.get()
+
+
+def request_hash(method: str, path: str, body: bytes) -> str:
+    """Fingerprint of a request, so a key reused for a different request is caught"""
+    digest = hashlib.sha256(f"{method} {path}\n".encode())
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands timestamps back naive; they are stored in UTC
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def claim_idempotency_key(db: Session, user_id: int, key: str, fingerprint: str,
+                          now: datetime = None) -> Optional[IdempotencyKey]:
+    """Claims a key for a request about to run.
+
+    Returns None if the caller now owns the key, otherwise the existing
+    record: either a completed response to replay or another request's
+    claim that is still in flight. Expired records and abandoned claims are
+    taken over with a compare-and-update on created_at, so only one of
+    several concurrent retries wins them.
+    """
+    now = now or datetime.now(timezone.utc).replace(microsecond=0)
+    try:
+        db.execute(insert(IdempotencyKey).values(
+            user_id=user_id, key=key, request_hash=fingerprint, created_at=now
+        ))
+        db.commit()
+        return None
+    except IntegrityError:
+        db.rollback()
+
+    record = db.get(IdempotencyKey, (user_id, key), populate_existing=True)
+    if record is None:
+        return claim_idempotency_key(db, user_id, key, fingerprint, now)  # purged meanwhile
+
+    age = now - _as_utc(record.created_at)
+    abandoned = record.status_code is None and age > timedelta(seconds=IDEMPOTENCY_LOCK_SECONDS)
+    if not abandoned and age <= timedelta(hours=IDEMPOTENCY_TTL_HOURS):
+        return record
+
+    taken_over = db.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key,
+               IdempotencyKey.created_at == record.created_at)
+        .values(request_hash=fingerprint, status_code=None, response_body=None, media_type=None, created_at=now)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    if taken_over:
+        return None
+    return db.get(IdempotencyKey, (user_id, key), populate_existing=True)
+
+
+def complete_idempotency_key(db: Session, user_id: int, key: str, response: Response) -> None:
+    """Stores the response a claimed key's request produced, for replays"""
+    db.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+        .values(status_code=response.status_code, response_body=bytes(response.body),
+                media_type=response.media_type)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def release_idempotency_key(db: Session, user_id: int, key: str) -> None:
+    """Drops a claim whose request failed, so the client can retry with the same key"""
+    db.execute(delete(IdempotencyKey).where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key))
+    db.commit()
+
+
+def purge_idempotency_keys(db: Session, now: datetime = None) -> int:
+    """Deletes records past IDEMPOTENCY_TTL_HOURS; returns how many"""
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - timedelta(hours=IDEMPOTENCY_TTL_HOURS)
+    purged = db.execute(delete(IdempotencyKey).where(IdempotencyKey.created_at < cutoff)).rowcount
+    db.commit()
+    return purged
+
+
+def _request_user_id(request: Request) -> Optional[int]:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return int(verify_token(token))
+    except (HTTPException, TypeError, ValueError):
+        return None
+
+
+def _with_db(request: Request, operation: Callable, *args):
+    # Same session source as the route's own Depends(get_db), overrides included
+    sessions = request.app.dependency_overrides.get(get_db, get_db)()
+    try:
+        return operation(next(sessions), *args)
+    finally:
+        sessions.close()
+
+
+def _replay(record: IdempotencyKey, fingerprint: str) -> Response:
+    if record.status_code is None:
+        return JSONResponse(
+            status_code=409,
+            content={"detail": "A request with this Idempotency-Key is still being processed"},
+            headers={"Retry-After": "1"},
+        )
+    if record.request_hash != fingerprint:
+        return JSONResponse(
+            status_code=422,
+            content={"detail": "Idempotency-Key was already used for a different request"},
+        )
+    return Response(
+        content=record.response_body,
+        status_code=record.status_code,
+        media_type=record.media_type,
+        headers={REPLAYED_HEADER: "true"},
+    )
+
+
+class IdempotentRoute(APIRoute):
+    """Route class that makes POST endpoints honour an Idempotency-Key header.
+
+    The first authenticated request with a given key claims it in
+    idempotency_keys and runs; its response is stored. A retry with the same
+    key gets the stored response back without the endpoint running again, so
+    a game isn't replayed and the balance isn't touched twice. Failed
+    requests (an HTTPException or a 5xx) release the key instead, as nothing
+    was settled. Requests without the header, or without a valid bearer
+    token, pass straight through.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        if "POST" not in self.methods:
+            return handler
+
+        async def idempotent_handler(request: Request) -> Response:
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if key is None:
+                return await handler(request)
+            if not 0 < len(key) <= IDEMPOTENCY_KEY_MAX_LENGTH:
+                return JSONResponse(
+                    status_code=400,
+                    content={"detail": f"{IDEMPOTENCY_HEADER} must be 1-{IDEMPOTENCY_KEY_MAX_LENGTH} characters"},
+                )
+            user_id = _request_user_id(request)
+            if user_id is None:
+                return await handler(request)  # the endpoint rejects it, or it isn't per-user
+
+            fingerprint = request_hash(request.method, request.url.path, await request.body())
+            existing = await run_in_threadpool(_with_db, request, claim_idempotency_key, user_id, key, fingerprint)
+            if existing is not None:
+                return _replay(existing, fingerprint)
+
+            token = _current_key.set(key)
+            try:
+                response = await handler(request)
+            except BaseException:
+                await run_in_threadpool(_with_db, request, release_idempotency_key, user_id, key)
+                raise
+            finally:
+                _current_key.reset(token)
+
+            if response.status_code >= 500 or not hasattr(response, "body"):
+                await run_in_threadpool(_with_db, request, release_idempotency_key, user_id, key)
+            else:
+                await run_in_threadpool(_with_db, request, complete_idempotency_key, user_id, key, response)
+            return response
+
+        return idempotent_handler
@@ -0,0 +1,358 @@
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from sqlalchemy import delete, update
+from threading import Condition, Thread
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import socket
+import time
+
+from .models.ledger_checkpoint import LedgerCheckpoint
+
+logger = logging.getLogger(__name__)
+
+# Off by default: every settlement writes its session and ledger rows inline
+LEDGER_WRITE_BEHIND = os.getenv("LEDGER_WRITE_BEHIND", "false").lower() == "true"
+# Hold each game response until its rows are committed (one shared commit per group)
+LEDGER_FLUSH_BEFORE_ACK = os.getenv("LEDGER_FLUSH_BEFORE_ACK", "false").lower() == "true"
+LEDGER_FLUSH_INTERVAL_MS = float(os.getenv("LEDGER_FLUSH_INTERVAL_MS", "5"))
+LEDGER_MAX_BATCH = int(os.getenv("LEDGER_MAX_BATCH", "500"))
+# How long flush-before-ack waits before falling back to the fsynced journal
+LEDGER_FENCE_TIMEOUT_SECONDS = float(os.getenv("LEDGER_FENCE_TIMEOUT_SECONDS", "5"))
+LEDGER_JOURNAL_DIR = os.getenv("LEDGER_JOURNAL_DIR", "./ledger-journal")
+# The journal is truncated once everything in it is committed and it grew past this
+LEDGER_JOURNAL_MAX_BYTES = int(os.getenv("LEDGER_JOURNAL_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+class LedgerEntry(NamedTuple):
+    """Detail rows of settled rounds, waiting to be written.
+
+    rounds holds (bet cents, winnings cents, game_data) per round, in play
+    order; starting_balance is the balance before the first of them, from
+    which the BET/WIN rows' running balances are rebuilt.
+    """
+    seq: int
+    user_id: int
+    game_type: str
+    rounds: List[Tuple[int, int, Optional[Dict[str, Any]]]]
+    starting_balance: Decimal
+    settled_at: datetime
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "seq": self.seq,
+            "user_id": self.user_id,
+            "game_type": self.game_type,
+            "rounds": self.rounds,
+            "starting_balance": str(self.starting_balance),
+            "settled_at": self.settled_at.isoformat(),
+        }, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> "LedgerEntry":
+        return cls.from_dict(json.loads(line))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LedgerEntry":
+        return cls(
+            seq=data["seq"],
+            user_id=data["user_id"],
+            game_type=data["game_type"],
+            rounds=[tuple(game_round) for game_round in data["rounds"]],
+            starting_balance=Decimal(data["starting_balance"]),
+            settled_at=datetime.fromisoformat(data["settled_at"]),
+        )
+
+
+def discard_line(seq: int) -> str:
+    """Journal line cancelling an entry whose balance commit failed"""
+    return json.dumps({"discard": seq}) + "\n"
+
+
+def read_journal(path: Path) -> List[LedgerEntry]:
+    """Entries in a journal file, less discarded ones; a torn last line from a crash mid-write is ignored"""
+    entries, discarded = [], set()
+    with open(path, encoding="utf-8") as journal:
+        for line in journal:
+            try:
+                data = json.loads(line)
+                if "discard" in data:
+                    discarded.add(data["discard"])
+                else:
+                    entries.append(LedgerEntry.from_dict(data))
+            except (ValueError, KeyError, TypeError):
+                logger.warning(f"Skipping unreadable ledger journal line in {path.name}")
+    return [entry for entry in entries if entry.seq not in discarded]
+
+
+def _write_entries(db, journal: str, entries: List[LedgerEntry], last_seq: int) -> None:
+    """Inserts entries' rows and advances the journal's checkpoint to last_seq in one transaction"""
+    # Imported here: the game service submits to this module
+    from .services.game_service import write_ledger_entries
+
+    try:
+        if entries:
+            write_ledger_entries(db, entries)
+        db.execute(
+            update(LedgerCheckpoint)
+            .where(LedgerCheckpoint.journal == journal)
+            .values(last_seq=last_seq)
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+class LedgerWriter:
+    """Write-behind pipeline for game session and ledger rows.
+
+    Settlement still updates the balance (and stats) synchronously; only the
+    descriptive rows go through here. Each entry is appended to a local
+    journal before the balance is committed, so no committed settlement can
+    be missing from it: the settlement then submits the entry, or discards
+    it if the commit failed. A background thread bulk inserts whatever was
+    submitted over the last few milliseconds with a single commit, which also
+    advances the journal's checkpoint row.
+
+    Entries reach the writer in journal order, each waiting for the ones
+    journaled before it to be submitted or discarded, so the checkpoint's
+    last_seq always means every entry up to it is written.
+
+    A journal left behind by a crashed process is replayed from its
+    checkpoint on the next start (see recover), so entries are written
+    exactly once. With flush_before_ack, submit hands back a future that
+    resolves when the entry's group commit is done: that is the durability
+    fence a caller can wait on before acknowledging.
+    """
+
+    def __init__(self, flush_interval_ms: float = LEDGER_FLUSH_INTERVAL_MS, max_batch: int = LEDGER_MAX_BATCH,
+                 flush_before_ack: bool = LEDGER_FLUSH_BEFORE_ACK, journal_dir: str = LEDGER_JOURNAL_DIR,
+                 journal_max_bytes: int = LEDGER_JOURNAL_MAX_BYTES):
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch = max_batch
+        self.flush_before_ack = flush_before_ack
+        self.journal_dir = Path(journal_dir)
+        self.journal_max_bytes = journal_max_bytes
+        self._session_factory: Optional[Callable] = None
+        # Submitted or discarded (None) entries waiting for the ones journaled before them
+        self._resolved: Dict[int, Optional[Tuple[LedgerEntry, Optional[Future]]]] = {}
+        self._queue: Deque[Tuple[int, Optional[LedgerEntry], Optional[Future]]] = deque()
+        self._condition = Condition()
+        self._thread: Optional[Thread] = None
+        self._journal = None
+        self._journal_name: Optional[str] = None
+        self._seq = 0
+        self._released_seq = 0
+        self._committed_seq = 0
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self, session_factory: Callable = None) -> None:
+        """Replays orphaned journals, opens this process's journal and starts the writer thread"""
+        if self.running:
+            return
+        if session_factory is None:
+            from .db import SessionLocal
+            session_factory = SessionLocal
+        self._session_factory = session_factory
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        self.recover()
+
+        self._journal_name = f"{socket.gethostname()}-{os.getpid()}-{time.time_ns()}.journal"
+        self._journal = open(self.journal_dir / self._journal_name, "a", encoding="utf-8")
+        # Held for the life of the process; recover() skips journals that are still locked
+        fcntl.flock(self._journal.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        with self._session_factory() as db:
+            db.add(LedgerCheckpoint(journal=self._journal_name, last_seq=0))
+            db.commit()
+
+        self._seq = self._released_seq = self._committed_seq = 0
+        self._resolved.clear()
+        self._stopping = False
+        self._thread = Thread(target=self._run, name="ledger-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Writes out everything queued, then closes and removes this process's journal"""
+        if not self.running:
+            return
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._thread = None
+
+        self._journal.close()
+        self._journal = None
+        if self._committed_seq == self._seq:
+            self._forget_journal(self.journal_dir / self._journal_name)
+
+    def journal(self, user_id: int, game_type: str, rounds: List[Tuple[int, int, Optional[Dict[str, Any]]]],
+                starting_balance: Decimal) -> LedgerEntry:
+        """Appends one settlement's rows to the journal, before its balance commit.
+
+        The line reaches the OS before the balance is committed, so a process
+        crash after the commit can't lose it. Follow with submit once the
+        commit succeeded, or discard if it failed.
+        """
+        with self._condition:
+            self._seq += 1
+            entry = LedgerEntry(self._seq, user_id, game_type, rounds, starting_balance,
+                                datetime.now(timezone.utc))
+            self._journal.write(entry.to_json() + "\n")
+            self._journal.flush()
+        return entry
+
+    def submit(self, entry: LedgerEntry) -> Optional[Future]:
+        """Queues a journaled entry whose balance is committed; returns a future when flush_before_ack is on"""
+        future = Future() if self.flush_before_ack else None
+        with self._condition:
+            self._resolved[entry.seq] = (entry, future)
+            self._release()
+        return future
+
+    def discard(self, entry: LedgerEntry) -> None:
+        """Cancels a journaled entry whose balance commit failed, so recovery won't write it"""
+        with self._condition:
+            self._journal.write(discard_line(entry.seq))
+            self._journal.flush()
+            self._resolved[entry.seq] = None
+            self._release()
+
+    def _release(self) -> None:
+        # Caller holds the condition
+        while self._released_seq + 1 in self._resolved:
+            self._released_seq += 1
+            submitted = self._resolved.pop(self._released_seq)
+            entry, future = submitted if submitted is not None else (None, None)
+            self._queue.append((self._released_seq, entry, future))
+        self._condition.notify_all()
+
+    def wait(self, future: Optional[Future]) -> None:
+        """Blocks until a submitted entry is committed, or falls back to the fsynced journal on timeout"""
+        if future is None:
+            return
+        try:
+            future.result(timeout=LEDGER_FENCE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            self._sync_journal()
+            logger.warning("Ledger group commit is behind; acknowledged from the journal")
+
+    async def wait_async(self, future: Optional[Future]) -> None:
+        """wait() for the event loop"""
+        if future is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), LEDGER_FENCE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            await asyncio.to_thread(self._sync_journal)
+            logger.warning("Ledger group commit is behind; acknowledged from the journal")
+
+    def fence(self, timeout: float = LEDGER_FENCE_TIMEOUT_SECONDS) -> bool:
+        """Waits until everything submitted so far is committed; False on timeout"""
+        with self._condition:
+            # Journaled entries whose balance commit is still in flight aren't waited for
+            target = max([self._released_seq, *self._resolved])
+            return self._condition.wait_for(lambda: self._committed_seq >= target, timeout=timeout)
+
+    def recover(self) -> int:
+        """Writes the uncommitted entries of journals no running process holds; returns how many"""
+        replayed = 0
+        for path in sorted(self.journal_dir.glob("*.journal")):
+            if path.name == self._journal_name:
+                continue
+            with open(path, encoding="utf-8") as handle:
+                try:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue  # another worker's live journal
+
+                with self._session_factory() as db:
+                    checkpoint = db.get(LedgerCheckpoint, path.name)
+                    last_seq = checkpoint.last_seq if checkpoint is not None else 0
+                    if checkpoint is None:
+                        db.add(LedgerCheckpoint(journal=path.name, last_seq=0))
+                        db.commit()
+                    pending = [entry for entry in read_journal(path) if entry.seq > last_seq]
+                    for start in range(0, len(pending), self.max_batch):
+                        batch = pending[start:start + self.max_batch]
+                        _write_entries(db, path.name, batch, batch[-1].seq)
+                replayed += len(pending)
+                self._forget_journal(path)
+            if pending:
+                logger.warning(f"Replayed {len(pending)} ledger entries from {path.name}")
+        return replayed
+
+    def _forget_journal(self, path: Path) -> None:
+        with self._session_factory() as db:
+            db.execute(delete(LedgerCheckpoint).where(LedgerCheckpoint.journal == path.name))
+            db.commit()
+        path.unlink(missing_ok=True)
+
+    def _sync_journal(self) -> None:
+        with self._condition:
+            if self._journal is not None:
+                os.fsync(self._journal.fileno())
+
+    def _next_group(self) -> List[Tuple[int, Optional[LedgerEntry], Optional[Future]]]:
+        with self._condition:
+            self._condition.wait_for(lambda: self._queue or self._stopping)
+            # Give concurrent settlements a moment to join this commit
+            deadline = time.monotonic() + self.flush_interval
+            while len(self._queue) < self.max_batch and not self._stopping:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            return [self._queue.popleft() for _ in range(min(self.max_batch, len(self._queue)))]
+
+    def _run(self) -> None:
+        backoff = 0.1
+        while True:
+            group = self._next_group()
+            if not group:
+                return  # stopping and drained
+
+            self._sync_journal()  # one fsync for the whole group
+            try:
+                with self._session_factory() as db:
+                    entries = [entry for _, entry, _ in group if entry is not None]
+                    _write_entries(db, self._journal_name, entries, group[-1][0])
+            except Exception:
+                logger.exception(f"Ledger group commit of {len(group)} entries failed, retrying")
+                with self._condition:
+                    self._queue.extendleft(reversed(group))
+                    if self._stopping:
+                        return  # left in the journal for recovery
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 5.0)
+                continue
+            backoff = 0.1
+
+            with self._condition:
+                self._committed_seq = group[-1][0]
+                for _, _, future in group:
+                    if future is not None:
+                        future.set_result(None)
+                self._condition.notify_all()
+                self._compact_journal()
+
+    def _compact_journal(self) -> None:
+        # Caller holds the condition, so no submit can append meanwhile
+        if self._committed_seq == self._seq and self._journal.tell() > self.journal_max_bytes:
+            self._journal.truncate(0)
+            self._journal.seek(0)
+
+
+ledger_writer = LedgerWriter()
@@ -1,30 +1,53 @@
-from fastapi import FastAPI, APIRouter
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, APIRouter, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from sqlalchemy.exc import DBAPIError
+import logging
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from routes import auth
 from routes import user
-from routes import coin_flip
-from routes import dice_roll
-from routes import high_low_card
-from routes import number_guess
-from routes import rock_paper_scissors
-from routes import scratch_card_simulator
-from routes import simple_roulette
-from routes import simplified_blackjack
-from routes import wheel_of_fortune
-from routes import reel_slot
+from routes import games
+from routes import rtp
+from routes import batch
+from app.schema_inspector import inspect_schema
+from app.partitions import ensure_partitions
+from app.ledger import LEDGER_WRITE_BEHIND, ledger_writer
+from app.frontend import FRONTEND_BUILD_DIR, StaticAssets, asset_response, load_index
+from app.metrics import MetricsMiddleware, metrics
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Record which optional columns the database has before serving requests
+    inspect_schema()
+    try:
+        # Keep next months' history partitions ready (PostgreSQL only)
+        ensure_partitions()
+    except DBAPIError as e:
+        # Another worker starting at the same time may have won the race
+        logger.warning(f"Could not create upcoming partitions: {e}")
+    if LEDGER_WRITE_BEHIND:
+        # Replays journals left by a crashed worker before taking new rounds
+        ledger_writer.start()
+    # Shares this worker's counters with the others through METRICS_DIR
+    metrics.start()
+    yield
+    ledger_writer.stop()
+    metrics.stop()
+
 
 app = FastAPI(
     title="SlotBazaar API", 
     description="Casino Games API with User Management", 
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 api_router = APIRouter(prefix="/api")
@@ -37,37 +60,50 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="slotbazaar-frontend/build/static"), name="static")
+# The built frontend, read and precompressed once when the app loads
+static_assets = StaticAssets(FRONTEND_BUILD_DIR / "static")
+index_page = load_index(FRONTEND_BUILD_DIR)
+
+
+@app.api_route("/static/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+def serve_static(path: str, request: Request):
+    asset = static_assets.get(path)
+    if asset is None:
+        return Response(status_code=404)
+    return asset_response(asset, request)
 
 # Authentication and User Management
 api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(user.router, prefix="/user", tags=["User Management"])
 
-# Game Routes
-api_router.include_router(coin_flip.router, prefix="/games/coin", tags=["Coin Flip"])
-api_router.include_router(dice_roll.router, prefix="/games/dice", tags=["Dice Roll"])
-api_router.include_router(high_low_card.router, prefix="/games/highlow", tags=["High Low Card"])
-api_router.include_router(number_guess.router, prefix="/games/guess", tags=["Number Guess"])
-api_router.include_router(rock_paper_scissors.router, prefix="/games/rps",  tags=["Rock Paper Scissors"])
-api_router.include_router(scratch_card_simulator.router, prefix="/games/scratch", tags=["Scratch Card"])
-api_router.include_router(simple_roulette.router, prefix="/games/roulette", tags=["Roulette"])
-api_router.include_router(simplified_blackjack.router, prefix="/games/blackjack", tags=["Blackjack"])
-api_router.include_router(wheel_of_fortune.router, prefix="/games/wheel", tags=["Wheel of Fortune"])
-api_router.include_router(reel_slot.router, prefix="/games/slot", tags=["Slot Machine"])
+# Game Routes: one play endpoint per game in the registry (app/games.py)
+api_router.include_router(games.router, prefix="/games")
+api_router.include_router(rtp.router, prefix="/games/rtp", tags=["Game Info"])
+api_router.include_router(batch.router, prefix="/games", tags=["Batch Play"])
 
 app.include_router(api_router)
 
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """Prometheus scrape endpoint, summed over all workers"""
+    return Response(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+def index_response(request: Request) -> Response:
+    if index_page is None:
+        return Response(status_code=404)
+    return asset_response(index_page, request)
+
 @app.get("/", tags=["Root"])
-def read_root():
-    return FileResponse("slotbazaar-frontend/build/index.html")
+def read_root(request: Request):
+    return index_response(request)
 
 @app.get("/{path:path}", tags=["Frontend"])
-def serve_frontend(path: str):
+def serve_frontend(path: str, request: Request):
     # Serve index.html for all routes that don't match API or static files
     if not path.startswith(("api/", "static/", "docs", "redoc")):
-        return FileResponse("slotbazaar-frontend/build/index.html")
+        return index_response(request)
     return {"detail": "Not found"}
 
 @app.get("/health", tags=["Health"])
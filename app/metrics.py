@@ -0,0 +1,371 @@
+from bisect import bisect_left
+from pathlib import Path
+from threading import Event, Lock, Thread, local
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import json
+import logging
+import os
+import socket
+import time
+
+logger = logging.getLogger(__name__)
+
+# Directory shared by all uvicorn workers (empty it on deploy); unset, /metrics reports this process only
+METRICS_DIR = os.getenv("METRICS_DIR")
+# How often each worker writes its snapshot for the others to read
+METRICS_FLUSH_SECONDS = float(os.getenv("METRICS_FLUSH_SECONDS", "5"))
+
+# Seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+Samples = Dict[Tuple[str, Labels], List[float]]
+
+
+class _Cells:
+    """Metric values kept per thread.
+
+    Each thread only ever writes its own dict, so recording takes no lock; the
+    lock is only taken the first time a thread records. Readers copy every
+    thread's dict and add them up.
+    """
+
+    def __init__(self):
+        self._local = local()
+        self._shards: List[Samples] = []
+        self._lock = Lock()
+
+    def mine(self) -> Samples:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def merged(self) -> Samples:
+        with self._lock:
+            shards = list(self._shards)
+        merged: Samples = {}
+        for shard in shards:
+            _add_samples(merged, shard.copy().items())
+        return merged
+
+
+def _add_samples(total: Samples, samples: Iterable[Tuple[Tuple[str, Labels], List[float]]]) -> None:
+    for key, values in samples:
+        values = list(values)
+        into = total.get(key)
+        if into is None:
+            total[key] = values
+        else:
+            for i, value in enumerate(values):
+                into[i] += value
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, cells: _Cells, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._cells = cells
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        shard = self._cells.mine()
+        key = (self.name, _labels(labels))
+        cell = shard.get(key)
+        if cell is None:
+            cell = shard[key] = [0]
+        cell[0] += amount
+
+
+class Gauge(Counter):
+    """A value that goes up and down, e.g. work in flight; only live workers count towards it"""
+    kind = "gauge"
+
+    def add(self, amount: float, **labels: str) -> None:
+        self.inc(amount, **labels)
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, cells: _Cells, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self._cells = cells
+
+    def observe(self, value: float, **labels: str) -> None:
+        shard = self._cells.mine()
+        key = (self.name, _labels(labels))
+        cell = shard.get(key)
+        if cell is None:
+            # A count per bucket, then +Inf, then the sum
+            cell = shard[key] = [0] * (len(self.buckets) + 2)
+        cell[bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+
+class CollectedGauge:
+    """A gauge read from elsewhere (pool sizes, cache sizes) each time metrics are collected"""
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, collect: Callable[[], Iterable[Tuple[Dict[str, str], float]]]):
+        self.name = name
+        self.help = help
+        self.collect = collect
+
+
+class Ratio:
+    """numerator / sum(denominators) per label set, computed from the totals of all workers"""
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, numerator: Counter, denominators: Sequence[Counter]):
+        self.name = name
+        self.help = help
+        self.numerator = numerator
+        self.denominators = denominators
+
+
+class MetricsRegistry:
+    """Counters, gauges and histograms for /metrics, in the Prometheus text format.
+
+    With a directory, every worker writes its values there (on collect and
+    every flush_seconds while started) and collect() adds up all the workers'
+    files. Counters and histograms of exited workers keep counting so totals
+    never go backwards; gauges only count workers that flushed recently.
+    """
+
+    def __init__(self, directory: Optional[str] = METRICS_DIR, flush_seconds: float = METRICS_FLUSH_SECONDS):
+        self.directory = Path(directory) if directory else None
+        self.flush_seconds = flush_seconds
+        self.metrics: Dict[str, object] = {}
+        self._cells = _Cells()
+        self._file_name = f"{socket.gethostname()}-{os.getpid()}.json"
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def _register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._register(Counter(self._cells, name, help))
+
+    def gauge(self, name: str, help: str) -> Gauge:
+        return self._register(Gauge(self._cells, name, help))
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(self._cells, name, help, buckets))
+
+    def collected_gauge(self, name: str, help: str,
+                        collect: Callable[[], Iterable[Tuple[Dict[str, str], float]]]) -> CollectedGauge:
+        return self._register(CollectedGauge(name, help, collect))
+
+    def ratio(self, name: str, help: str, numerator: Counter, *denominators: Counter) -> Ratio:
+        return self._register(Ratio(name, help, numerator, denominators))
+
+    def snapshot(self) -> Samples:
+        """This worker's values"""
+        samples = self._cells.merged()
+        for metric in self.metrics.values():
+            if isinstance(metric, CollectedGauge):
+                try:
+                    for labels, value in metric.collect():
+                        samples[(metric.name, _labels(labels))] = [value]
+                except Exception:
+                    logger.exception(f"Collecting {metric.name} failed")
+        return samples
+
+    def flush(self, samples: Optional[Samples] = None) -> None:
+        """Writes this worker's snapshot for the other workers to read"""
+        if self.directory is None:
+            return
+        samples = self.snapshot() if samples is None else samples
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / self._file_name
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps({
+            "written_at": time.time(),
+            "samples": [[name, labels, values] for (name, labels), values in samples.items()],
+        }))
+        os.replace(temporary, path)
+
+    def collect(self) -> Samples:
+        """Values of all workers added up"""
+        own = self.snapshot()
+        if self.directory is None:
+            return own
+        self.flush(own)
+
+        live_after = time.time() - 3 * self.flush_seconds
+        total: Samples = {}
+        for path in self.directory.glob("*.json"):
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                logger.warning(f"Skipping unreadable metrics file {path.name}")
+                continue
+            live = data["written_at"] >= live_after
+            _add_samples(total, (
+                ((name, tuple(tuple(pair) for pair in labels)), values)
+                for name, labels, values in data["samples"]
+                if live or self._kind(name) != "gauge"
+            ))
+        return total
+
+    def _kind(self, name: str) -> Optional[str]:
+        metric = self.metrics.get(name)
+        return metric.kind if metric is not None else None
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        samples = self.collect()
+        by_name: Dict[str, List[Tuple[Labels, List[float]]]] = {}
+        for (name, labels), values in sorted(samples.items()):
+            by_name.setdefault(name, []).append((labels, values))
+
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            if isinstance(metric, Histogram):
+                for labels, values in by_name.get(metric.name, ()):
+                    cumulative = 0
+                    for bound, count in zip((*metric.buckets, "+Inf"), values):
+                        cumulative += count
+                        le = bound if bound == "+Inf" else _number(bound)
+                        lines.append(f"{metric.name}_bucket{_render_labels(labels + (('le', le),))} {_number(cumulative)}")
+                    lines.append(f"{metric.name}_sum{_render_labels(labels)} {_number(values[-1])}")
+                    lines.append(f"{metric.name}_count{_render_labels(labels)} {_number(cumulative)}")
+            elif isinstance(metric, Ratio):
+                for labels, value in _ratios(metric, by_name):
+                    lines.append(f"{metric.name}{_render_labels(labels)} {_number(value)}")
+            else:
+                for labels, values in by_name.get(metric.name, ()):
+                    lines.append(f"{metric.name}{_render_labels(labels)} {_number(values[0])}")
+        return "\n".join(lines) + "\n"
+
+    def start(self) -> None:
+        """Starts flushing this worker's values in the background (only with a directory)"""
+        if self.directory is None or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="metrics-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_seconds):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Writing metrics snapshot failed")
+
+
+def _ratios(metric: Ratio, by_name: Dict[str, List[Tuple[Labels, List[float]]]]) -> List[Tuple[Labels, float]]:
+    numerators = {labels: values[0] for labels, values in by_name.get(metric.numerator.name, ())}
+    denominators: Dict[Labels, float] = {}
+    for denominator in metric.denominators:
+        for labels, values in by_name.get(denominator.name, ()):
+            denominators[labels] = denominators.get(labels, 0) + values[0]
+    return [
+        (labels, numerators.get(labels, 0) / denominator)
+        for labels, denominator in sorted(denominators.items()) if denominator
+    ]
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _render_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels) + "}"
+
+
+metrics = MetricsRegistry()
+
+# HTTP
+http_request_seconds = metrics.histogram(
+    "slotbazaar_http_request_duration_seconds", "Request latency by route template, method and status")
+
+# Games
+game_rounds = metrics.counter("slotbazaar_game_rounds_total", "Rounds settled per game")
+game_wagered_cents = metrics.counter("slotbazaar_game_wagered_cents_total", "Cents bet per game")
+game_paid_cents = metrics.counter("slotbazaar_game_paid_cents_total", "Cents paid out per game")
+metrics.ratio("slotbazaar_game_rtp", "Paid over wagered per game since the counters started",
+              game_paid_cents, game_wagered_cents)
+game_settle_seconds = metrics.histogram(
+    "slotbazaar_game_settle_duration_seconds", "Time to settle a round or batch, commit included, per game")
+balance_updates = metrics.counter(
+    "slotbazaar_balance_updates_total", "Conditional balance updates, applied or rejected by their guard")
+
+# Database
+db_pool_wait_seconds = metrics.histogram(
+    "slotbazaar_db_pool_checkout_wait_seconds", "Time to check a connection out of the pool")
+db_commit_seconds = metrics.histogram("slotbazaar_db_commit_duration_seconds", "Session commit time, flush included")
+
+# Passwords
+password_hash_in_flight = metrics.gauge(
+    "slotbazaar_password_hash_in_flight", "bcrypt operations running or queued on the hashing pool")
+password_hash_seconds = metrics.histogram(
+    "slotbazaar_password_hash_duration_seconds", "bcrypt time including the wait for a pool worker",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0))
+password_hash_rejected = metrics.counter(
+    "slotbazaar_password_hash_rejected_total", "bcrypt operations turned away because the queue was full")
+
+# Caches
+cache_hits = metrics.counter("slotbazaar_cache_hits_total", "Cache lookups that found a live entry")
+cache_misses = metrics.counter("slotbazaar_cache_misses_total", "Cache lookups that had to load")
+metrics.ratio("slotbazaar_cache_hit_ratio", "Hits over lookups per cache", cache_hits, cache_hits, cache_misses)
+
+
+class MetricsMiddleware:
+    """Times every HTTP request into http_request_seconds, labelled by the matched route's path template"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            http_request_seconds.observe(
+                time.perf_counter() - start,
+                method=scope["method"], route=getattr(route, "path", "unmatched"), status=str(status)
+            )
@@ -1,3 +1,16 @@
+from sqlalchemy import DateTime
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import declarative_base
 
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+# Row timestamps. SQLite's CURRENT_TIMESTAMP has no fractional seconds; storing
+# Python-side values in the same text format keeps them comparable, which
+# keyset pagination on (created_at, id) relies on.
+Timestamp = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d",
+        regexp=r"(\d+)-(\d+)-(\d+) (\d+):(\d+):(\d+)",
+    ),
+    "sqlite",
+)
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Index, Integer, String, Numeric, ForeignKey, JSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from .base import Base
+from .base import Base, Timestamp
 
 
 class GameSession(Base):
@@ -14,11 +14,16 @@ class GameSession(Base):
     win_amount = Column(Numeric(10, 2), default=0.00, nullable=False)
     net_result = Column(Numeric(10, 2), nullable=False)  # win_amount - bet_amount
     game_data = Column(JSON, nullable=True)  # Store game-specific data (choice, outcome, etc.)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(Timestamp, server_default=func.now())
 
     # Relationships
     user = relationship("User", back_populates="game_sessions")
     transactions = relationship("Transaction", back_populates="game_session")
 
+    __table_args__ = (
+        # Newest-first history per user, paged by (created_at, id)
+        Index("ix_game_sessions_user_created_id", "user_id", created_at.desc(), id.desc()),
+    )
+
     def __repr__(self):
         return f"<GameSession(id={self.id}, user_id={self.user_id}, game_type='{self.game_type}', net_result={self.net_result})>"
\ No newline at end of file
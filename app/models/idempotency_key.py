@@ -0,0 +1,22 @@
+from sqlalchemy import Column, ForeignKey, Integer, LargeBinary, String
+from .base import Base, Timestamp
+
+
+class IdempotencyKey(Base):
+    """A client's Idempotency-Key and the response it got the first time.
+
+    Inserted before the request runs, which is what claims the key; the
+    response columns stay empty until the request completes.
+    """
+    __tablename__ = "idempotency_keys"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    key = Column(String(100), primary_key=True)
+    request_hash = Column(String(64), nullable=False)  # sha256 of method, path and body
+    status_code = Column(Integer, nullable=True)  # None while the first request is in flight
+    response_body = Column(LargeBinary, nullable=True)
+    media_type = Column(String(100), nullable=True)
+    created_at = Column(Timestamp, nullable=False)
+
+    def __repr__(self):
+        return f"<IdempotencyKey(user_id={self.user_id}, key='{self.key}', status_code={self.status_code})>"
@@ -2,6 +2,10 @@
 from .user import User
 from .transaction import Transaction, TransactionType, TransactionStatus
 from .game_session import GameSession
+from .user_game_stats import UserGameStats, ArchivedGameStats
+from .ledger_checkpoint import LedgerCheckpoint
+from .idempotency_key import IdempotencyKey
+from .revoked_token import RevokedToken
 
 # Game result models
 from .coin_flip import CoinFlipResult
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, BigInteger, String
+from .base import Base
+
+
+class LedgerCheckpoint(Base):
+    """Last ledger journal entry written to the database, per journal file.
+
+    Advanced in the same transaction as the rows it covers, so replaying a
+    journal after a crash skips exactly what was already committed.
+    """
+    __tablename__ = "ledger_checkpoints"
+
+    journal = Column(String(255), primary_key=True)
+    last_seq = Column(BigInteger, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<LedgerCheckpoint(journal='{self.journal}', last_seq={self.last_seq})>"
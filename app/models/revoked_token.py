@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String
+from .base import Base, Timestamp
+
+
+class RevokedToken(Base):
+    """A logged-out bearer token, shared by every worker until the token expires.
+
+    Keyed by the token's sha256 so raw tokens are never stored.
+    """
+    __tablename__ = "revoked_tokens"
+
+    digest = Column(String(64), primary_key=True)  # hex sha256 of the token
+    expires_at = Column(Timestamp, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<RevokedToken(digest='{self.digest[:12]}...', expires_at={self.expires_at})>"
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Index, Integer, String, Numeric, ForeignKey, Enum
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from .base import Base
+from .base import Base, Timestamp
 import enum
 
 
@@ -33,12 +33,19 @@ class Transaction(Base):
     balance_after = Column(Numeric(12, 2), nullable=False)
     description = Column(String(255), nullable=True)
     game_session_id = Column(Integer, ForeignKey("game_sessions.id"), nullable=True)
-    reference_id = Column(String(100), nullable=True)  # External reference (payment gateway, etc.)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    reference_id = Column(String(100), nullable=True)  # External reference (payment gateway, Idempotency-Key, etc.)
+    created_at = Column(Timestamp, server_default=func.now())
 
     # Relationships
     user = relationship("User", back_populates="transactions")
     game_session = relationship("GameSession", back_populates="transactions")
 
+    __table_args__ = (
+        # Newest-first history per user, paged by (created_at, id)
+        Index("ix_transactions_user_created_id", "user_id", created_at.desc(), id.desc()),
+        # One settlement per client Idempotency-Key; NULLs (no key) don't collide
+        Index("ix_transactions_user_reference", "user_id", "reference_id", unique=True),
+    )
+
     def __repr__(self):
         return f"<Transaction(id={self.id}, user_id={self.user_id}, type={self.type}, amount={self.amount})>"
\ No newline at end of file
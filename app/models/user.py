@@ -2,7 +2,7 @@ from sqlalchemy import Column, Integer, String, Numeric, DateTime, Boolean
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from .base import Base
-import bcrypt
+from ..passwords import password_hasher
 
 
 class User(Base):
@@ -25,12 +25,15 @@ class User(Base):
 
     def set_password(self, password: str):
         """Hash and set password"""
-        salt = bcrypt.gensalt()
-        self.hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        self.hashed_password = password_hasher.hash(password)
 
     def check_password(self, password: str) -> bool:
         """Check if provided password matches the hashed password"""
-        return bcrypt.checkpw(password.encode('utf-8'), self.hashed_password.encode('utf-8'))
+        return password_hasher.verify(password, self.hashed_password)
+
+    def password_needs_rehash(self) -> bool:
+        """Check if the password hash predates the configured bcrypt cost"""
+        return password_hasher.needs_rehash(self.hashed_password)
 
     def __repr__(self):
         return f"<User(id={self.id}, username='{self.username}', balance={self.balance})>"
\ No newline at end of file
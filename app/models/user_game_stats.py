@@ -0,0 +1,43 @@
+from sqlalchemy import Column, Integer, String, Numeric, ForeignKey
+from sqlalchemy.sql import func
+from .base import Base, Timestamp
+
+# game_type of the row that sums a user's games across every game type
+ALL_GAMES = "*"
+
+
+class UserGameStats(Base):
+    """Running totals of a user's settled games, per game type and across all of them.
+
+    Maintained in the settlement transaction (see app.services.stats_service),
+    so reading a user's stats is a primary key lookup instead of aggregating
+    their whole game history.
+    """
+    __tablename__ = "user_game_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    game_type = Column(String(50), primary_key=True)
+    total_games = Column(Integer, default=0, nullable=False)
+    total_bet = Column(Numeric(14, 2), default=0.00, nullable=False)
+    total_won = Column(Numeric(14, 2), default=0.00, nullable=False)
+    net_result = Column(Numeric(14, 2), default=0.00, nullable=False)
+    updated_at = Column(Timestamp, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<UserGameStats(user_id={self.user_id}, game_type='{self.game_type}', total_games={self.total_games})>"
+
+
+class ArchivedGameStats(Base):
+    """Totals of game sessions the partition archiver has moved out of the database.
+
+    Rebuilding or checking user_game_stats adds these to what is still in
+    game_sessions, so archiving old months doesn't change anyone's stats.
+    """
+    __tablename__ = "archived_game_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    game_type = Column(String(50), primary_key=True)
+    total_games = Column(Integer, default=0, nullable=False)
+    total_bet = Column(Numeric(14, 2), default=0.00, nullable=False)
+    total_won = Column(Numeric(14, 2), default=0.00, nullable=False)
+    net_result = Column(Numeric(14, 2), default=0.00, nullable=False)
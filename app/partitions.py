@@ -0,0 +1,235 @@
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from sqlalchemy import JSON, DateTime, Integer, Numeric, text
+from sqlalchemy.engine import Connection, Engine
+from typing import List, NamedTuple, Optional, Tuple
+import json
+import logging
+import os
+import re
+
+from .db import engine
+from .models.game_session import GameSession
+from .models.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+# Range partitioned by month on created_at (PostgreSQL only, see the
+# partition_history_tables migration); SQLite keeps plain tables
+PARTITIONED_TABLES = ("transactions", "game_sessions")
+_MODEL_TABLES = {model.__tablename__: model.__table__ for model in (Transaction, GameSession)}
+
+# History endpoints only look this far back unless asked for older rows; 0 = everything
+HISTORY_WINDOW_DAYS = int(os.getenv("HISTORY_WINDOW_DAYS", "90"))
+# Monthly partitions kept ready beyond the current month
+PARTITION_MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "2"))
+# Closed months stay in the database this long before they may be archived
+ARCHIVE_AFTER_MONTHS = int(os.getenv("ARCHIVE_AFTER_MONTHS", "12"))
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "./archive")
+
+_MONTH_SUFFIX = re.compile(r"_y(\d{4})m(\d{2})$")
+
+
+class ArchivedPartition(NamedTuple):
+    """A monthly partition written to disk and dropped from the database"""
+    table: str
+    partition: str
+    path: Path
+    rows: int
+
+
+def month_start(value: Optional[date] = None) -> date:
+    value = value or datetime.now(timezone.utc).date()
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """game_sessions, 2026-10 -> game_sessions_y2026m10"""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """Month a partition covers from its name; None for the default partition"""
+    match = _MONTH_SUFFIX.search(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def create_partition_sql(table: str, month: date):
+    """DDL for the partition holding one month of table's rows (UTC month boundaries)"""
+    return text(
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(table, month)}" PARTITION OF "{table}" '
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+    )
+
+
+def recent_history_since(include_older: bool = False, now: Optional[datetime] = None) -> Optional[datetime]:
+    """Lower created_at bound for history queries, so only recent partitions are scanned"""
+    if include_older or HISTORY_WINDOW_DAYS <= 0:
+        return None
+    return (now or datetime.now(timezone.utc)) - timedelta(days=HISTORY_WINDOW_DAYS)
+
+
+def is_partitioned(connection: Connection, table: str) -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    return connection.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = :table AND pg_table_is_visible(c.oid))"
+    ), {"table": table}).scalar()
+
+
+def list_partitions(connection: Connection, table: str) -> List[Tuple[str, date]]:
+    """Monthly partitions of table, oldest first"""
+    names = connection.execute(text(
+        "SELECT child.relname FROM pg_inherits i "
+        "JOIN pg_class parent ON parent.oid = i.inhparent "
+        "JOIN pg_class child ON child.oid = i.inhrelid "
+        "WHERE parent.relname = :table AND pg_table_is_visible(parent.oid)"
+    ), {"table": table}).scalars()
+    monthly = [(name, partition_month(name)) for name in names]
+    return sorted((item for item in monthly if item[1] is not None), key=lambda item: item[1])
+
+
+def ensure_partitions(bind: Engine = None, months_ahead: int = PARTITION_MONTHS_AHEAD,
+                      today: Optional[date] = None) -> List[str]:
+    """Creates this month's and the next months' partitions where missing; returns the new ones.
+
+    Rows outside every monthly partition land in the default partition, but a
+    month can't be split out of it once it holds rows, so run this (startup
+    does) well before the month begins.
+    """
+    created = []
+    with (bind if bind is not None else engine).begin() as connection:
+        for table in PARTITIONED_TABLES:
+            if not is_partitioned(connection, table):
+                continue
+            existing = {name for name, _ in list_partitions(connection, table)}
+            for offset in range(months_ahead + 1):
+                month = add_months(month_start(today), offset)
+                if partition_name(table, month) not in existing:
+                    connection.execute(create_partition_sql(table, month))
+                    created.append(partition_name(table, month))
+    if created:
+        logger.info(f"Created partitions: {', '.join(created)}")
+    return created
+
+
+def archivable_months(bind: Engine = None, keep_months: int = ARCHIVE_AFTER_MONTHS,
+                      today: Optional[date] = None) -> List[date]:
+    """Closed months older than the retention period that still have partitions"""
+    cutoff = add_months(month_start(today), -max(keep_months, 1))
+    with (bind if bind is not None else engine).connect() as connection:
+        months = {
+            month
+            for table in PARTITIONED_TABLES if is_partitioned(connection, table)
+            for _, month in list_partitions(connection, table)
+            if month < cutoff
+        }
+    return sorted(months)
+
+
+def _arrow_type(pa, column):
+    if isinstance(column.type, Numeric):
+        return pa.decimal128(column.type.precision, column.type.scale)
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, DateTime):
+        return pa.timestamp("us", tz="UTC")
+    # String, Enum, and JSON (stored as its text)
+    return pa.string()
+
+
+def export_partition(connection: Connection, table: str, partition: str, archive_dir: str = ARCHIVE_DIR,
+                     chunk_size: int = 10000) -> Tuple[Path, int]:
+    """Streams a partition into a zstd-compressed Parquet file and returns its path and row count"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = list(_MODEL_TABLES[table].columns)
+    schema = pa.schema([(column.name, _arrow_type(pa, column)) for column in columns])
+    json_columns = {column.name for column in columns if isinstance(column.type, JSON)}
+
+    path = Path(archive_dir) / table / f"{partition}.parquet"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".partial")
+
+    column_list = ", ".join(f'"{column.name}"' for column in columns)
+    result = connection.execution_options(stream_results=True, yield_per=chunk_size).execute(
+        text(f'SELECT {column_list} FROM "{partition}" ORDER BY id')
+    )
+    rows = 0
+    with pq.ParquetWriter(partial, schema, compression="zstd") as writer:
+        for chunk in result.mappings().partitions(chunk_size):
+            records = [
+                {
+                    name: json.dumps(value) if name in json_columns and value is not None else value
+                    for name, value in row.items()
+                }
+                for row in chunk
+            ]
+            writer.write_table(pa.Table.from_pylist(records, schema=schema))
+            rows += len(records)
+
+    if pq.ParquetFile(partial).metadata.num_rows != rows:
+        partial.unlink()
+        raise RuntimeError(f"Archive of {partition} is incomplete")
+    partial.replace(path)
+    return path, rows
+
+
+# Keeps user_game_stats rebuildable once the sessions themselves are gone
+_FOLD_ARCHIVED_STATS = """
+INSERT INTO archived_game_stats (user_id, game_type, total_games, total_bet, total_won, net_result)
+SELECT user_id, game_type, COUNT(id), SUM(bet_amount), SUM(win_amount), SUM(net_result)
+FROM "{partition}" GROUP BY user_id, game_type
+ON CONFLICT (user_id, game_type) DO UPDATE SET
+    total_games = archived_game_stats.total_games + excluded.total_games,
+    total_bet = archived_game_stats.total_bet + excluded.total_bet,
+    total_won = archived_game_stats.total_won + excluded.total_won,
+    net_result = archived_game_stats.net_result + excluded.net_result
+"""
+
+
+def archive_month(month: date, bind: Engine = None, archive_dir: str = ARCHIVE_DIR,
+                  today: Optional[date] = None) -> List[ArchivedPartition]:
+    """Moves one closed month of every partitioned table to Parquet files under archive_dir.
+
+    Each partition is exported and its file verified first; the partitions are
+    then detached and dropped in one transaction, together with folding the
+    month's game totals into archived_game_stats. A failed run leaves the
+    database untouched and can simply be repeated.
+    """
+    month = month_start(month)
+    if month >= month_start(today):
+        raise ValueError(f"{month:%Y-%m} is not a closed month")
+
+    bind = bind if bind is not None else engine
+    archived = []
+    with bind.connect() as connection:
+        for table in PARTITIONED_TABLES:
+            partition = partition_name(table, month)
+            if not is_partitioned(connection, table) or partition not in dict(list_partitions(connection, table)):
+                continue
+            expected = connection.execute(text(f'SELECT COUNT(*) FROM "{partition}"')).scalar()
+            path, rows = export_partition(connection, table, partition, archive_dir)
+            if rows != expected:
+                raise RuntimeError(f"Exported {rows} of {expected} rows from {partition}")
+            archived.append(ArchivedPartition(table, partition, path, rows))
+        connection.rollback()
+
+    if not archived:
+        return archived
+
+    with bind.begin() as connection:
+        for item in archived:
+            if item.table == "game_sessions":
+                connection.execute(text(_FOLD_ARCHIVED_STATS.format(partition=item.partition)))
+            connection.execute(text(f'ALTER TABLE "{item.table}" DETACH PARTITION "{item.partition}"'))
+            connection.execute(text(f'DROP TABLE "{item.partition}"'))
+    logger.info(f"Archived {month:%Y-%m}: " + ", ".join(f"{item.partition} ({item.rows} rows)" for item in archived))
+    return archived
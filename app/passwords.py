@@ -0,0 +1,92 @@
+from concurrent.futures import ProcessPoolExecutor
+from fastapi import HTTPException
+from threading import BoundedSemaphore, Lock
+from typing import Optional
+import multiprocessing
+import os
+import time
+import bcrypt
+
+from .metrics import password_hash_in_flight, password_hash_rejected, password_hash_seconds
+
+# bcrypt cost factor for new hashes; existing hashes are upgraded on login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# 0 hashes inline on the calling thread
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+# Hash operations allowed in flight (running or queued) before callers get a 503; 0 means no bound
+PASSWORD_HASH_QUEUE_DEPTH = int(os.getenv("PASSWORD_HASH_QUEUE_DEPTH", "32"))
+
+
+def hash_rounds(hashed_password: str) -> Optional[int]:
+    """Cost factor of a bcrypt hash ("$2b$12$..." -> 12)"""
+    try:
+        return int(hashed_password.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated, bounded process pool.
+
+    Hashing is CPU-bound for hundreds of milliseconds, so it is kept off the
+    request process: the caller's thread only waits on the result. At most
+    queue_depth operations may be in flight; beyond that callers are turned
+    away with a 503 instead of piling up.
+    """
+
+    def __init__(self, rounds: int = BCRYPT_ROUNDS, workers: int = PASSWORD_HASH_WORKERS,
+                 queue_depth: int = PASSWORD_HASH_QUEUE_DEPTH):
+        self.rounds = rounds
+        self.workers = workers
+        self._slots = BoundedSemaphore(queue_depth) if queue_depth > 0 else None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = Lock()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        # Started on first use; spawn keeps workers clear of the parent's threads
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def _run(self, fn, *args):
+        if self._slots is not None and not self._slots.acquire(blocking=False):
+            password_hash_rejected.inc()
+            raise HTTPException(
+                status_code=503,
+                detail="Too many password operations in progress, please retry",
+                headers={"Retry-After": "1"},
+            )
+        password_hash_in_flight.add(1)
+        start = time.perf_counter()
+        try:
+            if self.workers <= 0:
+                return fn(*args)
+            return self._executor().submit(fn, *args).result()
+        finally:
+            password_hash_seconds.observe(time.perf_counter() - start, operation=fn.__name__)
+            password_hash_in_flight.add(-1)
+            if self._slots is not None:
+                self._slots.release()
+
+    def hash(self, password: str) -> str:
+        salt = bcrypt.gensalt(self.rounds)
+        return self._run(bcrypt.hashpw, password.encode('utf-8'), salt).decode('utf-8')
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._run(bcrypt.checkpw, password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """True if the hash was made with a different cost than the configured one"""
+        return hash_rounds(hashed_password) != self.rounds
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+password_hasher = PasswordHasher()
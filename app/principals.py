@@ -0,0 +1,91 @@
+from collections import OrderedDict
+from itertools import count
+from threading import Lock
+from typing import NamedTuple, Optional
+import os
+import time
+
+from .metrics import cache_hits, cache_misses
+
+
+class Principal(NamedTuple):
+    """The authenticated caller, as much of the user as authorization needs"""
+    id: int
+    username: str
+    is_active: bool
+    balance_version: int  # Bumped whenever this process sees the user's balance change
+
+
+class PrincipalCache:
+    """Bounded in-process cache of principals keyed by user id, with TTL and LRU eviction.
+
+    Entries are dropped explicitly when a user is disabled (invalidate) and get a
+    new balance_version when their balance changes (balance_changed). Fills are
+    tagged with the generation read before the lookup so a load that raced an
+    invalidation can't put the stale row back.
+
+    Invalidation is local to the process: other workers serve a disabled user's
+    principal until its TTL runs out. Money can't move meanwhile, because the
+    guarded balance UPDATE requires is_active itself.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._versions = count(1)
+        self._lock = Lock()
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                cache_misses.inc(cache="principal")
+                return None
+            principal, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                cache_misses.inc(cache="principal")
+                return None
+            self._entries.move_to_end(user_id)
+        cache_hits.inc(cache="principal")
+        return principal
+
+    def put(self, user_id: int, username: str, is_active: bool, generation: int) -> Principal:
+        """Caches a freshly loaded user unless it was invalidated since generation was read"""
+        with self._lock:
+            principal = Principal(user_id, username, is_active, next(self._versions))
+            if generation != self.generation or self.max_entries <= 0:
+                return principal
+            self._entries[user_id] = (principal, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return principal
+
+    def balance_changed(self, user_id: int) -> None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                principal, expires_at = entry
+                self._entries[user_id] = (principal._replace(balance_version=next(self._versions)), expires_at)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(
+    max_entries=int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000")),
+    ttl_seconds=float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60")),
+)
@@ -0,0 +1,63 @@
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+from typing import FrozenSet, Optional
+import logging
+
+from .db import engine
+from .models.revoked_token import RevokedToken
+from .models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Columns added to users after the first deployments; older databases may lack them
+OPTIONAL_USER_COLUMNS = ("is_verified", "last_login")
+
+
+class SchemaCapabilities:
+    """Which optional columns and tables the connected database actually has.
+
+    Recorded once by inspect_schema at startup (and again after a migration)
+    so request handlers can pick the right query up front instead of running
+    the full one and retrying when it fails.
+    """
+
+    def __init__(self, user_columns: Optional[FrozenSet[str]] = None, has_revoked_tokens: bool = True):
+        self.record(user_columns, has_revoked_tokens)
+
+    def record(self, user_columns: Optional[FrozenSet[str]], has_revoked_tokens: bool = True) -> None:
+        # None means "as the models say", which is also the assumption until inspected
+        self.user_columns = frozenset(User.__table__.columns.keys()) if user_columns is None else user_columns
+        # revoked_tokens came with a later migration (add_revoked_tokens)
+        self.has_revoked_tokens = has_revoked_tokens
+
+    def has_user_column(self, name: str) -> bool:
+        return name in self.user_columns
+
+    @property
+    def legacy_users(self) -> bool:
+        """True if users predates is_verified, so the ORM model can't load it"""
+        return not self.has_user_column("is_verified")
+
+    def __repr__(self) -> str:
+        missing = [name for name in OPTIONAL_USER_COLUMNS if not self.has_user_column(name)]
+        return f"SchemaCapabilities(missing_user_columns={missing}, has_revoked_tokens={self.has_revoked_tokens})"
+
+
+schema_capabilities = SchemaCapabilities()
+
+
+def inspect_schema(bind: Engine = None) -> SchemaCapabilities:
+    """Inspects the database and records its capabilities for the rest of the process"""
+    inspector = inspect(bind if bind is not None else engine)
+    if not inspector.has_table(User.__tablename__):
+        # Nothing to adapt to yet; the tables will be created from the models
+        columns, has_revoked_tokens = None, True
+    else:
+        columns = frozenset(column["name"] for column in inspector.get_columns(User.__tablename__))
+        has_revoked_tokens = inspector.has_table(RevokedToken.__tablename__)
+
+    schema_capabilities.record(columns, has_revoked_tokens)
+    if (schema_capabilities.legacy_users or not schema_capabilities.has_user_column("last_login")
+            or not schema_capabilities.has_revoked_tokens):
+        logger.warning(f"Database schema is behind the models: {schema_capabilities!r}")
+    return schema_capabilities
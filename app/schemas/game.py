@@ -29,8 +29,8 @@ class GameSessionResponse(GameSessionBase):
 
 class GameHistory(BaseModel):
     sessions: list[GameSessionResponse]
-    total_count: int
-    page: int
+    next_cursor: Optional[str] = None
+    total_count: Optional[int] = None  # Only when requested with include_total
     per_page: int
 
 
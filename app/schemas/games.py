@@ -0,0 +1,161 @@
+from pydantic import BaseModel, condecimal
+from decimal import Decimal
+from typing import Optional
+
+
+# Request/response bodies of the single-round play endpoints, one pair per game
+
+
+class CoinFlipRequest(BaseModel):
+    bet: condecimal(gt=0, decimal_places=2)
+    choice: str
+
+
+class CoinFlipResponse(BaseModel):
+    outcome: str
+    result: str
+    bet_amount: Decimal
+    winnings: Decimal
+    new_balance: Decimal
+
+
+class DiceRollRequest(BaseModel):
+    bet_amount: condecimal(gt=0, decimal_places=2)
+    number: int
+
+
+class DiceRollResponse(BaseModel):
+    game: str
+    choice: int
+    outcome: int
+    bet: Decimal
+    payout_rate_on_win: Decimal
+    winnings: Decimal
+    net_win_loss: Decimal
+    new_balance: Decimal
+
+
+class HighLowCardRequest(BaseModel):
+    bet_amount: condecimal(gt=0, decimal_places=2)
+    choice: str
+
+
+class HighLowCardResponse(BaseModel):
+    game: str
+    choice: str
+    outcome_card_rank: str
+    outcome_card_value: int
+    bet: float
+    payout_rate_on_win: float
+    winnings: float
+    net_win_loss: float
+    new_balance: float
+
+
+class NumberGuessRequest(BaseModel):
+    bet_amount: condecimal(gt=0, decimal_places=2)
+    guess: int
+
+
+class NumberGuessResponse(BaseModel):
+    game: str
+    choice: int
+    secret_number: int
+    bet: Decimal
+    payout_rate_on_win: Decimal
+    winnings: Decimal
+    net_win_loss: Decimal
+    new_balance: Decimal
+
+
+class RockPaperScissorsRequest(BaseModel):
+    bet_amount: condecimal(gt=0, decimal_places=2)
+    choice: str
+
+
+class RockPaperScissorsResponse(BaseModel):
+    game: str
+    player_choice: str
+    house_choice: str
+    result_status: str
+    bet: Decimal
+    payout_rate: Decimal
+    winnings: Decimal
+    net_win_loss: Decimal
+    new_balance: Decimal
+
+
+class ScratchCardRequest(BaseModel):
+    bet_amount: Optional[condecimal(gt=0, decimal_places=2)] = None
+
+
+class ScratchCardResponse(BaseModel):
+    game: str
+    bet: Decimal
+    revealed_payout_rate: Decimal
+    winnings: Decimal
+    net_win_loss: Decimal
+    new_balance: Decimal
+
+
+class SimpleRouletteRequest(BaseModel):
+    bet_amount: condecimal(gt=0, decimal_places=2)
+    choice: str
+
+
+class RouletteResponse(BaseModel):
+    game: str
+    choice: str
+    outcome_number: int
+    outcome_color: str
+    bet: Decimal
+    payout_rate_on_win: Decimal
+    winnings: Decimal
+    net_win_loss: Decimal
+    new_balance: Decimal
+
+
+class SimplifiedBlackjackRequest(BaseModel):
+    bet_amount: condecimal(gt=0, decimal_places=2)
+
+
+class BlackjackResponse(BaseModel):
+    game: str
+    player_hand: list
+    dealer_hand: list
+    player_value: int
+    dealer_value: int
+    result_status: str
+    bet: Decimal
+    payout_rate: Decimal
+    winnings: Decimal
+    net_win_loss: Decimal
+    new_balance: Decimal
+
+
+class WheelOfFortuneRequest(BaseModel):
+    bet_amount: condecimal(gt=0, decimal_places=2)
+
+
+class WheelOfFortuneResponse(BaseModel):
+    game: str
+    winning_segment: str
+    bet: Decimal
+    payout_rate_on_win: Decimal
+    winnings: Decimal
+    net_win_loss: Decimal
+    new_balance: Decimal
+
+
+class ReelSlotRequest(BaseModel):
+    bet_amount: condecimal(gt=0, decimal_places=2)
+
+
+class ReelSlotResponse(BaseModel):
+    game: str
+    combination: list
+    bet: Decimal
+    payout_rate_on_win: Decimal
+    winnings: Decimal
+    net_win_loss: Decimal
+    new_balance: Decimal
@@ -34,6 +34,6 @@ class TransactionResponse(TransactionBase):
 
 class TransactionHistory(BaseModel):
     transactions: list[TransactionResponse]
-    total_count: int
-    page: int
+    next_cursor: Optional[str] = None
+    total_count: Optional[int] = None  # Only when requested with include_total
     per_page: int
\ No newline at end of file
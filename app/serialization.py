@@ -0,0 +1,66 @@
+from decimal import Decimal
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type
+import orjson
+
+from Games.money import Money
+
+
+def _default(value: Any) -> Any:
+    # Decimals go out as strings, exactly as pydantic renders them
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Money):
+        return str(value.to_decimal())
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Encodes plain dicts/lists of rows with orjson.
+
+    Output matches FastAPI's response_model path: Decimals as strings,
+    enums as their values, UTC datetimes with a Z suffix.
+    """
+    return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson without going through jsonable_encoder.
+
+    Endpoints return it with already projected dicts, so FastAPI neither
+    validates them against the response_model (kept for the OpenAPI schema)
+    nor walks them again to encode.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def select_fields(schema: Type[BaseModel], fields: Optional[str], default: Optional[Iterable[str]] = None,
+                  required: Iterable[str] = ()) -> List[str]:
+    """The schema fields named by a comma separated fields= parameter, in schema order.
+
+    Without fields the default ones (all of them if None) are picked.
+    required fields are always added; unknown names are a 400.
+    """
+    if fields:
+        wanted = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = wanted - set(schema.model_fields)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    else:
+        wanted = set(schema.model_fields if default is None else default)
+    wanted.update(required)
+    return [name for name in schema.model_fields if name in wanted]
+
+
+def schema_columns(model, schema: Type[BaseModel], fields: Optional[Sequence[str]] = None) -> List[Any]:
+    """The model's columns named like the schema's fields (or just fields), to select rows in response shape"""
+    return [getattr(model, name) for name in (schema.model_fields if fields is None else fields)]
+
+
+def row_dicts(rows: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Result rows (from selecting schema_columns) as dicts for dumps"""
+    return [row._asdict() for row in rows]
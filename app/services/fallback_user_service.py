@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import bindparam, text
 from fastapi import HTTPException
 from ..models.user import User
+from ..schema_inspector import schema_capabilities
 from ..models.transaction import Transaction, TransactionType, TransactionStatus
 from ..schemas.user import UserCreate, UserLogin
 from decimal import Decimal
@@ -10,6 +12,30 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Columns every users table has had; the ORM model also selects is_verified/last_login
+LEGACY_USER_COLUMNS = "id, username, email, hashed_password, balance, is_active, created_at, updated_at"
+
+
+def user_from_legacy_row(user_data) -> User:
+    """Builds a detached User from a row of LEGACY_USER_COLUMNS"""
+    # Создаем объект пользователя из результата запроса
+    user = User()
+    user.id = user_data.id
+    user.username = user_data.username
+    user.email = user_data.email
+    user.hashed_password = user_data.hashed_password
+    user.balance = user_data.balance
+    user.is_active = user_data.is_active
+    user.created_at = user_data.created_at
+    user.updated_at = user_data.updated_at
+
+    # Добавляем отсутствующие атрибуты
+    user.is_verified = False
+    user.last_login = None
+
+    return user
+
+
 class FallbackUserService:
     """Fallback user service for database without is_verified column"""
     
@@ -18,21 +44,29 @@ class FallbackUserService:
         self.use_fallback = self._check_if_fallback_needed()
         
     def _check_if_fallback_needed(self) -> bool:
-        """Check if we need to use fallback (no is_verified column)"""
-        try:
-            # Try to create a query that uses is_verified
-            self.db.query(User.is_verified).limit(1).all()
-            return False  # Column exists, no fallback needed
-        except Exception as e:
-            logger.warning(f"Error accessing is_verified column: {e}")
-            return True  # Need to use fallback
+        """Check if we need to use fallback (no is_verified column), as recorded at startup"""
+        return schema_capabilities.legacy_users
+
+    def _find_user(self, where: str, **params) -> Optional[User]:
+        user_data = self.db.execute(
+            text(f"SELECT {LEGACY_USER_COLUMNS} FROM users WHERE {where}"), params
+        ).first()
+        return user_from_legacy_row(user_data) if user_data is not None else None
+
+    def get_user_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID"""
+        return self._find_user("id = :id", id=user_id)
+
+    def get_user_by_username(self, username: str) -> Optional[User]:
+        """Get user by username"""
+        return self._find_user("username = :username", username=username)
     
     def create_user(self, user_data: UserCreate) -> User:
         """Create a new user - fallback version for database without is_verified"""
         # Check if user already exists
-        existing_user = self.db.query(User).filter(
-            (User.username == user_data.username) | (User.email == user_data.email)
-        ).first()
+        existing_user = self._find_user(
+            "username = :username OR email = :email", username=user_data.username, email=user_data.email
+        )
         
         if existing_user:
             if existing_user.username == user_data.username:
@@ -44,9 +78,6 @@ class FallbackUserService:
         user = None
         
         try:
-            # Create new user with SQL
-            from sqlalchemy.sql import text
-            
             # Хешируем пароль
             temp_user = User()
             temp_user.set_password(user_data.password)
@@ -58,7 +89,7 @@ class FallbackUserService:
                 INSERT INTO users (username, email, hashed_password, balance, is_active, created_at, updated_at) 
                 VALUES (:username, :email, :hashed_password, :balance, :is_active, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
                 RETURNING id
-                """),
+                """).bindparams(bindparam("balance", type_=User.__table__.c.balance.type)),
                 {
                     "username": user_data.username,
                     "email": user_data.email,
@@ -71,7 +102,7 @@ class FallbackUserService:
             user_id = result.scalar_one()
             
             # Получаем пользователя обратно
-            user = self.db.query(User).filter(User.id == user_id).first()
+            user = self.get_user_by_id(user_id)
             
             # Create initial bonus transaction
             transaction = Transaction(
@@ -96,12 +127,21 @@ class FallbackUserService:
 
     def authenticate_user(self, login_data: UserLogin) -> Optional[User]:
         """Authenticate user by username and password"""
-        user = self.db.query(User).filter(User.username == login_data.username).first()
+        user = self.get_user_by_username(login_data.username)
         
         if not user or not user.check_password(login_data.password):
             return None
         
         if not user.is_active:
             raise HTTPException(status_code=400, detail="User account is disabled")
-        
+
+        # Upgrade the hash while the plaintext is at hand
+        if user.password_needs_rehash():
+            user.set_password(login_data.password)
+            self.db.execute(
+                text("UPDATE users SET hashed_password = :hashed_password WHERE id = :id"),
+                {"hashed_password": user.hashed_password, "id": user.id}
+            )
+            self.db.commit()
+
         return user
\ No newline at end of file
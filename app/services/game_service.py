@@ -1,18 +1,276 @@
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from ..models.user import User
 from ..models.game_session import GameSession
-from ..models.transaction import TransactionType
-from ..services.user_service import UserService
-from ..schemas.game import GameSessionCreate
+from ..models.user_game_stats import ALL_GAMES
+from ..models.transaction import Transaction, TransactionType, TransactionStatus
+from ..services.user_service import UserService, AsyncUserService, balance_rejected, duplicate_settlement
+from ..services.stats_service import GameStatsService, AsyncGameStatsService
+from ..pagination import count_rows, keyset_page
+from ..partitions import recent_history_since
+from ..ledger import LedgerEntry, ledger_writer
+from ..idempotency import current_idempotency_key
+from ..metrics import game_paid_cents, game_rounds, game_settle_seconds, game_wagered_cents
+from ..schemas.game import GameSessionCreate, GameSessionResponse
+from ..serialization import row_dicts, schema_columns
 from decimal import Decimal
-from typing import Dict, Any
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence, Tuple, Union
+from Games import money
+from Games.money import Money
+import time
+
+
+# History lists leave the game_data blob out unless asked, the detail endpoint has it
+GAME_HISTORY_LIST_FIELDS = tuple(name for name in GameSessionResponse.model_fields if name != "game_data")
+
+
+class GameSettlement(NamedTuple):
+    """Result of settling one game round"""
+    session: Optional[GameSession]  # None when the ledger writer writes it behind
+    balance: Decimal
+
+
+class GameRound(NamedTuple):
+    """One played round waiting to be settled"""
+    bet: Money
+    winnings: Money
+    game_data: Dict[str, Any]
+
+
+class BatchSettlement(NamedTuple):
+    """Result of settling several rounds at once"""
+    session_ids: List[int]  # Empty when the ledger writer writes them behind
+    balance: Decimal
+
+
+def settlement_rows(user_id: int, game_type: str, bet: Money, won: Money,
+                    game_data: Optional[Dict[str, Any]], new_balance: Decimal,
+                    reference_id: Optional[str] = None) -> Tuple[GameSession, List[Transaction]]:
+    """Builds the session and its BET/WIN ledger rows for one settled round; the BET row carries reference_id"""
+    net = won - bet
+    balance_after = Money.from_decimal(new_balance)
+    balance_before = balance_after - net
+    balance_after_bet = balance_before - bet
+
+    game_session = GameSession(
+        user_id=user_id,
+        game_type=game_type,
+        bet_amount=bet.to_decimal(),
+        win_amount=won.to_decimal(),
+        net_result=net.to_decimal(),
+        game_data=game_data
+    )
+    ledger = [
+        Transaction(
+            user_id=user_id,
+            type=TransactionType.BET,
+            status=TransactionStatus.COMPLETED,
+            amount=bet.to_decimal(),
+            balance_before=balance_before.to_decimal(),
+            balance_after=balance_after_bet.to_decimal(),
+            description=f"Bet for {game_type}",
+            game_session=game_session,
+            reference_id=reference_id
+        )
+    ]
+    if won > 0:
+        ledger.append(Transaction(
+            user_id=user_id,
+            type=TransactionType.WIN,
+            status=TransactionStatus.COMPLETED,
+            amount=won.to_decimal(),
+            balance_before=balance_after_bet.to_decimal(),
+            balance_after=balance_after.to_decimal(),
+            description=f"Win from {game_type}",
+            game_session=game_session
+        ))
+    return game_session, ledger
+
+
+def batch_requirement(rounds: Sequence[GameRound]) -> Tuple[Money, Money]:
+    """Returns the balance needed before a batch so every bet is covered when placed, and the batch's net result"""
+    if not rounds:
+        raise HTTPException(status_code=400, detail="No rounds to settle")
+
+    required = money.ZERO
+    net_so_far = money.ZERO
+    for game_round in rounds:
+        required = max(required, game_round.bet - net_so_far)
+        net_so_far += game_round.winnings - game_round.bet
+    return required, net_so_far
+
+
+def batch_totals(rounds: Sequence[GameRound]) -> Tuple[Decimal, Decimal]:
+    """Total bet and total winnings of a batch, for the stats rollup"""
+    bet = sum((game_round.bet for game_round in rounds), money.ZERO)
+    won = sum((game_round.winnings for game_round in rounds), money.ZERO)
+    return bet.to_decimal(), won.to_decimal()
+
+
+def batch_session_rows(user_id: int, game_type: str, rounds: Sequence[GameRound]) -> List[Dict[str, Any]]:
+    """Builds bulk INSERT parameters for a batch's game sessions"""
+    return [
+        {
+            "user_id": user_id,
+            "game_type": game_type,
+            "bet_amount": game_round.bet.to_decimal(),
+            "win_amount": game_round.winnings.to_decimal(),
+            "net_result": (game_round.winnings - game_round.bet).to_decimal(),
+            "game_data": game_round.game_data,
+        }
+        for game_round in rounds
+    ]
+
+
+def batch_ledger_rows(user_id: int, game_type: str, rounds: Sequence[GameRound],
+                      session_ids: Sequence[int], starting_balance: Decimal,
+                      reference_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Builds bulk INSERT parameters for a batch's BET/WIN ledger rows, tracking the running balance.
+
+    The first BET row carries reference_id, tying the whole batch to one request.
+    """
+    balance = Money.from_decimal(starting_balance)
+    ledger = []
+    for session_id, game_round in zip(session_ids, rounds):
+        balance_after_bet = balance - game_round.bet
+        ledger.append({
+            "user_id": user_id,
+            "type": TransactionType.BET,
+            "status": TransactionStatus.COMPLETED,
+            "amount": game_round.bet.to_decimal(),
+            "balance_before": balance.to_decimal(),
+            "balance_after": balance_after_bet.to_decimal(),
+            "description": f"Bet for {game_type}",
+            "game_session_id": session_id,
+            "reference_id": None if ledger else reference_id,
+        })
+        balance = balance_after_bet + game_round.winnings
+        if game_round.winnings > 0:
+            ledger.append({
+                "user_id": user_id,
+                "type": TransactionType.WIN,
+                "status": TransactionStatus.COMPLETED,
+                "amount": game_round.winnings.to_decimal(),
+                "balance_before": balance_after_bet.to_decimal(),
+                "balance_after": balance.to_decimal(),
+                "description": f"Win from {game_type}",
+                "game_session_id": session_id,
+                "reference_id": None,
+            })
+    return ledger
+
+
+def ledger_rounds(rounds: Sequence[GameRound]) -> List[Tuple[int, int, Optional[Dict[str, Any]]]]:
+    """Rounds in the journal-friendly shape the ledger writer takes"""
+    return [(game_round.bet.cents, game_round.winnings.cents, game_round.game_data) for game_round in rounds]
+
+
+# Bulk insert of sessions handing back their ids in parameter order
+SESSION_INSERT = insert(GameSession).returning(GameSession.id, sort_by_parameter_order=True)
+
+# Status and detail when the balance guard fails for a user who exists
+INSUFFICIENT_BALANCE = (400, "Insufficient balance")
+BATCH_BALANCE_CHANGED = (409, "Balance changed during batch, please retry")
+
+
+def settlement_error(error: Exception, failure: str) -> HTTPException:
+    """The HTTP error a failed settlement is reported as, after the caller rolled back"""
+    if isinstance(error, HTTPException):
+        return error
+    if isinstance(error, IntegrityError):
+        return duplicate_settlement(error, failure)
+    return HTTPException(status_code=500, detail=f"{failure}: {str(error)}")
+
+
+class Settlement(NamedTuple):
+    """Rounds about to be settled for a user, with everything GameService and
+    AsyncGameService need worked out up front: the balance guard, the stats
+    delta and the rows to write. The services only execute and commit.
+    """
+    user_id: int
+    game_type: str
+    rounds: Sequence[GameRound]
+    required: Money  # Balance needed before the first round
+    net: Money
+    started: float  # perf_counter() reading, for the settle latency metric
+
+    @classmethod
+    def of(cls, user_id: int, game_type: str, rounds: Sequence[GameRound]) -> "Settlement":
+        required, net = batch_requirement(rounds)
+        return cls(user_id, game_type, rounds, required, net, time.perf_counter())
+
+    def balance_delta(self) -> Tuple[Decimal, Decimal]:
+        """Arguments for apply_balance_delta after the user id: amount and required balance"""
+        return self.net.to_decimal(), self.required.to_decimal()
+
+    def stats_delta(self) -> Tuple[int, str, Decimal, Decimal, int]:
+        """Arguments for the stats services' record()"""
+        return (self.user_id, self.game_type, *batch_totals(self.rounds), len(self.rounds))
+
+    def starting_balance(self, new_balance: Decimal) -> Decimal:
+        return new_balance - self.net.to_decimal()
+
+    def ledger_entry(self, new_balance: Decimal) -> Tuple[int, str, List[Tuple[int, int, Optional[Dict[str, Any]]]], Decimal]:
+        """Arguments for ledger_writer.journal"""
+        return self.user_id, self.game_type, ledger_rounds(self.rounds), self.starting_balance(new_balance)
+
+    def session_objects(self, new_balance: Decimal) -> Tuple[GameSession, List[Transaction]]:
+        """The ORM session and ledger rows of a single-round settlement"""
+        game_round = self.rounds[0]
+        return settlement_rows(self.user_id, self.game_type, game_round.bet, game_round.winnings,
+                               game_round.game_data, new_balance, reference_id=current_idempotency_key())
+
+    def session_rows(self) -> List[Dict[str, Any]]:
+        """SESSION_INSERT parameters"""
+        return batch_session_rows(self.user_id, self.game_type, self.rounds)
+
+    def ledger_rows(self, session_ids: Sequence[int], new_balance: Decimal) -> List[Dict[str, Any]]:
+        """insert(Transaction) parameters for the sessions SESSION_INSERT returned"""
+        return batch_ledger_rows(self.user_id, self.game_type, self.rounds, session_ids,
+                                 self.starting_balance(new_balance), reference_id=current_idempotency_key())
+
+    def record_metrics(self) -> None:
+        """Feeds the settled rounds into the per-game metrics"""
+        game_settle_seconds.observe(time.perf_counter() - self.started, game=self.game_type)
+        game_rounds.inc(len(self.rounds), game=self.game_type)
+        game_wagered_cents.inc(sum(game_round.bet.cents for game_round in self.rounds), game=self.game_type)
+        game_paid_cents.inc(sum(game_round.winnings.cents for game_round in self.rounds), game=self.game_type)
+
+
+def write_ledger_entries(db: Session, entries: Sequence[LedgerEntry]) -> None:
+    """Bulk inserts the session and BET/WIN rows of write-behind ledger entries; does not commit"""
+    settled = [
+        (entry, [GameRound(Money(bet), Money(won), game_data) for bet, won, game_data in entry.rounds])
+        for entry in entries
+    ]
+    session_ids = iter(db.scalars(
+        SESSION_INSERT,
+        [
+            {**row, "created_at": entry.settled_at}
+            for entry, rounds in settled
+            for row in batch_session_rows(entry.user_id, entry.game_type, rounds)
+        ]
+    ).all())
+
+    ledger = []
+    for entry, rounds in settled:
+        entry_session_ids = [next(session_ids) for _ in rounds]
+        ledger.extend(
+            {**row, "created_at": entry.settled_at}
+            for row in batch_ledger_rows(entry.user_id, entry.game_type, rounds,
+                                         entry_session_ids, entry.starting_balance)
+        )
+    db.execute(insert(Transaction), ledger)
 
 
 class GameService:
     def __init__(self, db: Session):
         self.db = db
         self.user_service = UserService(db)
+        self.stats_service = GameStatsService(db)
 
     def start_game_session(self, user_id: int, game_type: str, bet_amount: Decimal) -> GameSession:
         """Start a new game session and deduct bet from user balance"""
@@ -44,6 +302,7 @@ class GameService:
                 description=f"Bet for {game_type}",
                 game_session_id=game_session.id
             )
+            self.stats_service.record(user_id, game_type, bet_amount, Decimal('0.00'))
 
             return game_session
         except Exception as e:
@@ -58,6 +317,7 @@ class GameService:
             raise HTTPException(status_code=404, detail="Game session not found")
 
         # Update game session
+        win_delta = win_amount - game_session.win_amount
         game_session.win_amount = win_amount
         game_session.net_result = win_amount - game_session.bet_amount
         game_session.game_data = game_data
@@ -72,6 +332,9 @@ class GameService:
                     description=f"Win from {game_session.game_type}",
                     game_session_id=session_id
                 )
+            self.stats_service.record(
+                game_session.user_id, game_session.game_type, Decimal('0.00'), win_delta, games=0
+            )
 
             self.db.commit()
             self.db.refresh(game_session)
@@ -80,89 +343,188 @@ class GameService:
             self.db.rollback()
             raise HTTPException(status_code=500, detail="Failed to complete game session")
 
-    def create_game_session(self, user_id: int, game_type: str, bet_amount: Decimal, 
-                          winnings: Decimal, game_data: Dict[str, Any] = None) -> GameSession:
-        """Create a complete game session in one step"""
-        user = self.user_service.get_user_by_id(user_id)
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
+    def _debit(self, settlement: Settlement, rejection: Tuple[int, str]) -> Decimal:
+        """Applies the settlement to the balance under its guard and to the stats; does not commit"""
+        new_balance = self.user_service.apply_balance_delta(settlement.user_id, *settlement.balance_delta())
+        if new_balance is None:
+            raise balance_rejected(self.user_service.get_user_by_id(settlement.user_id), rejection)
+        self.stats_service.record(*settlement.stats_delta())
+        return new_balance
 
-        if user.balance < bet_amount:
-            raise HTTPException(status_code=400, detail="Insufficient balance")
+    def _write_behind(self, settlement: Settlement, new_balance: Decimal) -> None:
+        """Commits the balance with the settlement's rows journaled first, then hands them to the writer"""
+        entry = ledger_writer.journal(*settlement.ledger_entry(new_balance))
+        try:
+            self.db.commit()
+        except BaseException:
+            ledger_writer.discard(entry)
+            raise
+        ledger_writer.wait(ledger_writer.submit(entry))
 
-        # Create game session
-        game_session = GameSession(
-            user_id=user_id,
-            game_type=game_type,
-            bet_amount=bet_amount,
-            win_amount=winnings,
-            net_result=winnings - bet_amount,
-            game_data=game_data
-        )
+    def create_game_session(self, user_id: int, game_type: str, bet_amount: Union[Money, Decimal],
+                          winnings: Union[Money, Decimal], game_data: Dict[str, Any] = None) -> GameSettlement:
+        """Settle a complete game round in a single transaction.
 
+        The net amount is applied with one conditional UPDATE, the session and its
+        BET/WIN ledger rows are inserted in the same flush, and everything is
+        committed once. Returns the session together with the new balance so
+        callers don't need to refresh the user. Amounts may be Money or Decimal;
+        the ledger arithmetic is done in integer cents.
+        """
+        settlement = Settlement.of(user_id, game_type,
+                                   [GameRound(Money.coerce(bet_amount), Money.coerce(winnings), game_data)])
         try:
-            self.db.add(game_session)
-            self.db.flush()  # Get the ID without committing
+            new_balance = self._debit(settlement, INSUFFICIENT_BALANCE)
+            if ledger_writer.running:
+                self._write_behind(settlement, new_balance)
+                result = GameSettlement(session=None, balance=new_balance)
+            else:
+                game_session, ledger = settlement.session_objects(new_balance)
+                self.db.add(game_session)
+                self.db.add_all(ledger)
+                self.db.commit()
+                result = GameSettlement(session=game_session, balance=ledger[-1].balance_after)
+        except Exception as e:
+            self.db.rollback()
+            raise settlement_error(e, "Failed to create game session")
+        settlement.record_metrics()
+        return result
 
-            # Create bet transaction
-            self.user_service.update_balance(
-                user_id=user_id,
-                amount=-bet_amount,
-                transaction_type=TransactionType.BET,
-                description=f"Bet for {game_type}",
-                game_session_id=game_session.id
-            )
+    def create_game_sessions(self, user_id: int, game_type: str,
+                             rounds: Sequence[GameRound]) -> BatchSettlement:
+        """Settle a sequence of rounds in a single transaction.
 
-            # Create win transaction if there are winnings
-            if winnings > 0:
-                self.user_service.update_balance(
-                    user_id=user_id,
-                    amount=winnings,
-                    transaction_type=TransactionType.WIN,
-                    description=f"Win from {game_type}",
-                    game_session_id=game_session.id
-                )
-
-            self.db.commit()
-            self.db.refresh(game_session)
-            return game_session
+        Rounds are settled in order as if played one by one: the balance guard
+        is the largest amount the sequence ever needs up front, so the same
+        compare-and-update as create_game_session keeps the balance from going
+        negative at any step. Sessions and ledger rows are bulk inserted.
+        """
+        settlement = Settlement.of(user_id, game_type, rounds)
+        try:
+            new_balance = self._debit(settlement, BATCH_BALANCE_CHANGED)
+            session_ids = []
+            if ledger_writer.running:
+                self._write_behind(settlement, new_balance)
+            else:
+                session_ids = list(self.db.scalars(SESSION_INSERT, settlement.session_rows()).all())
+                self.db.execute(insert(Transaction), settlement.ledger_rows(session_ids, new_balance))
+                self.db.commit()
         except Exception as e:
             self.db.rollback()
-            raise HTTPException(status_code=500, detail=f"Failed to create game session: {str(e)}")
+            raise settlement_error(e, "Failed to settle game rounds")
+        settlement.record_metrics()
+        return BatchSettlement(session_ids=session_ids, balance=new_balance)
 
-    def get_user_game_history(self, user_id: int, page: int = 1, per_page: int = 20):
-        """Get user's game history with pagination"""
-        offset = (page - 1) * per_page
-        
-        sessions = self.db.query(GameSession).filter(
-            GameSession.user_id == user_id
-        ).order_by(GameSession.created_at.desc()).offset(offset).limit(per_page).all()
+    def get_user_game_history(self, user_id: int, cursor: Optional[str] = None, per_page: int = 20,
+                              include_total: bool = False, include_older: bool = False,
+                              fields: Sequence[str] = GAME_HISTORY_LIST_FIELDS):
+        """Get user's game history, newest first, one keyset page at a time.
 
-        total_count = self.db.query(GameSession).filter(
+        Only the last HISTORY_WINDOW_DAYS are read unless include_older is set.
+        Sessions come back as plain dicts of just the given GameSessionResponse
+        fields, which must include the cursor's id and created_at.
+        """
+        if ledger_writer.running:
+            # Read your own rounds even if their rows are still queued
+            ledger_writer.fence()
+        since = recent_history_since(include_older)
+        statement = select(*schema_columns(GameSession, GameSessionResponse, fields)).where(
             GameSession.user_id == user_id
-        ).count()
+        )
+        page = keyset_page(self.db, statement, GameSession, cursor, per_page, since)
+
+        # Counting every session is the expensive part for heavy players, so it's opt-in
+        total_count = None
+        if include_total:
+            if since is not None:
+                statement = statement.where(GameSession.created_at >= since)
+            total_count = count_rows(self.db, statement)
 
         return {
-            "sessions": sessions,
+            "sessions": row_dicts(page.items),
+            "next_cursor": page.next_cursor,
             "total_count": total_count,
-            "page": page,
             "per_page": per_page
         }
 
-    def get_user_stats(self, user_id: int) -> Dict[str, Any]:
-        """Get user's gaming statistics"""
-        from sqlalchemy import func
-        
-        stats = self.db.query(
-            func.count(GameSession.id).label('total_games'),
-            func.sum(GameSession.bet_amount).label('total_bet'),
-            func.sum(GameSession.win_amount).label('total_won'),
-            func.sum(GameSession.net_result).label('net_result')
-        ).filter(GameSession.user_id == user_id).first()
+    def get_user_game_session(self, user_id: int, session_id: int) -> Dict[str, Any]:
+        """One of the user's game sessions with its game_data, as a GameSessionResponse dict"""
+        if ledger_writer.running:
+            ledger_writer.fence()
+        row = self.db.execute(
+            select(*schema_columns(GameSession, GameSessionResponse))
+            .where(GameSession.id == session_id, GameSession.user_id == user_id)
+        ).first()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Game session not found")
+        return row._asdict()
 
-        return {
-            "total_games": stats.total_games or 0,
-            "total_bet": float(stats.total_bet or 0),
-            "total_won": float(stats.total_won or 0),
-            "net_result": float(stats.net_result or 0)
-        }
\ No newline at end of file
+    def get_user_stats(self, user_id: int, game_type: str = ALL_GAMES) -> Dict[str, Any]:
+        """Get user's gaming statistics, overall or for one game type"""
+        return self.stats_service.get_stats(user_id, game_type)
+
+
+class AsyncGameService:
+    """Async counterpart of GameService's settlement methods for the game request path"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.user_service = AsyncUserService(db)
+        self.stats_service = AsyncGameStatsService(db)
+
+    async def _debit(self, settlement: Settlement, rejection: Tuple[int, str]) -> Decimal:
+        new_balance = await self.user_service.apply_balance_delta(settlement.user_id, *settlement.balance_delta())
+        if new_balance is None:
+            raise balance_rejected(await self.user_service.get_user_by_id(settlement.user_id), rejection)
+        await self.stats_service.record(*settlement.stats_delta())
+        return new_balance
+
+    async def _write_behind(self, settlement: Settlement, new_balance: Decimal) -> None:
+        entry = ledger_writer.journal(*settlement.ledger_entry(new_balance))
+        try:
+            await self.db.commit()
+        except BaseException:  # Cancellation included, or later entries would wait on this one forever
+            ledger_writer.discard(entry)
+            raise
+        await ledger_writer.wait_async(ledger_writer.submit(entry))
+
+    async def create_game_session(self, user_id: int, game_type: str, bet_amount: Union[Money, Decimal],
+                                  winnings: Union[Money, Decimal], game_data: Dict[str, Any] = None) -> GameSettlement:
+        """Settle a complete game round in a single transaction (see GameService.create_game_session)"""
+        settlement = Settlement.of(user_id, game_type,
+                                   [GameRound(Money.coerce(bet_amount), Money.coerce(winnings), game_data)])
+        try:
+            new_balance = await self._debit(settlement, INSUFFICIENT_BALANCE)
+            if ledger_writer.running:
+                await self._write_behind(settlement, new_balance)
+                result = GameSettlement(session=None, balance=new_balance)
+            else:
+                game_session, ledger = settlement.session_objects(new_balance)
+                self.db.add(game_session)
+                self.db.add_all(ledger)
+                await self.db.commit()
+                result = GameSettlement(session=game_session, balance=ledger[-1].balance_after)
+        except Exception as e:
+            await self.db.rollback()
+            raise settlement_error(e, "Failed to create game session")
+        settlement.record_metrics()
+        return result
+
+    async def create_game_sessions(self, user_id: int, game_type: str,
+                                   rounds: Sequence[GameRound]) -> BatchSettlement:
+        """Settle a sequence of rounds in a single transaction (see GameService.create_game_sessions)"""
+        settlement = Settlement.of(user_id, game_type, rounds)
+        try:
+            new_balance = await self._debit(settlement, BATCH_BALANCE_CHANGED)
+            session_ids = []
+            if ledger_writer.running:
+                await self._write_behind(settlement, new_balance)
+            else:
+                session_ids = list((await self.db.scalars(SESSION_INSERT, settlement.session_rows())).all())
+                await self.db.execute(insert(Transaction), settlement.ledger_rows(session_ids, new_balance))
+                await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise settlement_error(e, "Failed to settle game rounds")
+        settlement.record_metrics()
+        return BatchSettlement(session_ids=session_ids, balance=new_balance)
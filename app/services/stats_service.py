@@ -0,0 +1,209 @@
+from sqlalchemy import String, and_, delete, func, literal, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from ..models.user import User
+from ..models.game_session import GameSession
+from ..models.user_game_stats import UserGameStats, ArchivedGameStats, ALL_GAMES
+from decimal import Decimal
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+TOTAL_COLUMNS = ("total_games", "total_bet", "total_won", "net_result")
+CENTS = Decimal("0.01")
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+_UPSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class StatsMismatch(NamedTuple):
+    """A rollup row that disagrees with the game_sessions it summarises (None = row missing)"""
+    user_id: int
+    game_type: str
+    expected: Optional[Tuple[int, Decimal, Decimal, Decimal]]
+    actual: Optional[Tuple[int, Decimal, Decimal, Decimal]]
+
+
+def stats_delta_statement(dialect_name: str, user_id: int, game_type: str,
+                          bet: Decimal, won: Decimal, games: int = 1):
+    """Builds the upsert adding settled games to a user's game_type and all-games rows.
+
+    The increment happens inside the UPDATE, so concurrent settlements add up
+    instead of overwriting each other. Shared by the sync and async services.
+    """
+    if dialect_name not in _UPSERTS:
+        raise ValueError(f"Game stats rollup not supported on database backend '{dialect_name}'")
+
+    table = UserGameStats.__table__
+    statement = _UPSERTS[dialect_name](UserGameStats).values([
+        {
+            "user_id": user_id,
+            "game_type": row_game_type,
+            "total_games": games,
+            "total_bet": bet,
+            "total_won": won,
+            "net_result": won - bet,
+        }
+        for row_game_type in (game_type, ALL_GAMES)
+    ])
+    increments = {name: table.c[name] + statement.excluded[name] for name in TOTAL_COLUMNS}
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.game_type],
+        set_={**increments, "updated_at": func.now()},
+    )
+
+
+def session_totals_query(user_ids: List[int]):
+    """Per game type and all-games totals from game_sessions plus archived months, shaped like user_game_stats"""
+    live = (
+        select(
+            GameSession.user_id,
+            GameSession.game_type,
+            func.count(GameSession.id).label("total_games"),
+            func.sum(GameSession.bet_amount).label("total_bet"),
+            func.sum(GameSession.win_amount).label("total_won"),
+            func.sum(GameSession.net_result).label("net_result"),
+        )
+        .where(GameSession.user_id.in_(user_ids))
+        .group_by(GameSession.user_id, GameSession.game_type)
+    )
+    archived = (
+        select(ArchivedGameStats.user_id, ArchivedGameStats.game_type,
+               *(getattr(ArchivedGameStats, name) for name in TOTAL_COLUMNS))
+        .where(ArchivedGameStats.user_id.in_(user_ids))
+    )
+    combined = union_all(live, archived).subquery("combined")
+
+    totals = (
+        func.sum(combined.c.total_games).label("total_games"),
+        *(func.coalesce(func.sum(combined.c[name]), 0).label(name) for name in TOTAL_COLUMNS[1:]),
+    )
+    per_game = (
+        select(combined.c.user_id, combined.c.game_type, *totals)
+        .group_by(combined.c.user_id, combined.c.game_type)
+    )
+    all_games = (
+        select(combined.c.user_id, literal(ALL_GAMES, String(50)).label("game_type"), *totals)
+        .group_by(combined.c.user_id)
+    )
+    return union_all(per_game, all_games)
+
+
+def _totals(row) -> Tuple[int, Decimal, Decimal, Decimal]:
+    return (
+        int(row[0]),
+        *(Decimal(str(value)).quantize(CENTS) for value in row[1:]),
+    )
+
+
+class GameStatsService:
+    """Reads, rebuilds and verifies the user_game_stats rollup"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record(self, user_id: int, game_type: str, bet: Decimal, won: Decimal, games: int = 1) -> None:
+        """Adds settled games to the rollup; runs in, and commits with, the caller's transaction"""
+        dialect_name = self.db.get_bind().dialect.name
+        self.db.execute(stats_delta_statement(dialect_name, user_id, game_type, bet, won, games))
+
+    def get_stats(self, user_id: int, game_type: str = ALL_GAMES) -> Dict[str, Any]:
+        """A user's totals for one game type (default: all games) by primary key"""
+        stats = self.db.get(UserGameStats, (user_id, game_type))
+        if stats is None:
+            return {"total_games": 0, "total_bet": 0.0, "total_won": 0.0, "net_result": 0.0}
+
+        return {
+            "total_games": stats.total_games,
+            "total_bet": float(stats.total_bet),
+            "total_won": float(stats.total_won),
+            "net_result": float(stats.net_result)
+        }
+
+    def _user_id_batches(self, user_id: Optional[int], batch_size: int):
+        if user_id is not None:
+            yield [user_id]
+            return
+
+        last_id = 0
+        while True:
+            batch = self.db.scalars(
+                select(User.id).where(User.id > last_id).order_by(User.id).limit(batch_size)
+            ).all()
+            if not batch:
+                return
+            yield batch
+            last_id = batch[-1]
+
+    def rebuild(self, user_id: Optional[int] = None, batch_size: int = 500) -> int:
+        """Recomputes the rollup from game_sessions (and archived totals) for one user, or every user in batches.
+
+        Each batch locks its users' rows first, which settlement also updates
+        first, so no round can be settled for them between the recount and the
+        commit. Returns the number of users rebuilt.
+        """
+        rebuilt = 0
+        for user_ids in self._user_id_batches(user_id, batch_size):
+            try:
+                self.db.execute(select(User.id).where(User.id.in_(user_ids)).with_for_update())
+                self.db.execute(delete(UserGameStats).where(UserGameStats.user_id.in_(user_ids)))
+                self.db.execute(
+                    UserGameStats.__table__.insert().from_select(
+                        ["user_id", "game_type", *TOTAL_COLUMNS], session_totals_query(user_ids)
+                    )
+                )
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+            rebuilt += len(user_ids)
+        return rebuilt
+
+    def check(self, user_id: Optional[int] = None, batch_size: int = 500) -> List[StatsMismatch]:
+        """Compares the rollup with totals recomputed from game_sessions; empty means consistent"""
+        mismatches = []
+        for user_ids in self._user_id_batches(user_id, batch_size):
+            expected = session_totals_query(user_ids).subquery("expected")
+            # One statement per direction, so each side is read from the same snapshot
+            missing_or_wrong = self.db.execute(
+                select(
+                    expected.c.user_id, expected.c.game_type,
+                    *(expected.c[name] for name in TOTAL_COLUMNS),
+                    *(getattr(UserGameStats, name) for name in TOTAL_COLUMNS),
+                    UserGameStats.user_id.label("stats_user_id"),
+                ).outerjoin(UserGameStats, and_(
+                    UserGameStats.user_id == expected.c.user_id,
+                    UserGameStats.game_type == expected.c.game_type,
+                ))
+            ).all()
+            for row in missing_or_wrong:
+                want = _totals(row[2:6])
+                have = _totals(row[6:10]) if row.stats_user_id is not None else None
+                if want != have:
+                    mismatches.append(StatsMismatch(row.user_id, row.game_type, want, have))
+
+            orphans = self.db.execute(
+                select(UserGameStats.user_id, UserGameStats.game_type,
+                       *(getattr(UserGameStats, name) for name in TOTAL_COLUMNS))
+                .outerjoin(expected, and_(
+                    UserGameStats.user_id == expected.c.user_id,
+                    UserGameStats.game_type == expected.c.game_type,
+                ))
+                .where(UserGameStats.user_id.in_(user_ids), expected.c.user_id.is_(None))
+            ).all()
+            mismatches.extend(
+                StatsMismatch(row.user_id, row.game_type, None, _totals(row[2:]))
+                for row in orphans
+            )
+            self.db.rollback()
+        return mismatches
+
+
+class AsyncGameStatsService:
+    """Async counterpart of GameStatsService.record for the game request path"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record(self, user_id: int, game_type: str, bet: Decimal, won: Decimal, games: int = 1) -> None:
+        dialect_name = self.db.get_bind().dialect.name
+        await self.db.execute(stats_delta_statement(dialect_name, user_id, game_type, bet, won, games))
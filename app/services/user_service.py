@@ -1,11 +1,51 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from ..models.user import User
+from ..idempotency import current_idempotency_key
+from ..principals import principal_cache
+from ..metrics import balance_updates
 from ..models.transaction import Transaction, TransactionType, TransactionStatus
 from ..schemas.user import UserCreate, UserLogin
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Tuple
+
+
+def balance_delta_statement(user_id: int, amount: Decimal, required_balance: Decimal = None):
+    """Builds the guarded balance UPDATE shared by the sync and async services.
+
+    Disabled accounts never match, whatever principal another worker still
+    has cached for them.
+    """
+    if required_balance is None:
+        required_balance = -amount
+
+    return (
+        update(User)
+        .where(User.id == user_id, User.is_active, User.balance >= required_balance)
+        .values(balance=User.balance + amount)
+        .returning(User.balance)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def balance_rejected(user: Optional[User], rejection: Tuple[int, str]) -> HTTPException:
+    """Why a guarded balance update matched no row, given the user as reloaded afterwards"""
+    if user is None:
+        return HTTPException(status_code=404, detail="User not found")
+    if not user.is_active:
+        return HTTPException(status_code=400, detail="Inactive user")
+    status_code, detail = rejection
+    return HTTPException(status_code=status_code, detail=detail)
+
+
+def duplicate_settlement(error: IntegrityError, failure: str) -> HTTPException:
+    """Maps a reference_id unique violation under an Idempotency-Key to 409; anything else is a 500"""
+    if current_idempotency_key() is not None:
+        return HTTPException(status_code=409, detail="This Idempotency-Key was already settled")
+    return HTTPException(status_code=500, detail=f"{failure}: {str(error)}")
 
 
 class UserService:
@@ -62,7 +102,12 @@ class UserService:
         
         if not user.is_active:
             raise HTTPException(status_code=400, detail="User account is disabled")
-        
+
+        # Upgrade the hash while the plaintext is at hand
+        if user.password_needs_rehash():
+            user.set_password(login_data.password)
+            self.db.commit()
+
         return user
 
     def get_user_by_id(self, user_id: int) -> Optional[User]:
@@ -73,21 +118,48 @@ class UserService:
         """Get user by username"""
         return self.db.query(User).filter(User.username == username).first()
 
-    def update_balance(self, user_id: int, amount: Decimal, transaction_type: TransactionType, 
-                      description: str = None, game_session_id: int = None) -> Transaction:
-        """Update user balance and create transaction record"""
+    def apply_balance_delta(self, user_id: int, amount: Decimal,
+                            required_balance: Decimal = None) -> Optional[Decimal]:
+        """Atomically add amount to the user's balance if the guard holds.
+
+        Runs a single compare-and-update:
+        UPDATE users SET balance = balance + :amount
+        WHERE id = :id AND is_active AND balance >= :required RETURNING balance
+
+        required_balance defaults to -amount, i.e. the balance may never go
+        negative. Returns the new balance, or None if the user doesn't exist, is
+        disabled or the guard failed. Does not commit.
+        """
+        new_balance = self.db.execute(balance_delta_statement(user_id, amount, required_balance)).scalar_one_or_none()
+        if new_balance is not None:
+            principal_cache.balance_changed(user_id)
+        balance_updates.inc(result="rejected" if new_balance is None else "applied")
+        return new_balance
+
+    def get_balance(self, user_id: int) -> Optional[Decimal]:
+        """Get the user's current balance without loading the full row"""
+        return self.db.execute(select(User.balance).where(User.id == user_id)).scalar_one_or_none()
+
+    def set_active(self, user_id: int, is_active: bool) -> User:
+        """Enable or disable a user account"""
         user = self.get_user_by_id(user_id)
-        if not user:
+        if user is None:
             raise HTTPException(status_code=404, detail="User not found")
 
-        balance_before = user.balance
-        
-        # Check if user has sufficient balance for negative transactions
-        if amount < 0 and user.balance + amount < 0:
-            raise HTTPException(status_code=400, detail="Insufficient balance")
+        user.is_active = is_active
+        self.db.commit()
+        # Cached principals must not outlive a disabled account
+        principal_cache.invalidate(user_id)
+        return user
 
-        user.balance += amount
-        balance_after = user.balance
+    def update_balance(self, user_id: int, amount: Decimal, transaction_type: TransactionType, 
+                      description: str = None, game_session_id: int = None) -> Transaction:
+        """Update user balance and create transaction record"""
+        balance_after = self.apply_balance_delta(user_id, amount)
+        if balance_after is None:
+            raise balance_rejected(self.get_user_by_id(user_id), (400, "Insufficient balance"))
+
+        balance_before = balance_after - amount
 
         # Create transaction record
         transaction = self._create_transaction(
@@ -97,14 +169,16 @@ class UserService:
             balance_before=balance_before,
             balance_after=balance_after,
             description=description,
-            game_session_id=game_session_id
+            game_session_id=game_session_id,
+            reference_id=current_idempotency_key()
         )
 
         try:
             self.db.commit()
-            self.db.refresh(user)
-            self.db.refresh(transaction)
             return transaction
+        except IntegrityError as e:
+            self.db.rollback()
+            raise duplicate_settlement(e, "Balance update failed")
         except Exception as e:
             self.db.rollback()
             raise HTTPException(status_code=500, detail="Balance update failed")
@@ -129,7 +203,8 @@ class UserService:
 
     def _create_transaction(self, user_id: int, transaction_type: TransactionType, 
                           amount: Decimal, balance_before: Decimal, balance_after: Decimal,
-                          description: str = None, game_session_id: int = None) -> Transaction:
+                          description: str = None, game_session_id: int = None,
+                          reference_id: str = None) -> Transaction:
         """Create a transaction record"""
         transaction = Transaction(
             user_id=user_id,
@@ -139,8 +214,34 @@ class UserService:
             balance_before=balance_before,
             balance_after=balance_after,
             description=description,
-            game_session_id=game_session_id
+            game_session_id=game_session_id,
+            reference_id=reference_id
         )
         
         self.db.add(transaction)
-        return transaction
\ No newline at end of file
+        return transaction
+
+
+class AsyncUserService:
+    """Async counterpart of UserService for the game request path"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID"""
+        return (await self.db.execute(select(User).where(User.id == user_id))).scalar_one_or_none()
+
+    async def apply_balance_delta(self, user_id: int, amount: Decimal,
+                                  required_balance: Decimal = None) -> Optional[Decimal]:
+        """Atomically add amount to the user's balance if the guard holds (see UserService)"""
+        result = await self.db.execute(balance_delta_statement(user_id, amount, required_balance))
+        new_balance = result.scalar_one_or_none()
+        if new_balance is not None:
+            principal_cache.balance_changed(user_id)
+        balance_updates.inc(result="rejected" if new_balance is None else "applied")
+        return new_balance
+
+    async def get_balance(self, user_id: int) -> Optional[Decimal]:
+        """Get the user's current balance without loading the full row"""
+        return (await self.db.execute(select(User.balance).where(User.id == user_id))).scalar_one_or_none()
@@ -0,0 +1,81 @@
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from typing import Dict, Optional
+import os
+import time
+
+from .metrics import cache_hits, cache_misses
+
+
+def token_digest(token: str) -> bytes:
+    """Cache key for a bearer token, so raw tokens are never kept in memory"""
+    return sha256(token.encode()).digest()
+
+
+class VerifiedTokenCache:
+    """Bounded cache of already-verified bearer tokens: digest -> (sub, exp).
+
+    A hit skips signature verification until the token's own expiry, or for
+    at most recheck_seconds so tokens revoked by another worker are noticed.
+    Revoked digests are remembered until the token's expiry, after which the
+    JWT is rejected by jwt.decode anyway.
+    """
+
+    def __init__(self, max_entries: int = 10000, recheck_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.recheck_seconds = recheck_seconds
+        self._verified: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._revoked: Dict[bytes, float] = {}
+        self._lock = Lock()
+
+    def get(self, digest: bytes) -> Optional[str]:
+        with self._lock:
+            entry = self._verified.get(digest)
+            if entry is None:
+                cache_misses.inc(cache="token")
+                return None
+            sub, exp = entry
+            if exp <= time.time():
+                del self._verified[digest]
+                cache_misses.inc(cache="token")
+                return None
+            self._verified.move_to_end(digest)
+        cache_hits.inc(cache="token")
+        return sub
+
+    def put(self, digest: bytes, sub: str, exp: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if digest in self._revoked:
+                return
+            if self.recheck_seconds is not None:
+                exp = min(exp, time.time() + self.recheck_seconds)
+            self._verified[digest] = (sub, exp)
+            self._verified.move_to_end(digest)
+            while len(self._verified) > self.max_entries:
+                self._verified.popitem(last=False)
+
+    def is_revoked(self, digest: bytes) -> bool:
+        return digest in self._revoked
+
+    def revoke(self, digest: bytes, exp: float) -> None:
+        with self._lock:
+            now = time.time()
+            # Drop revocations for tokens that have expired on their own
+            for expired in [d for d, until in self._revoked.items() if until <= now]:
+                del self._revoked[expired]
+            self._revoked[digest] = exp
+            self._verified.pop(digest, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._verified.clear()
+            self._revoked.clear()
+
+
+token_cache = VerifiedTokenCache(
+    max_entries=int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000")),
+    recheck_seconds=float(os.getenv("TOKEN_REVOCATION_RECHECK_SECONDS", "30")),
+)
@@ -2,18 +2,26 @@ import pytest
 import os
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
+
+# Test database URL (SQLite in memory)
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+
+# The app's own engines (lifespan schema checks, the ledger writer) use the test
+# database too; set before app.db is imported
+os.environ["DATABASE_URL"] = SQLALCHEMY_DATABASE_URL
+os.environ.pop("ASYNC_DATABASE_URL", None)
 
 from app.main import app
-from app.db import get_db
+from app.db import get_db, get_async_db
 from app.models.base import Base
 from app.models.user import User
 from app.models.transaction import Transaction
 from app.models.game_session import GameSession
-
-# Test database URL (SQLite in memory)
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+from app.principals import principal_cache
+from app.tokens import token_cache
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -22,6 +30,16 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async routes reach the same file through aiosqlite. TestClient may run each
+# request on a fresh event loop, so connections are not pooled across requests.
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
 
 def override_get_db():
     try:
@@ -42,15 +60,20 @@ def db_engine():
 @pytest.fixture
 def db_session(db_engine):
     """Create test database session"""
-    connection = db_engine.connect()
-    transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    session = TestingSessionLocal()
     
     yield session
     
+    # Data is committed for real so async routes (separate connections) can see
+    # it; clear every table afterwards instead of rolling back
+    session.rollback()
     session.close()
-    transaction.rollback()
-    connection.close()
+    with db_engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+    # Ids (and so tokens minted in the same second) are reused once tables are cleared
+    principal_cache.clear()
+    token_cache.clear()
 
 
 @pytest.fixture
@@ -63,6 +86,7 @@ def client(db_session):
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     yield TestClient(app)
     app.dependency_overrides.clear()
 
@@ -85,7 +109,7 @@ def test_user(db_session):
 @pytest.fixture
 def auth_headers(client, test_user):
     """Get authentication headers for test user"""
-    response = client.post("/auth/login", json={
+    response = client.post("/api/auth/login", json={
         "username": "testuser",
         "password": "testpassword"
     })
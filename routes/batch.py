@@ -0,0 +1,114 @@
+from fastapi import APIRouter, HTTPException, Depends
+from pydantic import BaseModel, condecimal, conlist
+from sqlalchemy.ext.asyncio import AsyncSession
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Union
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from app.auth import get_current_principal_async
+from app.db import get_async_db
+from app.principals import Principal
+from app.services.game_service import AsyncGameService, GameRound
+from app.services.user_service import AsyncUserService
+from app.idempotency import IdempotentRoute
+from app.games import GAMES, play_round
+from app.serialization import FastJSONResponse
+from Games.money import Money
+
+router = APIRouter(route_class=IdempotentRoute)
+
+MAX_BATCH_ROUNDS = 1000
+
+
+class BatchRound(BaseModel):
+    bet_amount: condecimal(gt=0, decimal_places=2)
+    choice: Optional[Union[int, str]] = None
+
+
+class BatchPlayRequest(BaseModel):
+    rounds: conlist(BatchRound, min_length=1, max_length=MAX_BATCH_ROUNDS)
+
+
+class BatchRoundResult(BaseModel):
+    bet: Decimal
+    winnings: Decimal
+    outcome: Dict[str, Any]
+
+
+class BatchPlayResponse(BaseModel):
+    game: str
+    rounds_requested: int
+    rounds_played: int
+    stopped_early: bool
+    total_bet: Decimal
+    total_won: Decimal
+    net_result: Decimal
+    new_balance: Decimal
+    results: List[BatchRoundResult]
+
+
+@router.post("/{game}/batch", response_model=BatchPlayResponse)
+async def play_batch(
+    game: str,
+    request: BatchPlayRequest,
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Play several rounds of one game and settle them in a single transaction.
+
+    Rounds are played in order with the game's normal rules. Play stops at the
+    first round the running balance can't cover.
+    """
+    batch_game = GAMES.get(game)
+    if batch_game is None:
+        raise HTTPException(status_code=404, detail=f"Game must be one of {sorted(GAMES)}")
+
+    try:
+        # Plan against the stored balance; the settlement guard re-checks it
+        stored_balance = await AsyncUserService(db).get_balance(current_user.id)
+        if stored_balance is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        balance = Money.from_decimal(stored_balance)
+        played: List[GameRound] = []
+        for batch_round in request.rounds:
+            bet = Money.from_decimal(batch_round.bet_amount)
+            if balance < bet:
+                break
+            _, game_round = play_round(batch_game, bet, batch_round.choice)
+            played.append(game_round)
+            balance += game_round.winnings - bet
+
+        if not played:
+            raise HTTPException(status_code=400, detail="Insufficient balance")
+
+        game_service = AsyncGameService(db)
+        settlement = await game_service.create_game_sessions(
+            user_id=current_user.id,
+            game_type=batch_game.game_type,
+            rounds=played
+        )
+
+        total_bet = sum((game_round.bet for game_round in played), Money(0))
+        total_won = sum((game_round.winnings for game_round in played), Money(0))
+        return FastJSONResponse({
+            "game": batch_game.game_type,
+            "rounds_requested": len(request.rounds),
+            "rounds_played": len(played),
+            "stopped_early": len(played) < len(request.rounds),
+            "total_bet": total_bet,
+            "total_won": total_won,
+            "net_result": total_won - total_bet,
+            "new_balance": settlement.balance,
+            "results": [
+                {"bet": game_round.bet, "winnings": game_round.winnings, "outcome": game_round.game_data}
+                for game_round in played
+            ]
+        })
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Game error: {str(e)}")
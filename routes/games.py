@@ -0,0 +1,72 @@
+from fastapi import APIRouter, HTTPException, Depends, Body
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Callable, Optional
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from app.auth import get_current_principal_async
+from app.db import get_async_db
+from app.games import GAMES, GameDefinition, play_round, request_bet, request_choice, round_response
+from app.principals import Principal
+from app.services.game_service import AsyncGameService
+from app.idempotency import IdempotentRoute
+from app.serialization import FastJSONResponse
+from Games.scratch_card_simulator import CARD_COST
+
+router = APIRouter(route_class=IdempotentRoute)
+
+
+async def play_game(game: GameDefinition, request: Optional[BaseModel], user_id: int,
+                    db: AsyncSession) -> FastJSONResponse:
+    """The single-round pipeline every game goes through: play, settle, respond"""
+    try:
+        bet = request_bet(game, request)
+        choice = request_choice(game, request)
+        result, game_round = play_round(game, bet, choice)
+        settlement = await AsyncGameService(db).create_game_session(
+            user_id=user_id,
+            game_type=game.game_type,
+            bet_amount=bet,
+            winnings=game_round.winnings,
+            game_data=game_round.game_data
+        )
+        return FastJSONResponse(round_response(game, result, settlement.balance))
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Game error: {str(e)}")
+
+
+def _play_endpoint(game: GameDefinition) -> Callable:
+    # A body whose fields all have defaults may be left out entirely (scratch card)
+    optional = not any(field.is_required() for field in game.request_model.model_fields.values())
+
+    async def play(
+        request: game.request_model = Body(default=None) if optional else Body(),
+        current_user: Principal = Depends(get_current_principal_async),
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        return await play_game(game, request, current_user.id, db)
+
+    play.__doc__ = f"Play one round of {game.title}"
+    return play
+
+
+for game in GAMES.values():
+    router.add_api_route(
+        f"/{game.slug}{game.path}",
+        _play_endpoint(game),
+        methods=["POST"],
+        response_model=game.response_model,
+        tags=[game.title],
+        name=f"play_{game.game_type}",
+    )
+
+
+@router.get("/scratch/cost", tags=["Scratch Card"])
+def get_scratch_card_cost():
+    return {"card_cost": CARD_COST}
@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Games.rtp import report
+
+router = APIRouter()
+
+@router.get("/")
+def get_verified_rtp():
+    """Exact RTP, volatility and max exposure for every game and choice"""
+    return {
+        game: [
+            {
+                "choice": choice,
+                "rtp": float(stats["rtp"]),
+                "rtp_exact": str(stats["rtp"]),
+                "variance": str(stats["variance"]),
+                "volatility": stats["volatility"],
+                "hit_frequency": float(stats["hit_frequency"]),
+                "max_exposure": str(stats["max_exposure"]),
+            }
+            for choice, stats in by_choice.items()
+        ]
+        for game, by_choice in report().items()
+    }
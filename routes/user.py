@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import Optional
 import sys
@@ -6,65 +7,94 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from app.db import get_db
-from app.auth import get_current_user
-from app.models.user import User
+from app.auth import get_current_principal
+from app.principals import Principal
 from app.models.transaction import Transaction
-from app.services.game_service import GameService
+from app.models.user_game_stats import ALL_GAMES
+from app.pagination import CURSOR_FIELDS, count_rows, keyset_page
+from app.partitions import recent_history_since
+from app.ledger import ledger_writer
+from app.services.game_service import GAME_HISTORY_LIST_FIELDS, GameService
+from app.services.user_service import UserService
 from app.schemas.transaction import TransactionHistory, TransactionResponse
-from app.schemas.game import GameHistory
+from app.serialization import FastJSONResponse, row_dicts, schema_columns, select_fields
+from app.schemas.game import GameHistory, GameSessionResponse
 
 router = APIRouter()
 
 @router.get("/transactions", response_model=TransactionHistory)
 def get_transaction_history(
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     per_page: int = Query(20, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
+    include_total: bool = Query(False, description="Also count all transactions"),
+    include_older: bool = Query(False, description="Also return transactions older than the recent history window"),
+    fields: Optional[str] = Query(None, description="Comma separated transaction fields to return, e.g. amount,type"),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get user's transaction history"""
-    offset = (page - 1) * per_page
-    
-    transactions = db.query(Transaction).filter(
-        Transaction.user_id == current_user.id
-    ).order_by(Transaction.created_at.desc()).offset(offset).limit(per_page).all()
+    if ledger_writer.running:
+        ledger_writer.fence()
+    since = recent_history_since(include_older)
+    # Only the requested columns, encoded straight from the rows
+    columns = schema_columns(Transaction, TransactionResponse, select_fields(TransactionResponse, fields, required=CURSOR_FIELDS))
+    statement = select(*columns).where(Transaction.user_id == current_user.id)
+    page = keyset_page(db, statement, Transaction, cursor, per_page, since)
 
-    total_count = db.query(Transaction).filter(
-        Transaction.user_id == current_user.id
-    ).count()
+    total_count = None
+    if include_total:
+        if since is not None:
+            statement = statement.where(Transaction.created_at >= since)
+        total_count = count_rows(db, statement)
 
-    return TransactionHistory(
-        transactions=[TransactionResponse.model_validate(t) for t in transactions],
-        total_count=total_count,
-        page=page,
-        per_page=per_page
-    )
+    return FastJSONResponse({
+        "transactions": row_dicts(page.items),
+        "next_cursor": page.next_cursor,
+        "total_count": total_count,
+        "per_page": per_page
+    })
 
 @router.get("/games", response_model=GameHistory)
 def get_game_history(
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     per_page: int = Query(20, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
+    include_total: bool = Query(False, description="Also count all games"),
+    include_older: bool = Query(False, description="Also return games older than the recent history window"),
+    fields: Optional[str] = Query(None, description="Comma separated session fields to return; game_data only when listed"),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get user's game history"""
     game_service = GameService(db)
-    history = game_service.get_user_game_history(current_user.id, page, per_page)
+    history = game_service.get_user_game_history(
+        current_user.id, cursor, per_page, include_total, include_older,
+        select_fields(GameSessionResponse, fields, default=GAME_HISTORY_LIST_FIELDS, required=CURSOR_FIELDS)
+    )
     
-    return GameHistory(**history)
+    return FastJSONResponse(history)
+
+@router.get("/games/{session_id}", response_model=GameSessionResponse)
+def get_game_session(
+    session_id: int,
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """Get one of the user's games, including its game_data"""
+    return FastJSONResponse(GameService(db).get_user_game_session(current_user.id, session_id))
 
 @router.get("/stats")
 def get_user_stats(
-    current_user: User = Depends(get_current_user),
+    game_type: Optional[str] = Query(None, description="Only this game type, e.g. coin_flip"),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get user's gaming statistics"""
     game_service = GameService(db)
-    stats = game_service.get_user_stats(current_user.id)
+    stats = game_service.get_user_stats(current_user.id, game_type or ALL_GAMES)
     
     return {
         "user_id": current_user.id,
         "username": current_user.username,
-        "current_balance": float(current_user.balance),
+        "current_balance": float(UserService(db).get_balance(current_user.id)),
         "stats": stats
     }
\ No newline at end of file
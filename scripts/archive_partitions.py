@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Partition maintenance for the monthly game_sessions / transactions partitions.
+
+  python scripts/archive_partitions.py ensure
+      create the coming months' partitions (the app also does this at startup)
+  python scripts/archive_partitions.py archive [--month YYYY-MM] [--dry-run]
+      move closed months older than ARCHIVE_AFTER_MONTHS (or just --month) to
+      zstd-compressed Parquet files under ARCHIVE_DIR, then drop them
+
+Archived files are laid out as ARCHIVE_DIR/<table>/<table>_yYYYYmMM.parquet and
+can be read with pyarrow, pandas or DuckDB. PostgreSQL only; needs pyarrow.
+"""
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from app.partitions import ARCHIVE_DIR, archivable_months, archive_month, ensure_partitions
+
+
+def main(args):
+    if args.command == "ensure":
+        created = ensure_partitions()
+        print(f"✅ Created {len(created)} partition(s)" + (f": {', '.join(created)}" if created else ""))
+        return 0
+
+    if args.month:
+        months = [datetime.strptime(args.month, "%Y-%m").date()]
+    else:
+        months = archivable_months()
+    if not months:
+        print("Nothing to archive")
+        return 0
+
+    for month in months:
+        if args.dry_run:
+            print(f"Would archive {month:%Y-%m}")
+            continue
+        for item in archive_month(month, archive_dir=args.archive_dir):
+            print(f"📦 {item.partition}: {item.rows} rows -> {item.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create and archive monthly history partitions")
+    parser.add_argument("command", choices=["ensure", "archive"])
+    parser.add_argument("--month", help="Archive only this closed month (YYYY-MM)")
+    parser.add_argument("--archive-dir", default=ARCHIVE_DIR)
+    parser.add_argument("--dry-run", action="store_true", help="List the months that would be archived")
+    sys.exit(main(parser.parse_args()))
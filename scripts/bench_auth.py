@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of per-request bearer token verification.
+
+Compares app.auth.verify_token with the verified-token cache disabled (a full
+HS256 jwt.decode every request, the old behaviour) against the cached path a
+replayed token takes after its first request.
+
+  python scripts/bench_auth.py [--number 20000]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from app.auth import create_access_token, verify_token
+from app.tokens import token_cache
+
+
+def per_call_us(number, repeat=5):
+    """Best-of-repeat time per verify_token call in microseconds"""
+    token = create_access_token({"sub": "1"})
+    verify_token(token)  # first request always verifies
+    return min(timeit.repeat(lambda: verify_token(token), number=number, repeat=repeat)) / number * 1e6
+
+
+def main(args):
+    max_entries = token_cache.max_entries
+    try:
+        token_cache.clear()
+        token_cache.max_entries = 0
+        uncached = per_call_us(args.number)
+
+        token_cache.max_entries = max_entries
+        cached = per_call_us(args.number)
+    finally:
+        token_cache.max_entries = max_entries
+        token_cache.clear()
+
+    print(f"🔐 verify_token over {args.number} calls (best of 5)")
+    print(f"  jwt.decode every request: {uncached:8.2f} µs/request")
+    print(f"  verified-token cache:     {cached:8.2f} µs/request")
+    print(f"  speedup:                  {uncached / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark bearer token verification")
+    parser.add_argument("--number", type=int, default=20000)
+    main(parser.parse_args())
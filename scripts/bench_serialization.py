@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of history page serialization.
+
+Encodes a page of transactions two ways:
+  response_model  model_validate per ORM row, then jsonable_encoder and
+                  json.dumps, as FastAPI does for a response_model return
+  orjson          the projected row dicts the endpoints now return, encoded
+                  by app.serialization.FastJSONResponse
+
+Rows are built in memory, so only serialization is measured, not the query.
+
+  python scripts/bench_serialization.py [--rows 100] [--number 2000]
+"""
+import argparse
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.models.init import Transaction, TransactionType, TransactionStatus
+from app.schemas.transaction import TransactionHistory, TransactionResponse
+from app.serialization import FastJSONResponse
+
+
+def make_rows(count):
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": row_id,
+            "user_id": 1,
+            "type": TransactionType.BET,
+            "status": TransactionStatus.COMPLETED,
+            "amount": Decimal("2.50"),
+            "balance_before": Decimal("100.00"),
+            "balance_after": Decimal("97.50"),
+            "description": "Bet for dice_roll",
+            "game_session_id": row_id,
+            "reference_id": None,
+            "created_at": now - timedelta(seconds=row_id),
+        }
+        for row_id in range(count, 0, -1)
+    ]
+
+
+def response_model_path(transactions):
+    history = TransactionHistory(
+        transactions=[TransactionResponse.model_validate(t) for t in transactions],
+        next_cursor="cursor",
+        total_count=None,
+        per_page=len(transactions)
+    )
+    return JSONResponse(jsonable_encoder(history)).body
+
+
+def orjson_path(rows):
+    return FastJSONResponse({
+        "transactions": rows,
+        "next_cursor": "cursor",
+        "total_count": None,
+        "per_page": len(rows)
+    }).body
+
+
+def per_page_us(function, argument, number, repeat=5):
+    """Best-of-repeat time per page in microseconds"""
+    return min(timeit.repeat(lambda: function(argument), number=number, repeat=repeat)) / number * 1e6
+
+
+def main(args):
+    rows = make_rows(args.rows)
+    transactions = [Transaction(**row) for row in rows]
+
+    slow = per_page_us(response_model_path, transactions, args.number)
+    fast = per_page_us(orjson_path, rows, args.number)
+
+    print(f"📄 {args.rows}-row transaction page over {args.number} encodes (best of 5)")
+    print(f"  response_model + jsonable_encoder: {slow:9.1f} µs/page")
+    print(f"  projected rows + orjson:           {fast:9.1f} µs/page")
+    print(f"  speedup:                           {slow / fast:9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark history response serialization")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--number", type=int, default=2000)
+    main(parser.parse_args())
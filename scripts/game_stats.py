@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Maintenance for the user_game_stats rollup behind /api/user/stats.
+
+  python scripts/game_stats.py rebuild [--user-id N]   recompute from game_sessions
+  python scripts/game_stats.py check [--user-id N]     report rows that disagree
+
+check exits with status 1 when it finds mismatches, so it can run from cron
+or CI. Both work through users in batches; rebuild locks each batch's user
+rows while it recounts them, so it is safe to run against a live database.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from app.db import SessionLocal
+from app.services.stats_service import GameStatsService
+
+
+def main(args):
+    db = SessionLocal()
+    try:
+        stats_service = GameStatsService(db)
+        if args.command == "rebuild":
+            rebuilt = stats_service.rebuild(args.user_id, batch_size=args.batch_size)
+            print(f"✅ Rebuilt game stats for {rebuilt} user(s)")
+            return 0
+
+        mismatches = stats_service.check(args.user_id, batch_size=args.batch_size)
+        for mismatch in mismatches:
+            print(f"❌ user {mismatch.user_id} {mismatch.game_type}: "
+                  f"expected {mismatch.expected}, found {mismatch.actual}")
+        if mismatches:
+            print(f"{len(mismatches)} mismatched row(s); run 'rebuild' to fix")
+            return 1
+        print("✅ Game stats match game_sessions")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild or verify the user_game_stats rollup")
+    parser.add_argument("command", choices=["rebuild", "check"])
+    parser.add_argument("--user-id", type=int, default=None, help="Only this user")
+    parser.add_argument("--batch-size", type=int, default=500, help="Users per transaction")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Delete stored Idempotency-Key responses older than IDEMPOTENCY_TTL_HOURS.
+
+Expired keys are already ignored (and reused) by the API; this only keeps the
+idempotency_keys table small. Safe to run from cron at any time.
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from app.db import SessionLocal
+from app.idempotency import IDEMPOTENCY_TTL_HOURS, purge_idempotency_keys
+
+
+def main():
+    with SessionLocal() as db:
+        purged = purge_idempotency_keys(db)
+    print(f"🧹 Purged {purged} idempotency key(s) older than {IDEMPOTENCY_TTL_HOURS}h")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
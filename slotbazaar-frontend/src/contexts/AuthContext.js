@@ -159,6 +159,13 @@ export const AuthProvider = ({ children }) => {
   };
 
   const logout = () => {
+    // Revoke the token server-side before forgetting it locally
+    const token = localStorage.getItem('token');
+    if (token) {
+      API.post('/auth/logout', null, {
+        headers: { Authorization: `Bearer ${token}` },
+      }).catch(() => {});
+    }
     localStorage.removeItem('token');
     localStorage.removeItem('rememberMe');
     setUser(null);
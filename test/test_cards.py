@@ -0,0 +1,64 @@
+import pytest
+import decimal
+import sys
+import os
+from collections import Counter
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Games import rng
+from Games.cards import Shoe, deal
+from Games.simplified_blackjack import DECK, play_simplified_blackjack
+from Games.high_low_card import play_high_low_card
+
+@pytest.fixture(autouse=True)
+def set_decimal_precision():
+    decimal.getcontext().prec = 10
+
+def test_deal_leaves_deck_untouched():
+    deck = list(DECK)
+    hand = deal(deck, 4)
+    assert len(hand) == 4
+    assert deck == DECK
+    assert not Counter(hand) - Counter(DECK)
+
+def test_deal_is_reproducible_when_seeded():
+    with rng.seeded(9):
+        first = deal(DECK, 4)
+    with rng.seeded(9):
+        second = deal(DECK, 4)
+    assert first == second
+
+def test_shoe_persists_between_hands():
+    shoe = Shoe(DECK, num_decks=2)
+    seen = Counter()
+    for _ in range(10):
+        seen.update(shoe.deal_hand(4))
+    assert shoe.dealt == 40
+    assert shoe.shuffles == 1
+    # No card was dealt more often than it exists in the shoe
+    assert not seen - Counter(DECK * 2)
+
+def test_shoe_reshuffles_after_cut_card():
+    shoe = Shoe(DECK, num_decks=1, penetration=0.5)
+    while not shoe.cut_card_reached:
+        shoe.deal_hand(4)
+    assert shoe.dealt >= shoe.cut_card
+    shoe.deal_hand(4)
+    assert shoe.shuffles == 2
+    assert shoe.dealt == 4
+
+def test_shoe_rejects_bad_settings():
+    with pytest.raises(ValueError):
+        Shoe(DECK, num_decks=0)
+    with pytest.raises(ValueError):
+        Shoe(DECK, penetration=0)
+
+def test_games_deal_from_shoe():
+    shoe = Shoe(DECK, num_decks=6)
+    result = play_simplified_blackjack(decimal.Decimal('5.00'), shoe=shoe)
+    assert len(result['player_hand']) == 2
+    assert len(result['dealer_hand']) == 2
+    assert shoe.dealt == 4
+
+    high_low_shoe = Shoe([str(r) for r in range(2, 11)] + ['J', 'Q', 'K', 'A'], num_decks=4)
+    play_high_low_card(decimal.Decimal('1.00'), 'High', shoe=high_low_shoe)
+    assert high_low_shoe.dealt == 1
@@ -2,19 +2,22 @@ import pytest
 import decimal
 import sys
 import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'Games'))
-from coin_flip import play_coin_flip
+from Games import rng
+from coin_flip import play_coin_flip, CHOICES
 
 @pytest.fixture(autouse=True)
 def set_decimal_precision():
     # Set Decimal precision to make results predictable
     decimal.getcontext().prec = 10
 
-def test_coin_flip_win(monkeypatch):
+def test_coin_flip_win():
     # Force the outcome to be Heads to test a win
-    monkeypatch.setattr('coin_flip.secrets.choice', lambda choices: 'Heads')
+    seed = rng.find_seed(lambda: rng.choice(CHOICES) == 'Heads')
     bet = decimal.Decimal('10.00')
-    result = play_coin_flip(bet, 'Heads')
+    with rng.seeded(seed):
+        result = play_coin_flip(bet, 'Heads')
     assert result['game'] == 'Coin Flip'
     assert result['choice'] == 'Heads'
     assert result['outcome'] == 'Heads'
@@ -23,11 +26,12 @@ def test_coin_flip_win(monkeypatch):
     assert result['winnings'] == decimal.Decimal('19.20')
     assert result['net_win_loss'] == decimal.Decimal('9.20')
 
-def test_coin_flip_loss(monkeypatch):
+def test_coin_flip_loss():
     # Заставим исход быть Tails, а ставка — на Heads => проигрыш
-    monkeypatch.setattr('coin_flip.secrets.choice', lambda choices: 'Tails')
+    seed = rng.find_seed(lambda: rng.choice(CHOICES) == 'Tails')
     bet = decimal.Decimal('5.00')
-    result = play_coin_flip(bet, 'Heads')
+    with rng.seeded(seed):
+        result = play_coin_flip(bet, 'Heads')
     assert result['outcome'] == 'Tails'
     assert result['winnings'] == decimal.Decimal('0.00')
     assert result['net_win_loss'] == decimal.Decimal('-5.00')
@@ -14,7 +14,7 @@ def fake_card(rank, value):
 
 def test_high_low_card_low_win(monkeypatch):
     # Force return a card with value 5 (low)
-    monkeypatch.setattr('high_low_card.get_random_card', lambda: fake_card('5', 5))
+    monkeypatch.setattr('high_low_card.get_random_card', lambda shoe=None: fake_card('5', 5))
     bet = decimal.Decimal('10.00')
     result = play_high_low_card(bet, 'Low')
     assert result['choice'] == 'Low'
@@ -25,7 +25,7 @@ def test_high_low_card_low_win(monkeypatch):
 
 def test_high_low_card_high_win(monkeypatch):
     # Принудительно вернём карту «Q» = 12 (высокая)
-    monkeypatch.setattr('high_low_card.get_random_card', lambda: fake_card('Q', 12))
+    monkeypatch.setattr('high_low_card.get_random_card', lambda shoe=None: fake_card('Q', 12))
     bet = decimal.Decimal('8.00')
     result = play_high_low_card(bet, 'High')
     assert result['choice'] == 'High'
@@ -36,7 +36,7 @@ def test_high_low_card_high_win(monkeypatch):
 
 def test_high_low_card_loss(monkeypatch):
     # Принудительно вернём значение 2, ставка на High => проигрыш
-    monkeypatch.setattr('high_low_card.get_random_card', lambda: fake_card('2', 2))
+    monkeypatch.setattr('high_low_card.get_random_card', lambda shoe=None: fake_card('2', 2))
     bet = decimal.Decimal('5.00')
     result = play_high_low_card(bet, 'High')
     assert result['winnings'] == decimal.Decimal('0.00')
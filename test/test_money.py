@@ -0,0 +1,59 @@
+import pytest
+import decimal
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Games import money
+from Games.money import Money
+from Games.reel_slot import play_simple_slot
+from Games.simple_roulette import play_simple_roulette_redblack
+
+@pytest.fixture(autouse=True)
+def set_decimal_precision():
+    decimal.getcontext().prec = 10
+
+def test_from_decimal_round_trip():
+    amount = Money.from_decimal(decimal.Decimal('12.34'))
+    assert amount.cents == 1234
+    assert amount.to_decimal() == decimal.Decimal('12.34')
+    assert str(Money(5)) == '0.05'
+
+def test_from_decimal_rejects_fractional_cents():
+    with pytest.raises(ValueError, match="whole number of cents"):
+        Money.from_decimal(decimal.Decimal('1.005'))
+    with pytest.raises(ValueError, match="finite Decimal"):
+        Money.from_decimal(decimal.Decimal('NaN'))
+
+def test_multiply_matches_decimal_quantize():
+    rates = [decimal.Decimal(r) for r in ('0.5', '1.5', '1.75', '1.95', '2.3', '11')]
+    for cents in range(1, 400):
+        for rate in rates:
+            expected = (decimal.Decimal(cents) / 100 * rate).quantize(decimal.Decimal('0.00'))
+            assert (Money(cents) * rate).to_decimal() == expected
+
+def test_arithmetic_and_comparisons():
+    bet = Money(250)
+    assert bet + Money(50) == Money(300)
+    assert bet - Money(300) == Money(-50)
+    assert bet * 2 == Money(500)
+    assert bet == decimal.Decimal('2.50')
+    assert money.ZERO < bet
+    assert not money.ZERO
+    assert hash(bet) == hash(decimal.Decimal('2.50'))
+
+def test_money_is_immutable():
+    with pytest.raises(AttributeError):
+        Money(1).cents = 2
+
+def test_to_money_validates_bets():
+    assert money.to_money(decimal.Decimal('1.00')) == Money(100)
+    for bad in (decimal.Decimal('0'), Money(-1), 10, '1.00'):
+        with pytest.raises(ValueError, match="Bet amount must be a positive Decimal."):
+            money.to_money(bad)
+
+def test_games_return_the_bet_type():
+    as_money = play_simple_slot(Money(1000))
+    assert all(isinstance(as_money[k], Money) for k in ('bet', 'winnings', 'net_win_loss'))
+    as_decimal = play_simple_roulette_redblack(decimal.Decimal('10.00'), 'Red')
+    assert all(isinstance(as_decimal[k], decimal.Decimal) for k in ('bet', 'winnings', 'net_win_loss'))
+    assert as_decimal['net_win_loss'] == as_decimal['winnings'] - as_decimal['bet']
@@ -2,29 +2,33 @@ import pytest
 import decimal
 import sys
 import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'Games'))
+from Games import rng
 from number_guess import play_number_guess
 
 @pytest.fixture(autouse=True)
 def set_decimal_precision():
     decimal.getcontext().prec = 10
 
-def test_number_guess_win(monkeypatch):
+def test_number_guess_win():
     # Принудительно вернём secret_number = 7 (randbelow даёт 6)
-    monkeypatch.setattr('number_guess.secrets.randbelow', lambda n: 6)
+    seed = rng.find_seed(lambda: rng.randbelow(10) == 6)
     bet = decimal.Decimal('2.00')
-    result = play_number_guess(bet, 7)
+    with rng.seeded(seed):
+        result = play_number_guess(bet, 7)
     assert result['choice'] == 7
     assert result['secret_number'] == 7
     assert result['payout_rate_on_win'] == decimal.Decimal('9.5')
     assert result['winnings'] == decimal.Decimal('19.00')
     assert result['net_win_loss'] == decimal.Decimal('17.00')
 
-def test_number_guess_loss(monkeypatch):
+def test_number_guess_loss():
     # Принудительно вернём secret_number = 3 (randbelow даёт 2)
-    monkeypatch.setattr('number_guess.secrets.randbelow', lambda n: 2)
+    seed = rng.find_seed(lambda: rng.randbelow(10) == 2)
     bet = decimal.Decimal('3.00')
-    result = play_number_guess(bet, 5)
+    with rng.seeded(seed):
+        result = play_number_guess(bet, 5)
     assert result['secret_number'] == 3
     assert result['winnings'] == decimal.Decimal('0.00')
     assert result['net_win_loss'] == decimal.Decimal('-3.00')
@@ -0,0 +1,62 @@
+import pytest
+import decimal
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Games import rng
+from Games.outcomes import compile_table, compile_mapping, table_for
+from Games import simple_roulette, scratch_card_simulator, simplified_blackjack, wheel_of_fortune
+
+@pytest.fixture(autouse=True)
+def set_decimal_precision():
+    decimal.getcontext().prec = 10
+
+def test_compile_table_interns_equal_records():
+    table = compile_table(range(4), lambda n: (decimal.Decimal('1.5') if n else decimal.Decimal('0'), {'won': bool(n)}))
+    assert len(table) == 4
+    assert table[1] is table[2] is table[3]
+    assert table[0].rate_cents == 0
+    assert table[1].rate_cents == 150
+    assert table[1].payout_rate == decimal.Decimal('1.5')
+    with pytest.raises(TypeError):
+        table[1].result['won'] = False
+
+def test_compile_table_rejects_sub_cent_rates():
+    with pytest.raises(ValueError):
+        compile_table([0], lambda n: (decimal.Decimal('1.005'), {}))
+
+def test_draw_is_one_bounded_draw():
+    with rng.seeded(3):
+        expected = wheel_of_fortune.TABLE[rng.randbelow(wheel_of_fortune.NUM_SEGMENTS)]
+    with rng.seeded(3):
+        assert wheel_of_fortune.TABLE.draw() is expected
+
+def test_roulette_table_matches_pockets():
+    red = simple_roulette.TABLES['Red']
+    assert len(red) == simple_roulette.SLOTS
+    for number, outcome in enumerate(red):
+        assert outcome.result['outcome_number'] == number
+        assert outcome.result['outcome_color'] == simple_roulette.POCKET_COLORS[number]
+        assert (outcome.rate_cents > 0) == (number in simple_roulette.RED_NUMBERS)
+
+def test_scratch_table_follows_weights():
+    rates = [outcome.payout_rate for outcome in scratch_card_simulator.TABLE]
+    assert len(rates) == sum(scratch_card_simulator.PRIZE_WEIGHTS)
+    for rate, weight in zip(scratch_card_simulator.PAYOUT_RATES, scratch_card_simulator.PRIZE_WEIGHTS):
+        assert rates.count(rate) == weight
+
+def test_blackjack_settlement_covers_all_hands():
+    values = set(simplified_blackjack.HAND_VALUES.values())
+    assert set(simplified_blackjack.SETTLEMENT) == {(p, d) for p in values for d in values}
+    assert simplified_blackjack.SETTLEMENT[21, 21].result['result_status'] == "Push (Both Blackjack)"
+    assert simplified_blackjack.SETTLEMENT[21, 20].rate_cents == 200
+
+def test_compile_mapping_keys_outcomes():
+    mapping = compile_mapping(['a', 'b'], lambda key: (decimal.Decimal('2'), {'key': key}))
+    assert mapping['b'].result['key'] == 'b'
+
+def test_table_for_validates_choice():
+    assert table_for(wheel_of_fortune) is wheel_of_fortune.TABLE
+    assert table_for(simple_roulette, 'Black') is simple_roulette.TABLES['Black']
+    with pytest.raises(ValueError):
+        table_for(simple_roulette, 'Green')
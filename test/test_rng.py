@@ -0,0 +1,69 @@
+import pytest
+import threading
+import sys
+import os
+from collections import Counter
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Games import rng
+from Games.rng import EntropyPool
+
+class CountingSource:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, n):
+        self.calls += 1
+        return os.urandom(n)
+
+def test_refills_in_blocks():
+    source = CountingSource()
+    pool = EntropyPool(source, block_size=4096)
+    for _ in range(1000):
+        pool.randbelow(37)
+    # 1000 one-byte draws (plus rejections) fit in a single 4 KiB block
+    assert source.calls == 1
+
+def test_randbelow_bounds_and_spread():
+    pool = EntropyPool()
+    counts = Counter(pool.randbelow(6) for _ in range(6000))
+    assert set(counts) == set(range(6))
+    assert min(counts.values()) > 800
+    assert pool.randbelow(1) == 0
+    with pytest.raises(ValueError):
+        pool.randbelow(0)
+
+def test_sample_draws_distinct_elements():
+    deck = list(range(52))
+    hand = EntropyPool().sample(deck, 4)
+    assert len(set(hand)) == 4
+    assert deck == list(range(52))
+    with pytest.raises(ValueError):
+        EntropyPool().sample(deck, 53)
+
+def test_shuffle_is_a_permutation():
+    cards = list(range(52))
+    EntropyPool().shuffle(cards)
+    assert sorted(cards) == list(range(52))
+
+def test_choices_respects_zero_weights():
+    pool = EntropyPool()
+    assert {pool.choices(['a', 'b', 'c'], [0, 5, 0]) for _ in range(50)} == {'b'}
+
+def test_seeded_mode_is_reproducible():
+    with rng.seeded(123):
+        first = [rng.randbelow(1000) for _ in range(20)]
+    with rng.seeded(123):
+        second = [rng.randbelow(1000) for _ in range(20)]
+    assert first == second
+
+def test_find_seed_forces_outcome():
+    seed = rng.find_seed(lambda: rng.randbelow(37) == 0)
+    with rng.seeded(seed):
+        assert rng.randbelow(37) == 0
+
+def test_pools_are_per_thread():
+    pools = []
+    thread = threading.Thread(target=lambda: pools.append(rng.get_pool()))
+    thread.start()
+    thread.join()
+    assert pools[0] is not rng.get_pool()
@@ -0,0 +1,50 @@
+import pytest
+import decimal
+import sys
+import os
+from fractions import Fraction
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Games import reel_slot
+from Games.rtp import analyze, report
+
+def test_reel_slot_exact_rtp():
+    # 3 winning combinations out of 27 paying 5 + 8 + 13
+    stats = analyze('reel_slot')
+    assert stats['rtp'] == Fraction(26, 27)
+    assert stats['hit_frequency'] == Fraction(3, 27)
+    assert stats['max_exposure'] == 13
+
+def test_roulette_exact_rtp():
+    assert analyze('simple_roulette', 'Red')['rtp'] == Fraction(36, 37)
+
+def test_fixed_paytables():
+    assert analyze('coin_flip', 'Heads')['rtp'] == Fraction(24, 25)
+    assert analyze('coin_flip', 'Heads')['variance'] == Fraction(2304, 2500)
+    assert analyze('wheel_of_fortune')['rtp'] == Fraction(19, 20)
+    assert analyze('scratch_card_simulator')['rtp'] == Fraction(24, 25)
+
+def test_blackjack_deal_tree():
+    stats = analyze('simplified_blackjack')
+    # Player and dealer hands are dealt symmetrically from the same deck
+    assert stats['rtp'] == 1
+    assert stats['max_exposure'] == 2
+
+def test_cache_follows_paytable(monkeypatch):
+    before = analyze('reel_slot')
+    assert analyze('reel_slot') is before
+    monkeypatch.setitem(reel_slot.PAYTABLE, ('B', 'B', 'B'), decimal.Decimal('14'))
+    # Paytables take effect when the outcome table is recompiled
+    assert analyze('reel_slot')['rtp'] == Fraction(26, 27)
+    monkeypatch.setattr(reel_slot, 'TABLE', reel_slot.build_table())
+    assert analyze('reel_slot')['rtp'] == Fraction(27, 27)
+
+def test_report_covers_every_choice():
+    full = report()
+    assert set(full['dice_roll']) == {1, 2, 3, 4, 5, 6}
+    assert set(full['reel_slot']) == {None}
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        analyze('poker')
+    with pytest.raises(ValueError):
+        analyze('high_low_card', 'Middle')
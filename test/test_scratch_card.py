@@ -2,8 +2,10 @@ import pytest
 import decimal
 import sys
 import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'Games'))
-from scratch_card_simulator import play_scratch_card, CARD_COST, PRIZE_DISTRIBUTION
+from Games import rng
+from scratch_card_simulator import play_scratch_card, reveal_payout_rate, CARD_COST, PRIZE_DISTRIBUTION
 
 @pytest.fixture(autouse=True)
 def set_decimal_precision():
@@ -14,11 +16,11 @@ def test_scratch_card_fixed_cost():
     with pytest.raises(ValueError):
         play_scratch_card(decimal.Decimal('2.00'))
 
-def test_scratch_card_valid(monkeypatch):
+def test_scratch_card_valid():
     # Force return a specific payout_rate, e.g. 5 (multiplied by 1.00)
-    monkeypatch.setattr('scratch_card_simulator.random.choices',
-                        lambda rates, weights, k: [decimal.Decimal('5')])
-    result = play_scratch_card()  # bet_amount defaults to CARD_COST
+    seed = rng.find_seed(lambda: reveal_payout_rate() == decimal.Decimal('5'))
+    with rng.seeded(seed):
+        result = play_scratch_card()  # bet_amount defaults to CARD_COST
     assert result['game'] == 'Scratch Card Simulator'
     assert result['bet'] == CARD_COST
     assert result['revealed_payout_rate'] == decimal.Decimal('5')
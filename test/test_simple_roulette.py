@@ -2,18 +2,21 @@ import pytest
 import decimal
 import sys
 import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'Games'))
+from Games import rng
 from simple_roulette import play_simple_roulette_redblack
 
 @pytest.fixture(autouse=True)
 def set_decimal_precision():
     decimal.getcontext().prec = 10
 
-def test_roulette_red_win(monkeypatch):
+def test_roulette_red_win():
     # Force return number 5 (red)
-    monkeypatch.setattr('simple_roulette.secrets.randbelow', lambda n: 5)
+    seed = rng.find_seed(lambda: rng.randbelow(37) == 5)
     bet = decimal.Decimal('10.00')
-    result = play_simple_roulette_redblack(bet, 'Red')
+    with rng.seeded(seed):
+        result = play_simple_roulette_redblack(bet, 'Red')
     assert result['choice'] == 'Red'
     assert result['outcome_number'] == 5
     assert result['outcome_color'] == 'Red'
@@ -21,32 +24,35 @@ def test_roulette_red_win(monkeypatch):
     assert result['winnings'] == decimal.Decimal('20.00')
     assert result['net_win_loss'] == decimal.Decimal('10.00')
 
-def test_roulette_black_win(monkeypatch):
+def test_roulette_black_win():
     # Принудительно вернём число 25 (черное)
-    monkeypatch.setattr('simple_roulette.secrets.randbelow', lambda n: 25)
+    seed = rng.find_seed(lambda: rng.randbelow(37) == 25)
     bet = decimal.Decimal('5.00')
-    result = play_simple_roulette_redblack(bet, 'Black')
+    with rng.seeded(seed):
+        result = play_simple_roulette_redblack(bet, 'Black')
     assert result['choice'] == 'Black'
     assert result['outcome_number'] == 25
     assert result['outcome_color'] == 'Black'
     assert result['winnings'] == decimal.Decimal('10.00')
     assert result['net_win_loss'] == decimal.Decimal('5.00')
 
-def test_roulette_green_loss(monkeypatch):
+def test_roulette_green_loss():
     # Принудительно вернём 0 (зеленое) - проигрыш
-    monkeypatch.setattr('simple_roulette.secrets.randbelow', lambda n: 0)
+    seed = rng.find_seed(lambda: rng.randbelow(37) == 0)
     bet = decimal.Decimal('8.00')
-    result = play_simple_roulette_redblack(bet, 'Red')
+    with rng.seeded(seed):
+        result = play_simple_roulette_redblack(bet, 'Red')
     assert result['outcome_number'] == 0
     assert result['outcome_color'] == 'Green'
     assert result['winnings'] == decimal.Decimal('0.00')
     assert result['net_win_loss'] == decimal.Decimal('-8.00')
 
-def test_roulette_color_loss(monkeypatch):
+def test_roulette_color_loss():
     # Принудительно вернём красное число, а ставка на черное
-    monkeypatch.setattr('simple_roulette.secrets.randbelow', lambda n: 10)
+    seed = rng.find_seed(lambda: rng.randbelow(37) == 10)
     bet = decimal.Decimal('3.00')
-    result = play_simple_roulette_redblack(bet, 'Black')
+    with rng.seeded(seed):
+        result = play_simple_roulette_redblack(bet, 'Black')
     assert result['outcome_color'] == 'Red'
     assert result['winnings'] == decimal.Decimal('0.00')
     assert result['net_win_loss'] == decimal.Decimal('-3.00')
@@ -0,0 +1,61 @@
+import pytest
+import decimal
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Games.simulate import simulate, GAMES
+
+@pytest.fixture(autouse=True)
+def set_decimal_precision():
+    decimal.getcontext().prec = 10
+
+def test_seeded_run_is_reproducible():
+    first = simulate('reel_slot', 10_000, bet=decimal.Decimal('0.50'), seed=42)
+    second = simulate('reel_slot', 10_000, bet=decimal.Decimal('0.50'), seed=42)
+    assert first == second
+
+def test_histogram_matches_totals():
+    result = simulate('wheel_of_fortune', 50_000, bet=decimal.Decimal('2.00'), seed=1)
+    histogram = result['payout_histogram']
+    assert sum(histogram.values()) == 50_000
+    assert set(histogram) <= {decimal.Decimal('0.00'), decimal.Decimal('3.00'),
+                              decimal.Decimal('4.00'), decimal.Decimal('6.00')}
+    assert result['total_paid'] == sum(payout * count for payout, count in histogram.items())
+    assert result['total_wagered'] == decimal.Decimal('100000.00')
+    assert result['rtp'] == pytest.approx(float(result['total_paid'] / result['total_wagered']))
+
+def test_coin_flip_rtp_and_variance():
+    # Payout 1.92 with p = 1/2: RTP 0.96, variance 1.92^2/4 = 0.9216
+    result = simulate('coin_flip', 400_000, bet=decimal.Decimal('10.00'), choice='Heads', seed=7)
+    assert result['rtp'] == pytest.approx(0.96, abs=0.01)
+    assert result['variance'] == pytest.approx(0.9216, abs=0.01)
+    assert result['hit_frequency'] == pytest.approx(0.5, abs=0.01)
+
+def test_scratch_card_rtp():
+    result = simulate('scratch_card_simulator', 400_000, bet=decimal.Decimal('1.00'), seed=3)
+    assert result['rtp'] == pytest.approx(0.96, abs=0.02)
+
+def test_blackjack_outcomes():
+    result = simulate('simplified_blackjack', 200_000, seed=5)
+    assert set(result['payout_histogram']) == {decimal.Decimal('0.00'), decimal.Decimal('1.00'),
+                                               decimal.Decimal('2.00')}
+
+@pytest.mark.parametrize('game', sorted(GAMES))
+def test_every_game_simulates(game):
+    choices = {'coin_flip': 'Tails', 'dice_roll': 6, 'high_low_card': 'Low', 'number_guess': 1,
+               'rock_paper_scissors': 'Paper', 'simple_roulette': 'Black'}
+    result = simulate(game, 1_000, choice=choices.get(game), seed=11)
+    assert result['rounds'] == 1_000
+    assert 0 <= result['hit_frequency'] <= 1
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        simulate('poker', 100)
+    with pytest.raises(ValueError):
+        simulate('coin_flip', 100, choice='Edge')
+    with pytest.raises(ValueError):
+        simulate('dice_roll', 100, choice=7)
+    with pytest.raises(ValueError):
+        simulate('reel_slot', 100, bet=decimal.Decimal('-1.00'))
+    with pytest.raises(ValueError):
+        simulate('scratch_card_simulator', 100, bet=decimal.Decimal('2.00'))
@@ -0,0 +1,145 @@
+import asyncio
+import os
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from fastapi import HTTPException
+from sqlalchemy import create_engine, func
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import to_async_url
+from app.models.base import Base
+from app.models.game_session import GameSession
+from app.models.user import User
+from app.models.transaction import Transaction, TransactionType
+from app.services.game_service import AsyncGameService
+from app.services.user_service import UserService
+
+STARTING_BALANCE = Decimal('100.00')
+BET = Decimal('3.00')
+DEPOSIT = Decimal('1.00')
+
+
+def _backend_urls():
+    urls = ["sqlite"]
+    if os.getenv("TEST_POSTGRES_URL"):
+        urls.append(os.getenv("TEST_POSTGRES_URL"))
+    return urls
+
+
+@pytest.fixture(params=_backend_urls())
+def concurrent_sessions(request, tmp_path):
+    """Session factory on a real multi-connection engine"""
+    if request.param == "sqlite":
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'concurrency.db'}",
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+    else:
+        engine = create_engine(request.param, pool_size=20)
+
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    yield Session
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def funded_user_id(concurrent_sessions):
+    db = concurrent_sessions()
+    user = User(username="racer", email="racer@example.com", balance=STARTING_BALANCE)
+    user.set_password("racerpassword")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def test_parallel_bets_never_overdraw(concurrent_sessions, funded_user_id):
+    """Parallel bets and deposits against one user keep the balance exact and non-negative"""
+    operations = [-BET] * 60 + [DEPOSIT] * 20
+
+    def run(amount):
+        db = concurrent_sessions()
+        try:
+            transaction_type = TransactionType.BET if amount < 0 else TransactionType.DEPOSIT
+            transaction = UserService(db).update_balance(funded_user_id, amount, transaction_type)
+            assert transaction.balance_after >= 0
+            return amount
+        except HTTPException as e:
+            assert e.status_code == 400
+            return None
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        applied = [amount for amount in pool.map(run, operations) if amount is not None]
+
+    db = concurrent_sessions()
+    try:
+        balance = db.query(User.balance).filter(User.id == funded_user_id).scalar()
+        ledger_rows = db.query(Transaction).filter(Transaction.user_id == funded_user_id).count()
+        min_after = db.query(func.min(Transaction.balance_after)).filter(
+            Transaction.user_id == funded_user_id
+        ).scalar()
+    finally:
+        db.close()
+
+    assert len([a for a in applied if a > 0]) == 20
+    assert balance == STARTING_BALANCE + sum(applied)
+    assert balance >= 0
+    assert min_after >= 0
+    assert ledger_rows == len(applied)
+
+
+def test_parallel_async_rounds_never_overdraw(concurrent_sessions, funded_user_id):
+    """Rounds settled concurrently on the async engine keep the balance exact and non-negative"""
+    # Alternating losses and wins so some rounds are refused and some succeed after a win
+    rounds = [(BET, Decimal('0.00')), (BET, BET * 2)] * 40
+
+    sync_url = concurrent_sessions.kw["bind"].url
+    async_url = to_async_url(sync_url.render_as_string(hide_password=False))
+
+    async def run_all():
+        if sync_url.get_backend_name() == "sqlite":
+            engine = create_async_engine(async_url, connect_args={"timeout": 30})
+        else:
+            engine = create_async_engine(async_url, pool_size=20)
+        AsyncSession = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+        async def play(bet, winnings):
+            async with AsyncSession() as db:
+                try:
+                    settlement = await AsyncGameService(db).create_game_session(
+                        user_id=funded_user_id, game_type="coin_flip", bet_amount=bet, winnings=winnings
+                    )
+                    assert settlement.balance >= 0
+                    return winnings - bet
+                except HTTPException as e:
+                    assert e.status_code == 400
+                    return None
+
+        try:
+            return await asyncio.gather(*(play(bet, winnings) for bet, winnings in rounds))
+        finally:
+            await engine.dispose()
+
+    applied = [net for net in asyncio.run(run_all()) if net is not None]
+
+    db = concurrent_sessions()
+    try:
+        balance = db.query(User.balance).filter(User.id == funded_user_id).scalar()
+        sessions = db.query(GameSession).filter(GameSession.user_id == funded_user_id).count()
+        min_after = db.query(func.min(Transaction.balance_after)).filter(
+            Transaction.user_id == funded_user_id
+        ).scalar()
+    finally:
+        db.close()
+
+    assert balance == STARTING_BALANCE + sum(applied)
+    assert balance >= 0
+    assert min_after >= 0
+    assert sessions == len(applied)
@@ -0,0 +1,125 @@
+import pytest
+from decimal import Decimal
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.models.game_session import GameSession
+from app.models.transaction import Transaction, TransactionType
+from app.services.game_service import GameService, GameRound
+from Games import rng
+from Games.coin_flip import TABLES as COIN_TABLES
+from Games.money import Money
+
+
+class TestBatchSettlement:
+    """Test settling many rounds in one transaction"""
+
+    def test_rounds_settle_with_one_commit(self, db_session, test_user):
+        """All sessions and ledger rows are written with one commit, in order"""
+        commits = []
+        event.listen(db_session, "after_commit", lambda session: commits.append(session))
+
+        settlement = GameService(db_session).create_game_sessions(
+            user_id=test_user.id,
+            game_type="reel_slot",
+            rounds=[
+                GameRound(Money(1000), Money(0), {"combination": ["C", "L", "B"]}),
+                GameRound(Money(1000), Money(5000), {"combination": ["C", "C", "C"]}),
+            ]
+        )
+
+        assert len(commits) == 1
+        assert settlement.balance == Decimal('130.00')
+        assert len(settlement.session_ids) == 2
+
+        ledger = db_session.query(Transaction).filter(
+            Transaction.game_session_id.in_(settlement.session_ids)
+        ).order_by(Transaction.id).all()
+        assert [t.type for t in ledger] == [TransactionType.BET, TransactionType.BET, TransactionType.WIN]
+        assert [(t.balance_before, t.balance_after) for t in ledger] == [
+            (Decimal('100.00'), Decimal('90.00')),
+            (Decimal('90.00'), Decimal('80.00')),
+            (Decimal('80.00'), Decimal('130.00')),
+        ]
+        assert ledger[2].game_session_id == settlement.session_ids[1]
+
+    def test_guard_covers_every_step(self, db_session, test_user):
+        """A sequence that would dip below zero midway is refused"""
+        # Net +50 overall, but the second bet needs 110 on hand
+        with pytest.raises(HTTPException) as exc_info:
+            GameService(db_session).create_game_sessions(
+                user_id=test_user.id,
+                game_type="reel_slot",
+                rounds=[
+                    GameRound(Money(1000), Money(0), {}),
+                    GameRound(Money(10000), Money(16000), {}),
+                ]
+            )
+
+        assert exc_info.value.status_code == 409
+
+
+class TestBatchPlayEndpoint:
+    """Test POST /api/games/{game}/batch"""
+
+    def test_batch_play(self, authenticated_client, db_session, test_user):
+        """Rounds are played, settled and reported"""
+        response = authenticated_client.post("/api/games/roulette/batch", json={
+            "rounds": [{"bet_amount": "1.00", "choice": "Red"}] * 5 + [{"bet_amount": "2.00", "choice": "Black"}]
+        })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["rounds_played"] == 6
+        assert data["stopped_early"] is False
+        assert Decimal(data["total_bet"]) == Decimal('7.00')
+        assert Decimal(data["new_balance"]) == Decimal('100.00') + Decimal(data["net_result"])
+        assert all(set(r["outcome"]) == {"choice", "outcome_number", "outcome_color", "won"} for r in data["results"])
+        assert [r["outcome"]["choice"] for r in data["results"]] == ["Red"] * 5 + ["Black"]
+        assert all(r["outcome"]["won"] == (Decimal(r["winnings"]) > 0) for r in data["results"])
+        assert db_session.query(GameSession).filter(GameSession.user_id == test_user.id).count() == 6
+
+    def test_stops_early_on_insufficient_balance(self, authenticated_client):
+        """Play stops at the first round the balance can't cover"""
+        seed = rng.find_seed(lambda: COIN_TABLES['Heads'].draw().rate_cents == 0)
+        with rng.seeded(seed):
+            response = authenticated_client.post("/api/games/coin/batch", json={
+                "rounds": [{"bet_amount": "60.00", "choice": "Heads"}] * 3
+            })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["rounds_played"] == 1
+        assert data["stopped_early"] is True
+        assert Decimal(data["new_balance"]) == Decimal('40.00')
+
+    def test_first_round_unaffordable(self, authenticated_client):
+        """Nothing is played if the first bet exceeds the balance"""
+        response = authenticated_client.post("/api/games/slot/batch", json={"rounds": [{"bet_amount": "500.00"}]})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Insufficient balance"
+
+    def test_invalid_choice(self, authenticated_client):
+        """An invalid per-round choice rejects the whole batch"""
+        response = authenticated_client.post("/api/games/dice/batch", json={
+            "rounds": [{"bet_amount": "1.00", "choice": 3}, {"bet_amount": "1.00", "choice": 9}]
+        })
+
+        assert response.status_code == 400
+
+    def test_unknown_game(self, authenticated_client):
+        response = authenticated_client.post("/api/games/poker/batch", json={"rounds": [{"bet_amount": "1.00"}]})
+
+        assert response.status_code == 404
+
+    def test_missing_user(self, authenticated_client, db_session, test_user):
+        """A user deleted while their principal is still cached gets a 404, like single rounds"""
+        authenticated_client.post("/api/games/poker/batch", json={"rounds": [{"bet_amount": "1.00"}]})
+        db_session.delete(test_user)
+        db_session.commit()
+
+        response = authenticated_client.post("/api/games/slot/batch", json={"rounds": [{"bet_amount": "1.00"}]})
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "User not found"
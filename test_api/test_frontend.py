@@ -0,0 +1,70 @@
+import brotli
+import gzip
+import pytest
+from fastapi import Request
+
+from app.frontend import IMMUTABLE, REVALIDATE, StaticAssets, asset_response, load_index
+
+
+def request(**headers):
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+@pytest.fixture
+def build(tmp_path):
+    (tmp_path / "static" / "js").mkdir(parents=True)
+    (tmp_path / "index.html").write_text("<html>" + "<div></div>" * 200 + "</html>")
+    (tmp_path / "static" / "js" / "main.3f2a91c4.js").write_text("console.log('slot');\n" * 200)
+    (tmp_path / "static" / "logo.png").write_bytes(b"\x89PNG" + bytes(range(256)) * 8)
+    return tmp_path
+
+
+class TestFrontend:
+    """Test the in-memory, precompressed frontend assets"""
+
+    def test_hashed_assets_are_immutable_and_precompressed(self, build):
+        asset = StaticAssets(build / "static").get("js/main.3f2a91c4.js")
+
+        assert asset.cache_control == IMMUTABLE
+        assert asset.media_type in ("application/javascript", "text/javascript")
+        assert brotli.decompress(asset.encoded["br"]) == asset.body
+        assert gzip.decompress(asset.encoded["gzip"]) == asset.body
+
+    def test_binary_assets_are_not_compressed(self, build):
+        asset = StaticAssets(build / "static").get("logo.png")
+
+        assert asset.encoded == {}
+        assert asset.cache_control == REVALIDATE
+
+    def test_negotiates_encoding_with_one_etag_each(self, build):
+        asset = StaticAssets(build / "static").get("js/main.3f2a91c4.js")
+
+        br = asset_response(asset, request(accept_encoding="gzip, deflate, br"))
+        gz = asset_response(asset, request(accept_encoding="gzip, br;q=0"))
+        plain = asset_response(asset, request())
+
+        assert br.headers["content-encoding"] == "br" and br.body == asset.encoded["br"]
+        assert gz.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in plain.headers and plain.body == asset.body
+        assert len({br.headers["etag"], gz.headers["etag"], plain.headers["etag"]}) == 3
+        assert br.headers["vary"] == "Accept-Encoding"
+
+    def test_index_conditional_get(self, build):
+        index = load_index(build)
+        first = asset_response(index, request(accept_encoding="br"))
+
+        again = asset_response(index, request(accept_encoding="br", if_none_match=first.headers["etag"]))
+        other_encoding = asset_response(index, request(if_none_match=first.headers["etag"]))
+
+        assert first.headers["cache-control"] == REVALIDATE
+        assert again.status_code == 304 and again.body == b""
+        assert other_encoding.status_code == 200
+
+    def test_missing_build(self, tmp_path):
+        assert StaticAssets(tmp_path / "static").assets == {}
+        assert load_index(tmp_path) is None
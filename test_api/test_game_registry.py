@@ -0,0 +1,62 @@
+import pytest
+from decimal import Decimal
+
+from app.games import GAMES
+from app.models.game_session import GameSession
+from Games import rng
+from Games.coin_flip import TABLES as COIN_TABLES
+
+
+PLAY_REQUESTS = {
+    "coin": {"bet": "2.00", "choice": "heads"},
+    "dice": {"bet_amount": "2.00", "number": 4},
+    "highlow": {"bet_amount": "2.00", "choice": "high"},
+    "guess": {"bet_amount": "2.00", "guess": 7},
+    "rps": {"bet_amount": "2.00", "choice": "rock"},
+    "scratch": {},
+    "roulette": {"bet_amount": "2.00", "choice": "red"},
+    "blackjack": {"bet_amount": "2.00"},
+    "wheel": {"bet_amount": "2.00"},
+    "slot": {"bet_amount": "2.00"},
+}
+
+
+class TestGameRegistry:
+    """Test the generic play pipeline shared by every registered game"""
+
+    def test_every_game_has_a_sample_request(self):
+        assert set(PLAY_REQUESTS) == set(GAMES)
+
+    @pytest.mark.parametrize("slug", sorted(PLAY_REQUESTS))
+    def test_play_settles_round(self, authenticated_client, db_session, slug):
+        game = GAMES[slug]
+
+        response = authenticated_client.post(f"/api/games/{slug}{game.path}", json=PLAY_REQUESTS[slug])
+
+        assert response.status_code == 200, response.text
+        session = db_session.query(GameSession).one()
+        assert session.game_type == game.game_type
+        assert set(game.outcome_keys) <= set(session.game_data)
+        assert Decimal(str(response.json()["new_balance"])) == Decimal("100.00") + session.net_result
+
+    def test_coin_flip_uses_game_paytable(self, authenticated_client):
+        seed = rng.find_seed(lambda: COIN_TABLES['Heads'].draw().rate_cents > 0)
+        with rng.seeded(seed):
+            response = authenticated_client.post("/api/games/coin/", json={"bet": "10.00", "choice": "heads"})
+
+        data = response.json()
+        assert data["outcome"] == "heads"
+        assert data["result"] == "win"
+        assert Decimal(data["winnings"]) == Decimal("19.20")
+
+    def test_engine_rejects_invalid_choice(self, authenticated_client, db_session):
+        response = authenticated_client.post("/api/games/roulette/play", json={"bet_amount": "1.00", "choice": "green"})
+
+        assert response.status_code == 400
+        assert "choice must be" in response.json()["detail"].lower()
+        assert db_session.query(GameSession).count() == 0
+
+    def test_scratch_card_rejects_other_stakes(self, authenticated_client):
+        response = authenticated_client.post("/api/games/scratch/play", json={"bet_amount": "5.00"})
+
+        assert response.status_code == 400
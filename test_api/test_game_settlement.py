@@ -0,0 +1,76 @@
+import pytest
+from decimal import Decimal
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.models.transaction import Transaction, TransactionType
+from app.services.game_service import GameService
+
+
+class TestGameSettlement:
+    """Test single-transaction settlement of game rounds"""
+
+    def test_winning_round_settles_once(self, db_session, test_user):
+        """A winning round writes the session, BET and WIN rows with one commit"""
+        commits = []
+        event.listen(db_session, "after_commit", lambda session: commits.append(session))
+
+        settlement = GameService(db_session).create_game_session(
+            user_id=test_user.id,
+            game_type="reel_slot",
+            bet_amount=Decimal('10.00'),
+            winnings=Decimal('50.00'),
+            game_data={"won": True}
+        )
+
+        assert len(commits) == 1
+        assert settlement.balance == Decimal('140.00')
+
+        ledger = db_session.query(Transaction).filter(
+            Transaction.game_session_id == settlement.session.id
+        ).order_by(Transaction.id).all()
+        assert [t.type for t in ledger] == [TransactionType.BET, TransactionType.WIN]
+        assert ledger[0].balance_before == Decimal('100.00')
+        assert ledger[0].balance_after == Decimal('90.00')
+        assert ledger[1].balance_before == Decimal('90.00')
+        assert ledger[1].balance_after == Decimal('140.00')
+
+    def test_losing_round_has_no_win_row(self, db_session, test_user):
+        """A losing round only records the bet"""
+        settlement = GameService(db_session).create_game_session(
+            user_id=test_user.id,
+            game_type="coin_flip",
+            bet_amount=Decimal('25.00'),
+            winnings=Decimal('0.00')
+        )
+
+        assert settlement.balance == Decimal('75.00')
+        ledger = db_session.query(Transaction).filter(
+            Transaction.game_session_id == settlement.session.id
+        ).all()
+        assert [t.type for t in ledger] == [TransactionType.BET]
+
+    def test_insufficient_balance(self, db_session, test_user):
+        """A bet above the balance is rejected"""
+        with pytest.raises(HTTPException) as exc_info:
+            GameService(db_session).create_game_session(
+                user_id=test_user.id,
+                game_type="reel_slot",
+                bet_amount=Decimal('100.01'),
+                winnings=Decimal('500.00')
+            )
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Insufficient balance"
+
+    def test_unknown_user(self, db_session):
+        """Settling for a missing user returns 404"""
+        with pytest.raises(HTTPException) as exc_info:
+            GameService(db_session).create_game_session(
+                user_id=999999,
+                game_type="reel_slot",
+                bet_amount=Decimal('1.00'),
+                winnings=Decimal('0.00')
+            )
+
+        assert exc_info.value.status_code == 404
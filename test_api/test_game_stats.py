@@ -0,0 +1,90 @@
+import pytest
+from decimal import Decimal
+from sqlalchemy import event, update
+from sqlalchemy.engine import Engine
+
+from app.models.game_session import GameSession
+from app.models.user_game_stats import UserGameStats, ALL_GAMES
+from app.services.game_service import GameService, GameRound
+from app.services.stats_service import GameStatsService
+from Games.money import Money
+
+
+@pytest.fixture
+def settled(db_session, test_user):
+    """Two coin flips (one won) and a two-round slot batch"""
+    game_service = GameService(db_session)
+    game_service.create_game_session(test_user.id, "coin_flip", Decimal("10.00"), Decimal("20.00"))
+    game_service.create_game_session(test_user.id, "coin_flip", Decimal("5.00"), Decimal("0.00"))
+    game_service.create_game_sessions(test_user.id, "reel_slot", [
+        GameRound(Money(100), Money(0), {}),
+        GameRound(Money(250), Money(1000), {}),
+    ])
+    return test_user
+
+
+class TestGameStats:
+    """Test the incrementally maintained user_game_stats rollup"""
+
+    def test_settlement_updates_rollup(self, db_session, settled):
+        stats_service = GameStatsService(db_session)
+
+        assert stats_service.get_stats(settled.id) == {
+            "total_games": 4, "total_bet": 18.5, "total_won": 30.0, "net_result": 11.5
+        }
+        assert stats_service.get_stats(settled.id, "coin_flip")["total_games"] == 2
+        assert stats_service.get_stats(settled.id, "reel_slot")["net_result"] == 6.5
+        assert stats_service.check() == []
+
+    def test_failed_settlement_leaves_rollup_alone(self, db_session, test_user):
+        with pytest.raises(Exception):
+            GameService(db_session).create_game_session(test_user.id, "coin_flip", Decimal("500.00"), Decimal("0.00"))
+
+        assert db_session.query(UserGameStats).count() == 0
+
+    def test_check_finds_drift_and_rebuild_fixes_it(self, db_session, settled):
+        db_session.execute(
+            update(UserGameStats)
+            .where(UserGameStats.user_id == settled.id, UserGameStats.game_type == "coin_flip")
+            .values(total_games=7)
+        )
+        db_session.query(UserGameStats).filter(UserGameStats.game_type == "reel_slot").delete()
+        db_session.add(UserGameStats(user_id=settled.id, game_type="dice_roll", total_games=1,
+                                     total_bet=1, total_won=0, net_result=-1))
+        db_session.commit()
+
+        mismatches = {(m.game_type, m.expected is None, m.actual is None) for m in GameStatsService(db_session).check()}
+        assert mismatches == {("coin_flip", False, False), ("reel_slot", False, True), ("dice_roll", True, False)}
+
+        assert GameStatsService(db_session).rebuild() == 1
+        assert GameStatsService(db_session).check() == []
+        assert GameStatsService(db_session).get_stats(settled.id)["total_games"] == 4
+
+    def test_stats_endpoint_reads_rollup(self, authenticated_client, settled):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", record)
+        try:
+            response = authenticated_client.get("/api/user/stats")
+        finally:
+            event.remove(Engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert response.json()["stats"]["total_games"] == 4
+        assert not any("FROM game_sessions" in statement for statement in statements)
+
+        by_game = authenticated_client.get("/api/user/stats", params={"game_type": "reel_slot"}).json()
+        assert by_game["stats"] == {"total_games": 2, "total_bet": 3.5, "total_won": 10.0, "net_result": 6.5}
+
+    def test_played_rounds_are_counted(self, authenticated_client, db_session, test_user):
+        authenticated_client.post("/api/games/roulette/batch",
+                                  json={"rounds": [{"bet_amount": "1.00", "choice": "Red"}] * 3})
+        authenticated_client.post("/api/games/coin/batch", json={"rounds": [{"bet_amount": "2.00", "choice": "Heads"}]})
+
+        stats = authenticated_client.get("/api/user/stats").json()["stats"]
+        assert stats["total_games"] == db_session.query(GameSession).count() == 4
+        assert stats["total_bet"] == 5.0
+        assert GameStatsService(db_session).check() == []
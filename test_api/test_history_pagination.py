@@ -0,0 +1,113 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from app.models.game_session import GameSession
+from app.models.transaction import Transaction, TransactionType, TransactionStatus
+from app.pagination import decode_cursor, encode_cursor
+
+
+def add_transactions(db_session, user, count, created_at=None):
+    for i in range(count):
+        db_session.add(Transaction(
+            user_id=user.id,
+            type=TransactionType.DEPOSIT,
+            status=TransactionStatus.COMPLETED,
+            amount=Decimal("1.00"),
+            balance_before=Decimal("100.00"),
+            balance_after=Decimal("101.00"),
+            description=f"deposit {i}",
+            created_at=created_at,
+        ))
+    db_session.commit()
+
+
+def walk(client, path, per_page):
+    """Follows next_cursor to the end, returning every page"""
+    pages = []
+    cursor = None
+    while True:
+        params = {"per_page": per_page}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(path, params=params)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = pages[-1]["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+class TestHistoryPagination:
+    """Test keyset pagination of transaction and game history"""
+
+    def test_cursor_round_trip(self):
+        created_at = datetime(2026, 1, 2, 3, 4, 5)
+        assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+    def test_walk_same_second_rows_without_gaps_or_duplicates(self, authenticated_client, db_session, test_user):
+        # All inserted in the same second, so only the id tiebreaker separates them
+        add_transactions(db_session, test_user, 7)
+
+        pages = walk(authenticated_client, "/api/user/transactions", per_page=3)
+
+        assert [len(page["transactions"]) for page in pages] == [3, 3, 1]
+        ids = [t["id"] for page in pages for t in page["transactions"]]
+        assert ids == sorted(ids, reverse=True)
+        assert len(set(ids)) == 7
+
+    def test_walk_is_newest_first_across_timestamps(self, authenticated_client, db_session, test_user):
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        # Older rows get higher ids, so ordering must come from created_at
+        add_transactions(db_session, test_user, 2, created_at=now)
+        add_transactions(db_session, test_user, 2, created_at=now - timedelta(days=1))
+
+        pages = walk(authenticated_client, "/api/user/transactions", per_page=1)
+
+        timestamps = [page["transactions"][0]["created_at"] for page in pages]
+        assert len(timestamps) == 4
+        assert timestamps == sorted(timestamps, reverse=True)
+
+    def test_rows_added_while_paging_do_not_shift_pages(self, authenticated_client, db_session, test_user):
+        add_transactions(db_session, test_user, 4)
+        first = authenticated_client.get("/api/user/transactions", params={"per_page": 2}).json()
+
+        add_transactions(db_session, test_user, 3)
+        second = authenticated_client.get("/api/user/transactions", params={
+            "per_page": 2, "cursor": first["next_cursor"]
+        }).json()
+
+        first_ids = [t["id"] for t in first["transactions"]]
+        second_ids = [t["id"] for t in second["transactions"]]
+        assert max(second_ids) < min(first_ids)
+
+    def test_game_history_pages(self, authenticated_client, db_session, test_user):
+        for _ in range(5):
+            db_session.add(GameSession(
+                user_id=test_user.id,
+                game_type="coin_flip",
+                bet_amount=Decimal("1.00"),
+                win_amount=Decimal("0.00"),
+                net_result=Decimal("-1.00"),
+            ))
+        db_session.commit()
+
+        pages = walk(authenticated_client, "/api/user/games", per_page=2)
+
+        ids = [s["id"] for page in pages for s in page["sessions"]]
+        assert len(pages) == 3
+        assert ids == sorted(set(ids), reverse=True) and len(ids) == 5
+
+    def test_total_is_opt_in(self, authenticated_client, db_session, test_user):
+        add_transactions(db_session, test_user, 3)
+
+        assert authenticated_client.get("/api/user/transactions").json()["total_count"] is None
+        transactions = authenticated_client.get("/api/user/transactions", params={"include_total": True}).json()
+        assert transactions["total_count"] == 3
+        assert authenticated_client.get("/api/user/games", params={"include_total": True}).json()["total_count"] == 0
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "bm90IGpzb24", "WzEsMiwzXQ"])
+    def test_invalid_cursor(self, authenticated_client, cursor):
+        response = authenticated_client.get("/api/user/transactions", params={"cursor": cursor})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
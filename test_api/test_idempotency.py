@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from app.idempotency import IDEMPOTENCY_LOCK_SECONDS, claim_idempotency_key, request_hash
+from app.models.game_session import GameSession
+from app.models.idempotency_key import IdempotencyKey
+from app.models.transaction import Transaction, TransactionType
+
+
+def balance(client):
+    return Decimal(client.get("/api/auth/balance").json()["balance"])
+
+
+class TestIdempotency:
+    """Test Idempotency-Key handling on game and wallet endpoints"""
+
+    def test_replay_returns_first_response_without_replaying(self, authenticated_client, db_session):
+        headers = {"Idempotency-Key": "flip-1"}
+        first = authenticated_client.post("/api/games/coin/", json={"bet": "10.00", "choice": "heads"}, headers=headers)
+        after_first = balance(authenticated_client)
+
+        replay = authenticated_client.post("/api/games/coin/", json={"bet": "10.00", "choice": "heads"},
+                                           headers=headers)
+
+        assert first.status_code == replay.status_code == 200
+        assert replay.json() == first.json()
+        assert replay.headers["Idempotent-Replayed"] == "true"
+        assert balance(authenticated_client) == after_first
+        assert db_session.query(GameSession).count() == 1
+        bet = db_session.query(Transaction).filter(Transaction.type == TransactionType.BET).one()
+        assert bet.reference_id == "flip-1"
+
+    def test_batch_is_settled_once(self, authenticated_client, db_session):
+        body = {"rounds": [{"bet_amount": "1.00", "choice": "Red"}] * 3}
+        headers = {"Idempotency-Key": "batch-1"}
+
+        first = authenticated_client.post("/api/games/roulette/batch", json=body, headers=headers)
+        replay = authenticated_client.post("/api/games/roulette/batch", json=body, headers=headers)
+
+        assert replay.json() == first.json()
+        assert db_session.query(GameSession).count() == 3
+        references = [t.reference_id for t in db_session.query(Transaction).order_by(Transaction.id)]
+        assert references.count("batch-1") == 1
+
+    def test_deposit_replay(self, authenticated_client, db_session):
+        headers = {"Idempotency-Key": "deposit-1"}
+        first = authenticated_client.post("/api/auth/deposit", json={"amount": "25.00"}, headers=headers)
+        replay = authenticated_client.post("/api/auth/deposit", json={"amount": "25.00"}, headers=headers)
+
+        assert replay.json() == first.json()
+        assert balance(authenticated_client) == Decimal("125.00")
+        deposits = db_session.query(Transaction).filter(Transaction.type == TransactionType.DEPOSIT).all()
+        assert [t.reference_id for t in deposits] == ["deposit-1"]
+
+    def test_key_reused_for_different_request(self, authenticated_client):
+        headers = {"Idempotency-Key": "deposit-2"}
+        authenticated_client.post("/api/auth/deposit", json={"amount": "25.00"}, headers=headers)
+
+        response = authenticated_client.post("/api/auth/deposit", json={"amount": "30.00"}, headers=headers)
+
+        assert response.status_code == 422
+        assert balance(authenticated_client) == Decimal("125.00")
+
+    def test_failed_request_releases_key(self, authenticated_client, db_session):
+        headers = {"Idempotency-Key": "too-much"}
+        response = authenticated_client.post("/api/auth/withdraw", json={"amount": "500.00"}, headers=headers)
+        assert response.status_code == 400
+        assert db_session.query(IdempotencyKey).count() == 0
+
+        authenticated_client.post("/api/auth/deposit", json={"amount": "500.00"})
+        response = authenticated_client.post("/api/auth/withdraw", json={"amount": "500.00"}, headers=headers)
+        assert response.status_code == 200
+
+    def test_in_flight_key_conflicts(self, authenticated_client, db_session, test_user):
+        body = b'{"amount":"25.00"}'
+        fingerprint = request_hash("POST", "/api/auth/deposit", body)
+        assert claim_idempotency_key(db_session, test_user.id, "slow", fingerprint) is None
+
+        response = authenticated_client.post("/api/auth/deposit", content=body, headers={
+            "Idempotency-Key": "slow", "Content-Type": "application/json"
+        })
+
+        assert response.status_code == 409
+        assert response.headers["Retry-After"] == "1"
+        assert balance(authenticated_client) == Decimal("100.00")
+
+    def test_abandoned_claim_is_taken_over(self, db_session, test_user):
+        started = datetime.now(timezone.utc).replace(microsecond=0)
+        assert claim_idempotency_key(db_session, test_user.id, "crashed", "a" * 64, now=started) is None
+
+        soon = started + timedelta(seconds=1)
+        assert claim_idempotency_key(db_session, test_user.id, "crashed", "a" * 64, now=soon) is not None
+        later = started + timedelta(seconds=IDEMPOTENCY_LOCK_SECONDS + 1)
+        assert claim_idempotency_key(db_session, test_user.id, "crashed", "a" * 64, now=later) is None
+
+    def test_keys_are_per_user(self, authenticated_client, client, db_session):
+        authenticated_client.post("/api/auth/deposit", json={"amount": "25.00"}, headers={"Idempotency-Key": "shared"})
+
+        client.post("/api/auth/register", json={
+            "username": "otheruser", "email": "other@example.com", "password": "otherpassword"
+        })
+        token = client.post("/api/auth/login", json={
+            "username": "otheruser", "password": "otherpassword"
+        }).json()["access_token"]
+        response = client.post("/api/auth/deposit", json={"amount": "25.00"}, headers={
+            "Idempotency-Key": "shared", "Authorization": f"Bearer {token}"
+        })
+
+        assert response.status_code == 200
+        assert "Idempotent-Replayed" not in response.headers
+        assert db_session.query(IdempotencyKey).count() == 2
+
+    def test_without_key_every_request_runs(self, authenticated_client, db_session):
+        for _ in range(2):
+            response = authenticated_client.post("/api/games/coin/", json={"bet": "1.00", "choice": "tails"})
+            assert response.status_code == 200
+
+        assert db_session.query(GameSession).count() == 2
+        assert db_session.query(IdempotencyKey).count() == 0
+
+    def test_overlong_key_is_rejected(self, authenticated_client):
+        response = authenticated_client.post("/api/auth/deposit", json={"amount": "1.00"},
+                                             headers={"Idempotency-Key": "k" * 101})
+        assert response.status_code == 400
@@ -0,0 +1,152 @@
+import fcntl
+import pytest
+from datetime import datetime, timezone
+from decimal import Decimal
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.ledger import LedgerEntry, LedgerWriter, discard_line, ledger_writer
+from app.models.game_session import GameSession
+from app.models.ledger_checkpoint import LedgerCheckpoint
+from app.models.transaction import Transaction, TransactionType
+from app.services.game_service import GameService, GameRound
+from app.services.stats_service import GameStatsService
+from Games.money import Money
+
+
+@pytest.fixture
+def writer_engine(db_engine):
+    """Separate connections to the test database for the writer thread"""
+    engine = create_engine(db_engine.url, connect_args={"check_same_thread": False})
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def write_behind(monkeypatch, tmp_path, writer_engine, db_session):
+    """Runs the app's ledger writer against the test database"""
+    monkeypatch.setattr(ledger_writer, "journal_dir", tmp_path)
+    monkeypatch.setattr(ledger_writer, "flush_interval", 0.002)
+    ledger_writer.start(sessionmaker(bind=writer_engine))
+    yield ledger_writer
+    ledger_writer.stop()
+
+
+def journal_line(seq, user_id, bet=100, won=0):
+    entry = LedgerEntry(seq, user_id, "coin_flip", [(bet, won, {"seq": seq})], Decimal("100.00"),
+                        datetime(2026, 10, 1, tzinfo=timezone.utc))
+    return entry.to_json() + "\n"
+
+
+class TestLedgerWriter:
+    """Test the write-behind ledger pipeline"""
+
+    def test_balance_is_synchronous_and_rows_follow(self, write_behind, db_session, test_user):
+        settlement = GameService(db_session).create_game_session(
+            test_user.id, "coin_flip", Decimal("10.00"), Decimal("20.00"), {"outcome": "heads"}
+        )
+
+        assert settlement.session is None
+        assert settlement.balance == Decimal("110.00")
+        assert GameStatsService(db_session).get_stats(test_user.id)["total_games"] == 1
+
+        assert write_behind.fence()
+        db_session.expire_all()
+        session = db_session.query(GameSession).one()
+        assert session.game_data == {"outcome": "heads"}
+        ledger = db_session.query(Transaction).order_by(Transaction.id).all()
+        assert [(t.type, t.balance_before, t.balance_after) for t in ledger] == [
+            (TransactionType.BET, Decimal("100.00"), Decimal("90.00")),
+            (TransactionType.WIN, Decimal("90.00"), Decimal("110.00")),
+        ]
+        assert all(t.game_session_id == session.id for t in ledger)
+
+    def test_rounds_share_group_commits(self, write_behind, writer_engine, db_session, test_user):
+        commits = []
+        event.listen(writer_engine, "commit", lambda conn: commits.append(conn))
+        write_behind.flush_interval = 0.05
+
+        for _ in range(20):
+            write_behind.submit(write_behind.journal(test_user.id, "coin_flip", [(100, 0, None)], Decimal("100.00")))
+        assert write_behind.fence()
+
+        assert db_session.query(GameSession).count() == 20
+        assert len(commits) < 20
+
+    def test_entries_are_written_in_journal_order(self, write_behind, db_session, test_user):
+        first = write_behind.journal(test_user.id, "coin_flip", [(100, 0, {"seq": 1})], Decimal("100.00"))
+        second = write_behind.journal(test_user.id, "coin_flip", [(100, 0, {"seq": 2})], Decimal("99.00"))
+
+        # The second balance commit finished first; its rows wait for the first entry
+        write_behind.submit(second)
+        assert not write_behind.fence(timeout=0.05)
+        write_behind.submit(first)
+        assert write_behind.fence()
+
+        sessions = db_session.query(GameSession).order_by(GameSession.id).all()
+        assert [s.game_data["seq"] for s in sessions] == [1, 2]
+
+    def test_failed_balance_commit_discards_the_entry(self, write_behind, monkeypatch, db_session, test_user):
+        def fail():
+            raise RuntimeError("connection lost")
+
+        with monkeypatch.context() as m, pytest.raises(HTTPException):
+            m.setattr(db_session, "commit", fail)
+            GameService(db_session).create_game_session(test_user.id, "coin_flip", Decimal("10.00"), Decimal("0"))
+        write_behind.submit(write_behind.journal(test_user.id, "coin_flip", [(100, 0, None)], Decimal("100.00")))
+
+        assert write_behind.fence()
+        assert db_session.query(GameSession).count() == 1
+        assert '{"discard": 1}' in (write_behind.journal_dir / write_behind._journal_name).read_text()
+
+    def test_flush_before_ack(self, write_behind, monkeypatch, db_session, test_user):
+        monkeypatch.setattr(write_behind, "flush_before_ack", True)
+
+        GameService(db_session).create_game_sessions(test_user.id, "reel_slot", [
+            GameRound(Money(100), Money(0), {}),
+            GameRound(Money(100), Money(500), {}),
+        ])
+
+        # No fence: the call only returned once the rows were committed
+        assert db_session.query(GameSession).count() == 2
+        assert db_session.query(Transaction).count() == 3
+
+    def test_history_reads_queued_rounds(self, write_behind, authenticated_client):
+        authenticated_client.post("/api/games/roulette/batch",
+                                  json={"rounds": [{"bet_amount": "1.00", "choice": "Red"}] * 3})
+
+        history = authenticated_client.get("/api/user/games").json()
+        assert len(history["sessions"]) == 3
+
+    def test_recovers_uncommitted_entries(self, tmp_path, writer_engine, db_session, test_user):
+        orphan = tmp_path / "crashed-worker.journal"
+        orphan.write_text(
+            "".join(journal_line(seq, test_user.id) for seq in (1, 2, 3, 4)) + discard_line(3) + '{"seq": 5, "user_'
+        )
+        # Entry 1 made it into the database before the crash
+        db_session.add(LedgerCheckpoint(journal=orphan.name, last_seq=1))
+        db_session.commit()
+
+        writer = LedgerWriter(journal_dir=tmp_path)
+        writer.start(sessionmaker(bind=writer_engine))
+        writer.stop()
+
+        sessions = db_session.query(GameSession).order_by(GameSession.id).all()
+        assert [s.game_data["seq"] for s in sessions] == [2, 4]
+        assert not orphan.exists()
+        db_session.expire_all()
+        assert db_session.query(LedgerCheckpoint).count() == 0
+
+    def test_live_journals_are_left_alone(self, tmp_path, writer_engine, db_session, test_user):
+        live = tmp_path / "running-worker.journal"
+        live.write_text(journal_line(1, test_user.id))
+
+        with open(live) as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            writer = LedgerWriter(journal_dir=tmp_path)
+            writer.start(sessionmaker(bind=writer_engine))
+            writer.stop()
+
+        assert live.exists()
+        assert db_session.query(GameSession).count() == 0
@@ -0,0 +1,96 @@
+import json
+import re
+import pytest
+from threading import Thread
+
+from app.metrics import MetricsRegistry
+
+
+def sample(text, line_start):
+    """Value of the exposition line starting with line_start, 0 if absent"""
+    for line in text.splitlines():
+        if line.startswith(line_start + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+class TestMetricsRegistry:
+    """Test the per-thread counters and their aggregation over workers"""
+
+    def test_counts_from_many_threads(self):
+        registry = MetricsRegistry(directory=None)
+        spins = registry.counter("spins_total", "Spins")
+
+        threads = [Thread(target=lambda: [spins.inc(game="dice") for _ in range(1000)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sample(registry.render(), 'spins_total{game="dice"}') == 4000
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry(directory=None)
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value)
+
+        text = registry.render()
+
+        assert sample(text, 'latency_seconds_bucket{le="0.1"}') == 2
+        assert sample(text, 'latency_seconds_bucket{le="1"}') == 3
+        assert sample(text, 'latency_seconds_bucket{le="+Inf"}') == 4
+        assert sample(text, "latency_seconds_count") == 4
+        assert sample(text, "latency_seconds_sum") == pytest.approx(3.65)
+
+    def test_sums_workers_and_ratios_over_the_totals(self, tmp_path):
+        workers = [MetricsRegistry(directory=str(tmp_path)) for _ in range(2)]
+        workers[1]._file_name = "other-worker.json"
+        for worker, (paid, wagered) in zip(workers, ((90, 100), (0, 100))):
+            paid_cents = worker.counter("paid_total", "Paid")
+            wagered_cents = worker.counter("wagered_total", "Wagered")
+            worker.ratio("rtp", "RTP", paid_cents, wagered_cents)
+            paid_cents.inc(paid, game="slot")
+            wagered_cents.inc(wagered, game="slot")
+        workers[1].flush()
+
+        text = workers[0].render()
+
+        assert sample(text, 'wagered_total{game="slot"}') == 200
+        assert sample(text, 'rtp{game="slot"}') == pytest.approx(0.45)
+
+    def test_gauges_of_stale_workers_are_dropped(self, tmp_path):
+        workers = [MetricsRegistry(directory=str(tmp_path)) for _ in range(2)]
+        workers[1]._file_name = "exited-worker.json"
+        for worker in workers:
+            worker.gauge("in_flight", "In flight").add(1)
+            worker.counter("done_total", "Done").inc()
+        workers[1].flush()
+        exited = tmp_path / "exited-worker.json"
+        exited.write_text(json.dumps({**json.loads(exited.read_text()), "written_at": 0}))
+
+        text = workers[0].render()
+
+        assert sample(text, "in_flight") == 1
+        assert sample(text, "done_total") == 2
+
+
+class TestMetricsEndpoint:
+    """Test /metrics against real requests"""
+
+    def test_reports_game_rounds_and_route_latency(self, authenticated_client):
+        before = authenticated_client.get("/metrics").text
+        authenticated_client.post("/api/games/dice/play", json={"bet_amount": "2.00", "number": 3})
+
+        response = authenticated_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        rounds = 'slotbazaar_game_rounds_total{game="dice_roll"}'
+        wagered = 'slotbazaar_game_wagered_cents_total{game="dice_roll"}'
+        assert sample(response.text, rounds) == sample(before, rounds) + 1
+        assert sample(response.text, wagered) == sample(before, wagered) + 200
+        assert re.search(r'slotbazaar_game_rtp\{game="dice_roll"\} [0-9.e-]+', response.text)
+        assert ('slotbazaar_http_request_duration_seconds_count'
+                '{method="POST",route="/api/games/dice/play",status="200"}') in response.text
+        assert re.search(r'slotbazaar_cache_(hits|misses)_total\{cache="token"\} [0-9]+', response.text)
@@ -0,0 +1,96 @@
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from app.models.transaction import Transaction, TransactionType, TransactionStatus
+from app.models.user_game_stats import ArchivedGameStats
+from app.partitions import (
+    add_months, archive_month, create_partition_sql, ensure_partitions, partition_month,
+    partition_name, recent_history_since,
+)
+from app.services.game_service import GameService
+from app.services.stats_service import GameStatsService
+
+
+class TestPartitionHelpers:
+    """Test monthly partition naming and DDL"""
+
+    def test_month_arithmetic(self):
+        assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_partition_names_round_trip(self):
+        name = partition_name("game_sessions", date(2026, 3, 1))
+        assert name == "game_sessions_y2026m03"
+        assert partition_month(name) == date(2026, 3, 1)
+        assert partition_month("game_sessions_default") is None
+
+    def test_partition_bounds(self):
+        ddl = str(create_partition_sql("transactions", date(2026, 12, 1)))
+        assert 'PARTITION OF "transactions"' in ddl
+        assert "FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')" in ddl
+
+    def test_sqlite_is_left_unpartitioned(self, db_engine):
+        assert ensure_partitions(db_engine) == []
+
+    def test_only_closed_months_are_archived(self, db_engine):
+        with pytest.raises(ValueError):
+            archive_month(date(2026, 10, 1), db_engine, today=date(2026, 10, 17))
+
+
+class TestHistoryWindow:
+    """Test that history reads recent rows unless asked for older ones"""
+
+    def test_window(self, monkeypatch):
+        now = datetime(2026, 10, 17, tzinfo=timezone.utc)
+        monkeypatch.setattr("app.partitions.HISTORY_WINDOW_DAYS", 30)
+        assert recent_history_since(now=now) == now - timedelta(days=30)
+        assert recent_history_since(include_older=True, now=now) is None
+
+        monkeypatch.setattr("app.partitions.HISTORY_WINDOW_DAYS", 0)
+        assert recent_history_since(now=now) is None
+
+    def test_older_rows_need_include_older(self, authenticated_client, db_session, test_user):
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        for created_at in (now, now - timedelta(days=400)):
+            db_session.add(Transaction(
+                user_id=test_user.id,
+                type=TransactionType.DEPOSIT,
+                status=TransactionStatus.COMPLETED,
+                amount=Decimal("1.00"),
+                balance_before=Decimal("100.00"),
+                balance_after=Decimal("101.00"),
+                created_at=created_at,
+            ))
+        db_session.commit()
+
+        recent = authenticated_client.get("/api/user/transactions", params={"include_total": True}).json()
+        assert len(recent["transactions"]) == 1
+        assert recent["total_count"] == 1
+
+        everything = authenticated_client.get(
+            "/api/user/transactions", params={"include_total": True, "include_older": True}
+        ).json()
+        assert len(everything["transactions"]) == 2
+        assert everything["total_count"] == 2
+
+
+class TestArchivedStats:
+    """Test that archived months still count towards the stats rollup"""
+
+    def test_rebuild_keeps_archived_totals(self, db_session, test_user):
+        GameService(db_session).create_game_session(test_user.id, "coin_flip", Decimal("10.00"), Decimal("20.00"))
+        # As if an earlier month of coin flips had been archived
+        db_session.add(ArchivedGameStats(user_id=test_user.id, game_type="coin_flip", total_games=3,
+                                         total_bet=Decimal("3.00"), total_won=Decimal("0.00"),
+                                         net_result=Decimal("-3.00")))
+        db_session.commit()
+
+        stats_service = GameStatsService(db_session)
+        assert {m.game_type for m in stats_service.check()} == {"coin_flip", "*"}
+
+        stats_service.rebuild(test_user.id)
+        assert stats_service.check() == []
+        assert stats_service.get_stats(test_user.id) == {
+            "total_games": 4, "total_bet": 13.0, "total_won": 20.0, "net_result": 7.0
+        }
@@ -0,0 +1,63 @@
+import pytest
+from fastapi import HTTPException
+
+from app.models.user import User
+from app.passwords import PasswordHasher, hash_rounds, password_hasher
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(rounds=4, workers=1, queue_depth=4)
+    yield hasher
+    hasher.shutdown()
+
+
+class TestPasswordHasher:
+    """Test bcrypt on the password process pool"""
+
+    def test_hash_and_verify_in_pool(self, hasher):
+        hashed = hasher.hash("s3cret")
+
+        assert hash_rounds(hashed) == 4
+        assert hasher.verify("s3cret", hashed)
+        assert not hasher.verify("wrong", hashed)
+
+    def test_inline_when_pool_disabled(self):
+        hasher = PasswordHasher(rounds=4, workers=0)
+
+        assert hasher.verify("s3cret", hasher.hash("s3cret"))
+
+    def test_full_queue_is_rejected(self):
+        hasher = PasswordHasher(rounds=4, workers=0, queue_depth=1)
+        hasher._slots.acquire()  # The one slot is taken by another request
+
+        with pytest.raises(HTTPException) as exc_info:
+            hasher.hash("s3cret")
+        assert exc_info.value.status_code == 503
+
+    def test_zero_queue_depth_is_unbounded(self):
+        hasher = PasswordHasher(rounds=4, workers=0, queue_depth=0)
+
+        assert hasher.verify("s3cret", hasher.hash("s3cret"))
+
+    def test_needs_rehash_on_cost_change(self, hasher):
+        hashed = hasher.hash("s3cret")
+        hasher.rounds = 5
+
+        assert hasher.needs_rehash(hashed)
+        assert hash_rounds("not-a-bcrypt-hash") is None
+
+
+def test_login_rehashes_on_cost_change(client, db_session, test_user, monkeypatch):
+    monkeypatch.setattr(password_hasher, "rounds", 4)
+
+    response = client.post("/api/auth/login", json={
+        "username": "testuser",
+        "password": "testpassword"
+    })
+
+    assert response.status_code == 200
+    db_session.expire_all()
+    hashed = db_session.query(User.hashed_password).filter(User.id == test_user.id).scalar()
+    assert hash_rounds(hashed) == 4
+    assert password_hasher.verify("testpassword", hashed)
@@ -0,0 +1,118 @@
+import pytest
+from decimal import Decimal
+from sqlalchemy import event, update
+from sqlalchemy.engine import Engine
+
+from app.models.user import User
+from app.principals import PrincipalCache, principal_cache
+from app.services.user_service import UserService
+
+
+@pytest.fixture
+def user_selects():
+    """Counts SELECTs against the users table on any engine"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(Engine, "before_cursor_execute", record)
+
+
+class TestPrincipalCache:
+    """Test the bounded principal cache"""
+
+    def test_lru_eviction(self):
+        cache = PrincipalCache(max_entries=2)
+        for user_id in (1, 2):
+            cache.put(user_id, f"user{user_id}", True, cache.generation)
+        cache.get(1)
+        cache.put(3, "user3", True, cache.generation)
+
+        assert cache.get(2) is None
+        assert cache.get(1).username == "user1"
+        assert cache.get(3).username == "user3"
+
+    def test_entries_expire(self, monkeypatch):
+        cache = PrincipalCache(ttl_seconds=30)
+        now = [1000.0]
+        monkeypatch.setattr("app.principals.time.monotonic", lambda: now[0])
+        cache.put(1, "user1", True, cache.generation)
+
+        now[0] += 29
+        assert cache.get(1) is not None
+        now[0] += 1
+        assert cache.get(1) is None
+
+    def test_fill_racing_an_invalidation_is_dropped(self):
+        cache = PrincipalCache()
+        generation = cache.generation
+        cache.invalidate(1)  # e.g. the user was disabled while the row was being read
+
+        principal = cache.put(1, "user1", True, generation)
+
+        assert principal.is_active
+        assert cache.get(1) is None
+
+    def test_balance_change_bumps_version(self):
+        cache = PrincipalCache()
+        before = cache.put(1, "user1", True, cache.generation)
+        cache.balance_changed(1)
+
+        assert cache.get(1).balance_version > before.balance_version
+
+
+class TestCachedAuthentication:
+    """Test that authenticated requests reuse cached principals"""
+
+    def test_repeat_requests_skip_user_lookup(self, authenticated_client, user_selects):
+        for _ in range(3):
+            response = authenticated_client.post("/api/games/slot/play", json={"bet_amount": "1.00"})
+            assert response.status_code == 200
+
+        # Only the first request loads the principal
+        assert len(user_selects) == 1
+
+    def test_settlement_bumps_balance_version(self, authenticated_client, test_user):
+        authenticated_client.post("/api/games/slot/play", json={"bet_amount": "1.00"})
+        version = principal_cache.get(test_user.id).balance_version
+
+        authenticated_client.post("/api/games/slot/play", json={"bet_amount": "1.00"})
+
+        assert principal_cache.get(test_user.id).balance_version > version
+
+    def test_disabling_user_takes_effect_immediately(self, authenticated_client, db_session, test_user):
+        assert authenticated_client.get("/api/auth/balance").status_code == 200
+
+        UserService(db_session).set_active(test_user.id, False)
+        response = authenticated_client.get("/api/auth/balance")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Inactive user"
+
+    def test_user_disabled_by_another_worker_cannot_play(self, authenticated_client, db_session, test_user):
+        """Another worker's invalidation doesn't reach this cache, but the balance guard checks is_active"""
+        assert authenticated_client.get("/api/auth/balance").status_code == 200
+        db_session.execute(update(User).where(User.id == test_user.id).values(is_active=False))
+        db_session.commit()
+
+        response = authenticated_client.post("/api/games/slot/play", json={"bet_amount": "1.00"})
+
+        assert principal_cache.get(test_user.id).is_active
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Inactive user"
+        assert UserService(db_session).get_balance(test_user.id) == Decimal("100.00")
+
+    def test_insufficient_balance_is_enforced_at_settlement(self, authenticated_client):
+        response = authenticated_client.post("/api/games/slot/play", json={"bet_amount": "500.00"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Insufficient balance"
+
+    def test_balance_is_read_fresh(self, authenticated_client):
+        authenticated_client.post("/api/auth/deposit", json={"amount": "25.00"})
+
+        assert Decimal(str(authenticated_client.get("/api/auth/balance").json()["balance"])) == Decimal('125.00')
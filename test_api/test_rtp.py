@@ -0,0 +1,11 @@
+import pytest
+
+
+def test_verified_rtp_report(client):
+    response = client.get("/api/games/rtp/")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["reel_slot"][0]["rtp_exact"] == "26/27"
+    assert data["simple_roulette"][0]["choice"] == "Red"
+    assert data["simple_roulette"][0]["rtp_exact"] == "36/37"
+    assert len(data["dice_roll"]) == 6
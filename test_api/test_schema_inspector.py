@@ -0,0 +1,111 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db import get_db
+from app.main import app
+from app.models.base import Base
+from app.models.game_session import GameSession
+from app.models.transaction import Transaction
+from app.schema_inspector import inspect_schema, schema_capabilities
+
+# users as created before is_verified/last_login were added
+LEGACY_USERS_DDL = """
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY,
+    username VARCHAR(50) UNIQUE NOT NULL,
+    email VARCHAR(100) UNIQUE NOT NULL,
+    hashed_password VARCHAR(255) NOT NULL,
+    balance NUMERIC(12, 2) NOT NULL DEFAULT 0,
+    is_active BOOLEAN NOT NULL DEFAULT 1,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+@pytest.fixture
+def restore_capabilities():
+    yield
+    schema_capabilities.record(None)
+
+
+@pytest.fixture
+def legacy_engine(tmp_path, restore_capabilities):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}", connect_args={"check_same_thread": False})
+    with engine.begin() as connection:
+        connection.execute(text(LEGACY_USERS_DDL))
+    Base.metadata.create_all(bind=engine, tables=[GameSession.__table__, Transaction.__table__])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def failed_statements(legacy_engine):
+    """Statements the legacy database rejected"""
+    failures = []
+    event.listen(legacy_engine, "handle_error", lambda context: failures.append(context.statement))
+    return failures
+
+
+@pytest.fixture
+def legacy_client(client, legacy_engine):
+    Session = sessionmaker(bind=legacy_engine, autoflush=False, autocommit=False)
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    inspect_schema(legacy_engine)
+    return client
+
+
+class TestSchemaInspection:
+    """Test recording optional columns once at startup"""
+
+    def test_current_schema(self, db_engine, restore_capabilities):
+        capabilities = inspect_schema(db_engine)
+
+        assert not capabilities.legacy_users
+        assert capabilities.has_user_column("last_login")
+        assert capabilities.has_revoked_tokens
+
+    def test_legacy_schema(self, legacy_engine):
+        capabilities = inspect_schema(legacy_engine)
+
+        assert capabilities.legacy_users
+        assert not capabilities.has_user_column("last_login")
+        assert not capabilities.has_revoked_tokens
+
+    def test_missing_table_assumes_models(self, tmp_path, restore_capabilities):
+        capabilities = inspect_schema(create_engine(f"sqlite:///{tmp_path / 'empty.db'}"))
+
+        assert not capabilities.legacy_users
+
+
+def test_legacy_schema_served_without_failed_queries(legacy_client, failed_statements):
+    """Register, login and /me work on an old schema with no query failing first"""
+    response = legacy_client.post("/api/auth/register", json={
+        "username": "olduser",
+        "email": "old@example.com",
+        "password": "oldpassword"
+    })
+    assert response.status_code == 200
+    assert response.json()["is_verified"] is False
+
+    response = legacy_client.post("/api/auth/login", json={
+        "username": "olduser",
+        "password": "oldpassword"
+    })
+    assert response.status_code == 200
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = legacy_client.get("/api/auth/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["username"] == "olduser"
+
+    assert failed_statements == []
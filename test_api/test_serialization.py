@@ -0,0 +1,100 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from app.models.game_session import GameSession
+from app.models.user import User
+from app.models.transaction import Transaction, TransactionType, TransactionStatus
+from app.schemas.game import GameSessionResponse
+from app.schemas.transaction import TransactionResponse
+from app.serialization import dumps
+from Games.money import Money
+
+
+def pydantic_json(schema, rows):
+    """What the response_model path used to send for these rows"""
+    return [schema.model_validate(row).model_dump(mode="json") for row in rows]
+
+
+class TestSerialization:
+    """Test the orjson response path against the pydantic one"""
+
+    def test_dumps_matches_pydantic_encoding(self):
+        created_at = datetime(2026, 10, 17, 12, 30, 5, 120000, tzinfo=timezone.utc)
+        row = {
+            "amount": Decimal("10.50"),
+            "rate": Decimal("1.92"),
+            "type": TransactionType.DEPOSIT,
+            "created_at": created_at,
+            "winnings": Money(1920),
+        }
+
+        assert json.loads(dumps(row)) == {
+            "amount": "10.50",
+            "rate": "1.92",
+            "type": "deposit",
+            "created_at": "2026-10-17T12:30:05.120000Z",
+            "winnings": "19.20",
+        }
+
+    def test_transaction_history_matches_response_model(self, authenticated_client, db_session, test_user):
+        db_session.add(Transaction(
+            user_id=test_user.id, type=TransactionType.BET, status=TransactionStatus.COMPLETED,
+            amount=Decimal("2.50"), balance_before=Decimal("100.00"), balance_after=Decimal("97.50"),
+            description="Bet for dice_roll", reference_id="ref-1",
+        ))
+        db_session.commit()
+
+        body = authenticated_client.get("/api/user/transactions").json()
+
+        expected = pydantic_json(TransactionResponse, db_session.query(Transaction).all())
+        assert body["transactions"] == expected
+        assert body["next_cursor"] is None and body["per_page"] == 20
+
+    def test_game_history_matches_response_model(self, authenticated_client, db_session, test_user):
+        authenticated_client.post("/api/games/blackjack/play", json={"bet_amount": "3.00"})
+
+        body = authenticated_client.get("/api/user/games").json()
+
+        expected = pydantic_json(GameSessionResponse, db_session.query(GameSession).all())
+        # game_data is left out of lists unless asked for
+        assert body["sessions"] == [{k: v for k, v in s.items() if k != "game_data"} for s in expected]
+        every_field = authenticated_client.get("/api/user/games?fields=" + ",".join(GameSessionResponse.model_fields))
+        assert every_field.json()["sessions"] == expected
+
+    def test_history_fields_projection(self, authenticated_client):
+        authenticated_client.post("/api/auth/deposit", json={"amount": "50.00"})
+
+        body = authenticated_client.get("/api/user/transactions?fields=amount,type&include_total=true").json()
+
+        # The cursor columns always come along
+        assert body["transactions"] == [{"id": body["transactions"][0]["id"], "type": "deposit",
+                                         "amount": "50.00", "created_at": body["transactions"][0]["created_at"]}]
+        assert body["total_count"] == 1
+        assert authenticated_client.get("/api/user/transactions?fields=amount,password").status_code == 400
+
+    def test_game_session_detail_has_game_data(self, authenticated_client, db_session, test_user):
+        authenticated_client.post("/api/games/blackjack/play", json={"bet_amount": "3.00"})
+        session = db_session.query(GameSession).one()
+        other = User(username="otheruser", email="other@example.com", balance=100.00)
+        other.set_password("otherpassword")
+        db_session.add(other)
+        db_session.flush()
+        others_session = GameSession(user_id=other.id, game_type="dice_roll", bet_amount=Decimal("1.00"),
+                                     win_amount=Decimal("0.00"), net_result=Decimal("-1.00"))
+        db_session.add(others_session)
+        db_session.commit()
+
+        body = authenticated_client.get(f"/api/user/games/{session.id}").json()
+
+        assert body == pydantic_json(GameSessionResponse, [session])[0]
+        assert body["game_data"]["player_hand"]
+        assert authenticated_client.get(f"/api/user/games/{others_session.id}").status_code == 404
+
+    def test_play_response_types(self, authenticated_client):
+        dice = authenticated_client.post("/api/games/dice/play", json={"bet_amount": "2.00", "number": 3}).json()
+        highlow = authenticated_client.post("/api/games/highlow/play",
+                                            json={"bet_amount": "2.00", "choice": "low"}).json()
+
+        assert dice["bet"] == "2.00" and isinstance(dice["new_balance"], str)
+        assert highlow["bet"] == 2.0 and isinstance(highlow["new_balance"], float)
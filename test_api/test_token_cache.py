@@ -0,0 +1,109 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from jose import jwt
+
+from app import auth
+from app.auth import create_access_token, verify_token
+from app.models.revoked_token import RevokedToken
+from app.tokens import VerifiedTokenCache, token_cache, token_digest
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Counts full jwt.decode calls made by verify_token"""
+    calls = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+    token_cache.clear()
+    yield calls
+    token_cache.clear()
+
+
+class TestVerifiedTokenCache:
+    """Test skipping re-verification of replayed tokens"""
+
+    def test_replayed_token_is_decoded_once(self, decodes):
+        token = create_access_token({"sub": "7"})
+
+        assert [verify_token(token) for _ in range(3)] == ["7", "7", "7"]
+        assert len(decodes) == 1
+
+    def test_entries_expire_with_the_token(self, monkeypatch):
+        cache = VerifiedTokenCache()
+        now = [1000.0]
+        monkeypatch.setattr("app.tokens.time.time", lambda: now[0])
+        cache.put(b"digest", "7", exp=1030)
+
+        now[0] = 1029
+        assert cache.get(b"digest") == "7"
+        now[0] = 1030
+        assert cache.get(b"digest") is None
+
+    def test_expired_token_is_rejected(self, decodes):
+        token = create_access_token({"sub": "7"}, expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(auth.HTTPException) as exc_info:
+            verify_token(token)
+        assert exc_info.value.status_code == 401
+
+    def test_revoked_token_is_rejected_even_if_cached(self, decodes, db_session):
+        token = create_access_token({"sub": "7"})
+        verify_token(token)
+
+        auth.revoke_token(token, db_session)
+
+        with pytest.raises(auth.HTTPException) as exc_info:
+            verify_token(token)
+        assert exc_info.value.status_code == 401
+        assert token_cache.get(token_digest(token)) is None
+
+    def test_revocation_by_another_worker_is_seen_on_recheck(self, decodes, db_session, monkeypatch):
+        token = create_access_token({"sub": "7"})
+        now = [1000.0]
+        monkeypatch.setattr("app.tokens.time.time", lambda: now[0])
+        monkeypatch.setattr(token_cache, "recheck_seconds", 30)
+        assert verify_token(token, db_session) == "7"
+        # Another worker logs the token out; this one only has it in its verified cache
+        db_session.add(RevokedToken(digest=token_digest(token).hex(),
+                                    expires_at=datetime.now(timezone.utc) + timedelta(minutes=30)))
+        db_session.commit()
+
+        now[0] = 1029
+        assert verify_token(token, db_session) == "7"
+        now[0] = 1030
+        with pytest.raises(auth.HTTPException) as exc_info:
+            verify_token(token, db_session)
+        assert exc_info.value.status_code == 401
+
+    def test_revocations_are_dropped_after_expiry(self, monkeypatch):
+        cache = VerifiedTokenCache()
+        now = [1000.0]
+        monkeypatch.setattr("app.tokens.time.time", lambda: now[0])
+        cache.revoke(b"old", exp=1010)
+
+        now[0] = 1020
+        cache.revoke(b"new", exp=1100)
+
+        assert not cache.is_revoked(b"old")
+        assert cache.is_revoked(b"new")
+
+
+def test_logout_revokes_token(client, test_user):
+    response = client.post("/api/auth/login", json={
+        "username": "testuser",
+        "password": "testpassword"
+    })
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    assert client.get("/api/auth/balance", headers=headers).status_code == 200
+
+    assert client.post("/api/auth/logout", headers=headers).status_code == 200
+
+    assert client.get("/api/auth/balance", headers=headers).status_code == 401
+    # Other workers don't share this one's cache; they find it in revoked_tokens
+    token_cache.clear()
+    assert client.get("/api/auth/balance", headers=headers).status_code == 401
@@ -12,8 +12,8 @@ class TestUserHistory:
         assert response.status_code == 200
         data = response.json()
         assert data["transactions"] == []
-        assert data["total_count"] == 0
-        assert data["page"] == 1
+        assert data["next_cursor"] is None
+        assert data["total_count"] is None
         assert data["per_page"] == 20
 
     def test_get_transaction_history_with_data(self, authenticated_client):
@@ -21,7 +21,7 @@ class TestUserHistory:
         # First make a deposit to create transaction
         authenticated_client.post("/auth/deposit", json={"amount": "50.00"})
         
-        response = authenticated_client.get("/user/transactions")
+        response = authenticated_client.get("/user/transactions?include_total=true")
         
         assert response.status_code == 200
         data = response.json()
@@ -32,11 +32,11 @@ class TestUserHistory:
 
     def test_get_transaction_history_pagination(self, authenticated_client):
         """Test transaction history pagination"""
-        response = authenticated_client.get("/user/transactions?page=1&per_page=5")
+        response = authenticated_client.get("/user/transactions?per_page=5")
         
         assert response.status_code == 200
         data = response.json()
-        assert data["page"] == 1
+        assert data["next_cursor"] is None
         assert data["per_page"] == 5
 
     def test_get_game_history_empty(self, authenticated_client):
@@ -46,8 +46,8 @@ class TestUserHistory:
         assert response.status_code == 200
         data = response.json()
         assert data["sessions"] == []
-        assert data["total_count"] == 0
-        assert data["page"] == 1
+        assert data["next_cursor"] is None
+        assert data["total_count"] is None
         assert data["per_page"] == 20
 
     def test_get_user_stats_empty(self, authenticated_client):